@@ -65,7 +65,10 @@ def ssh_template_update(ip, port, user, auth_method, key_path, password, base_pa
 
         log_message(label, f"파일 다운로드 중...")
         sftp.get(remote_excel_path, local_excel_path)
-        sftp.get(remote_custom_path, local_custom_path)
+        try:
+            sftp.get(remote_custom_path, local_custom_path)
+        except FileNotFoundError:  # 카탈로그(files/catalog.db)에만 등록된 고객사는 기록 파일이 없음
+            open(local_custom_path, 'w').close()
 
         log_message(label, "엑셀 파일 로드 중...")
         wb = load_workbook(local_excel_path)
@@ -100,6 +103,10 @@ def ssh_template_update(ip, port, user, auth_method, key_path, password, base_pa
         new_remote_excel_path = f'{base_path}/{partname}_files/{new_filename}'
         log_message(label, f"파일 업로드 중...")
         sftp.put(local_excel_path, new_remote_excel_path)
+        try:  # 웹에 한 번도 로그인하지 않은 사용자는 기록 파일 디렉토리가 없을 수 있음
+            sftp.mkdir(f'{base_path}/{partname}_custom')
+        except IOError:
+            pass
         sftp.put(local_custom_path, remote_custom_path)
 
         log_message(label, "작업 완료!")
@@ -0,0 +1,440 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from urllib.parse import urlencode
+
+import aiohttp
+
+import http_session
+import metrics
+import rate_limit
+import token_cache
+from correlation import index_nics, index_public_ips, index_volumes
+from csp_factory import CSPFactory
+from flavor_cache import FlavorCatalog, parse_flavors
+from ktc_api import KTCAPI, KTCMultiZoneAPI
+from ncp_api import NCPAPI
+from nhn_api import NHNAPI
+from pagination import DEFAULT_PAGE_SIZE, next_page_marker
+
+
+class UnauthorizedError(Exception):
+    """
+    토큰이 거부(401)되었을 때 _request_json 이 발생시키는 예외. 재인증 후 한 번 다시 요청하는 데 사용합니다.
+    """
+
+
+class AsyncCSPInterface(ABC):
+    """
+    CSPInterface 의 asyncio 버전 추상 클래스.
+    하나의 이벤트 루프에서 여러 계정을 스레드 없이 동시에 수집할 수 있도록 모든 API 메서드가 코루틴입니다.
+
+    동기 클라이언트(KTCAPI, NHNAPI, NCPAPI)를 감싸서 URI, 인증 요청, 응답 변환 로직을 그대로 재사용하고,
+    HTTP 호출만 aiohttp 로 수행합니다.
+
+    Args:
+        client (CSPInterface): 설정과 변환 로직을 제공할 동기 CSP 클라이언트.
+        session (aiohttp.ClientSession, optional): 공유할 세션. 없으면 처음 요청할 때 생성하고 close() 에서 닫습니다.
+    """
+
+    def __init__(self, client, session=None):
+        self.client = client
+        self.session = session
+        self._owns_session = session is None
+        self._auth_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self):
+        """
+        aiohttp 세션을 반환하는 헬퍼 메서드. 공유 세션 설정(호스트당 커넥션 수, 타임아웃)을 따릅니다.
+
+        Returns:
+            aiohttp.ClientSession: HTTP 세션.
+        """
+        if self.session is None:
+            self.session = new_session()
+        return self.session
+
+    async def close(self):
+        """
+        이 인스턴스가 만든 세션을 닫는 메서드. 외부에서 받은 세션은 닫지 않습니다.
+        """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request_json(self, method, url, **kwargs):
+        """
+        HTTP 요청을 보내고 응답 JSON 을 반환하는 헬퍼 메서드.
+        동기 클라이언트와 같은 CSP 별 공유 토큰 버킷과 재시도 정책(http_session.retry_delay)을 따르고,
+        호출 지표도 같은 metrics.registry 에 기록합니다.
+
+        Args:
+            method (str): HTTP 메서드.
+            url (str): 요청 URL.
+            **kwargs: aiohttp 에 전달할 추가 인자.
+
+        Returns:
+            tuple: 응답 헤더와 응답 JSON.
+
+        Raises:
+            Exception: 요청 실패 시 예외를 발생시킵니다.
+        """
+        provider = self.client.PROVIDER
+        bucket = rate_limit.get_bucket(provider)
+        retries = http_session.get_option('retries')
+        started = time.perf_counter()
+
+        for attempt in range(retries + 1):
+            if bucket:
+                await asyncio.sleep(bucket.reserve())
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    if response.status in http_session.RETRY_STATUS and attempt < retries:
+                        await asyncio.sleep(http_session.retry_delay(attempt, response.headers.get('Retry-After')))
+                        continue
+                    content = await response.read()
+                    event = metrics.registry.record(provider, method, url, response.status,
+                                                    time.perf_counter() - started, len(content), attempt)
+                    if response.status == 401:
+                        raise UnauthorizedError(f"Failed to {method} {url}: 401 - {await response.text()}")
+                    if response.status > 210:
+                        raise Exception(f"Failed to {method} {url}: {response.status} - {await response.text()}")
+                    body = await response.json(content_type=None)
+                    metrics.registry.add_records(event, metrics.count_records(body))
+                    return response.headers, body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == retries:
+                    metrics.registry.record(provider, method, url, 'error', time.perf_counter() - started,
+                                            retries=attempt)
+                    raise
+                await asyncio.sleep(http_session.retry_delay(attempt))
+
+    @staticmethod
+    async def fetch_parallel(**calls):
+        """
+        서로 의존하지 않는 코루틴들을 동시에 실행하고 모두 끝날 때까지 기다리는 메서드.
+
+        Args:
+            **calls: 결과 이름을 키로 하고, 코루틴을 값으로 가지는 키워드 인자.
+
+        Returns:
+            dict: 결과 이름을 키로 하고, 각 코루틴의 반환값을 값으로 가지는 사전.
+        """
+        results = await asyncio.gather(*calls.values())
+        return dict(zip(calls.keys(), results))
+
+    @abstractmethod
+    async def get_instances(self):
+        """
+        클라우드의 모든 인스턴스 정보를 가져오는 코루틴.
+        """
+        pass
+
+    @abstractmethod
+    async def get_inventory(self):
+        """
+        클라우드 인프라의 인벤토리 정보를 가져오는 코루틴.
+        """
+        pass
+
+    @abstractmethod
+    async def get_blockstorage(self):
+        """
+        블록 스토리지 정보를 가져오는 코루틴.
+        """
+        pass
+
+
+class _AsyncOpenStackAPI(AsyncCSPInterface):
+    """
+    토큰 인증과 limit/marker 페이지네이션을 쓰는 OpenStack 기반 CSP(KTC, NHN)의 공통 비동기 구현.
+    """
+
+    async def get_token(self):
+        """
+        유효한 토큰을 반환하는 코루틴. 만료된 경우 토큰 저장소를 먼저 확인하고, 없으면 한 번만 새로 인증합니다.
+
+        Returns:
+            str: 유효한 인증 토큰.
+        """
+        async with self._auth_lock:
+            client = self.client
+            if client.token is None or time.time() >= client.token_expiry - token_cache.EXPIRY_MARGIN:
+                if client.load_cached_token():
+                    return client.token
+                URL, data = client.auth_request()
+                headers, body = await self._request_json('POST', URL, json=data)
+                client.set_token(headers, body)
+        return self.client.token
+
+    async def _reauthenticate(self, rejected_token):
+        """
+        거부된 토큰을 토큰 저장소에서 지우고 새로 인증하는 헬퍼 코루틴.
+        동시에 401 을 받은 다른 코루틴이 이미 새 토큰을 받았으면 다시 인증하지 않습니다.
+        """
+        async with self._auth_lock:
+            client = self.client
+            if client.token == rejected_token:
+                token_cache.invalidate(client.token_key)
+                URL, data = client.auth_request()
+                headers, body = await self._request_json('POST', URL, json=data)
+                client.set_token(headers, body)
+        return self.client.token
+
+    async def _get(self, url, params=None):
+        """
+        인증 토큰을 붙여 GET 요청을 보내는 헬퍼 코루틴.
+        저장된 토큰이 폐기되어 401 이 오면 동기 클라이언트(KTCAPI._send)처럼 한 번만 재인증합니다.
+        """
+        token = await self.get_token()
+        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
+        try:
+            _, body = await self._request_json('GET', url, headers=headers, params=params)
+        except UnauthorizedError:
+            headers['X-Auth-Token'] = await self._reauthenticate(token)
+            _, body = await self._request_json('GET', url, headers=headers, params=params)
+        return body
+
+    async def _get_all_pages(self, url, key, page_size=DEFAULT_PAGE_SIZE):
+        """
+        limit/marker 목록 API 의 모든 페이지를 이어서 가져오는 헬퍼 코루틴. 다음 페이지 여부는 next_page_marker 로 판단합니다.
+
+        Returns:
+            list: 모든 페이지의 항목 리스트.
+        """
+        items = []
+        marker = None
+        links_seen = False
+        while True:
+            params = {'limit': page_size}
+            if marker:
+                params['marker'] = marker
+            body = await self._get(url, params)
+            items.extend(body[key])
+            marker, links_seen = next_page_marker(body, key, links_seen)
+            if marker is None:
+                return items
+
+
+class AsyncKTCAPI(_AsyncOpenStackAPI):
+    """
+    KTCAPI 의 비동기 버전.
+    """
+
+    async def get_instances(self):
+        URL = f'{self.client.BASE_URI}/server/servers/detail'
+        return {'servers': await self._get_all_pages(URL, 'servers')}
+
+    async def get_blockstorage(self):
+        await self.get_token()  # project_id 확보
+        URL = f'{self.client.BASE_URI}/volume/{self.client.project_id}/volumes/detail'
+        return {'volumes': await self._get_all_pages(URL, 'volumes')}
+
+    async def get_publicips(self):
+        return await self._get(f'{self.client.BASE_URI}/nc/IpAddress', self.client.PUBLIC_IP_PARAMS)
+
+    async def get_inventory(self):
+        await self.get_token()
+        results = await self.fetch_parallel(instances=self.get_instances(),
+                                            volumes=self.get_blockstorage(),
+                                            networks=self.get_publicips())
+        public_ips = index_public_ips(self.client.static_nat_filter(results['networks']))
+        instance_volumes = index_volumes(self.client._volume_attachments(results['volumes']['volumes']))
+        return self.client.build_inventory(results['instances']['servers'], instance_volumes, public_ips)
+
+
+class AsyncKTCMultiZoneAPI(AsyncCSPInterface):
+    """
+    KTCMultiZoneAPI 의 비동기 버전. 모든 존을 같은 이벤트 루프에서 동시에 수집합니다.
+    """
+
+    def __init__(self, client, session=None):
+        super().__init__(client, session)
+        self.zone_clients = [AsyncKTCAPI(zone_client, session) for zone_client in client.clients.values()]
+
+    async def close(self):
+        for zone_client in self.zone_clients:
+            await zone_client.close()
+
+    async def _collect(self, method, key):
+        results = await asyncio.gather(*(getattr(zone_client, method)() for zone_client in self.zone_clients))
+        return {key: [item for result in results for item in result[key]]}
+
+    async def get_instances(self):
+        return await self._collect('get_instances', 'servers')
+
+    async def get_blockstorage(self):
+        return await self._collect('get_blockstorage', 'volumes')
+
+    async def get_inventory(self):
+        results = await asyncio.gather(*(zone_client.get_inventory() for zone_client in self.zone_clients))
+        return [inventory for zone_inventories in results for inventory in zone_inventories]
+
+
+class AsyncNHNAPI(_AsyncOpenStackAPI):
+    """
+    NHNAPI 의 비동기 버전.
+    """
+
+    async def get_instances(self):
+        URL = f'{self.client.VM_BASE_URI}/v2/{self.client.tenantid}/servers/detail'
+        return {'servers': await self._get_all_pages(URL, 'servers')}
+
+    async def get_blockstorage(self):
+        URL = f'{self.client.ST_BASE_URI}/v2/{self.client.tenantid}/volumes/detail'
+        return {'volumes': await self._get_all_pages(URL, 'volumes')}
+
+    async def get_flavors(self):
+        """
+        플레이버 카탈로그를 반환하는 코루틴. 동기 클라이언트와 같은 메모리/디스크 캐시를 사용합니다.
+        """
+        client = self.client
+        if client.flavors is not None:
+            return client.flavors
+
+        disk_cache = None
+        if client.flavor_cache_ttl:
+            disk_cache = FlavorCatalog(f'{client.VM_BASE_URI}/{client.tenantid}', client.flavor_cache_ttl)
+            client.flavors = disk_cache.load()
+            if client.flavors is not None:
+                return client.flavors
+
+        URL = f'{client.VM_BASE_URI}/v2/{client.tenantid}/flavors/detail'
+        client.flavors = parse_flavors((await self._get(URL))['flavors'])
+        if disk_cache:
+            disk_cache.save(client.flavors)
+        return client.flavors
+
+    async def get_inventory(self):
+        await self.get_token()
+        results = await self.fetch_parallel(instances=self.get_instances(),
+                                            volumes=self.get_blockstorage(),
+                                            flavors=self.get_flavors())
+        instance_volumes = index_volumes(self.client._volume_attachments(results['volumes']['volumes']))
+        return self.client.build_inventory(results['instances']['servers'], instance_volumes, results['flavors'])
+
+
+class AsyncNCPAPI(AsyncCSPInterface):
+    """
+    NCPAPI 의 비동기 버전.
+    """
+
+    async def _get(self, uri, params=None):
+        """
+        서명된 GET 요청을 보내는 헬퍼 코루틴.
+        """
+        query = urlencode({'responseFormatType': 'json', **(params or {})})
+        headers = self.client.generate_hmac(uri, query)
+        _, body = await self._request_json('GET', f'{self.client.BASE_URI}/vserver/v2/{uri}?{query}',
+                                           headers=headers)
+        return body
+
+    async def _get_all(self, uri, list_key, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        pageNo/pageSize 목록 API 의 모든 페이지를 이어서 가져오는 헬퍼 코루틴.
+        필터 파라미터 기본값은 동기 클라이언트의 list_params(uri) 입니다.
+
+        Returns:
+            list: 모든 페이지의 항목 리스트.
+        """
+        params = self.client.list_params(uri) if params is None else params
+        items = []
+        page_no = 1
+        while True:
+            query = {**params, 'pageNo': page_no, 'pageSize': page_size}
+            response = (await self._get(uri, query))[f'{uri}Response']
+            page = response.get(list_key, [])
+            items.extend(page)
+            total = response.get('totalRows')  # totalRows 가 없는 응답은 짧은 페이지로만 끝을 판단
+            if len(page) < page_size or (total is not None and len(items) >= int(total)):
+                return items
+            page_no += 1
+
+    async def get_instances(self):
+        items = await self._get_all('getServerInstanceList', 'serverInstanceList')
+        return {'getServerInstanceListResponse': {'serverInstanceList': items, 'totalRows': len(items)}}
+
+    async def get_blockstorage(self):
+        pages = await asyncio.gather(*(self._get_all('getBlockStorageInstanceList', 'blockStorageInstanceList',
+                                                     params=params) for params in self.client.volume_filters()))
+        items = [item for page in pages for item in page]
+        return {'getBlockStorageInstanceListResponse': {'blockStorageInstanceList': items, 'totalRows': len(items)}}
+
+    async def get_network(self):
+        return self.client._network_filter(await self._get_all('getNetworkInterfaceList', 'networkInterfaceList'))
+
+    async def get_inventory(self):
+        results = await self.fetch_parallel(instances=self.get_instances(),
+                                            networks=self.get_network(),
+                                            volumes=self.get_blockstorage())
+        instances = results['instances']['getServerInstanceListResponse']['serverInstanceList']
+        volumes = results['volumes']['getBlockStorageInstanceListResponse']['blockStorageInstanceList']
+        instance_volumes = index_volumes(self.client._volume_attachments(volumes))
+        return self.client.build_inventory(instances, instance_volumes, index_nics(results['networks']))
+
+
+ASYNC_CLIENTS = {
+    KTCAPI: AsyncKTCAPI,
+    KTCMultiZoneAPI: AsyncKTCMultiZoneAPI,
+    NHNAPI: AsyncNHNAPI,
+    NCPAPI: AsyncNCPAPI,
+}
+
+
+def new_session():
+    """
+    공유 세션 설정(호스트당 커넥션 수, 타임아웃)을 따르는 aiohttp 세션을 생성하는 함수.
+    이벤트 루프 안에서 호출해야 합니다.
+
+    Returns:
+        aiohttp.ClientSession: 새 세션.
+    """
+    connect_timeout, read_timeout = http_session.get_option('timeout')
+    connector = aiohttp.TCPConnector(limit_per_host=http_session.get_option('pool_maxsize'),
+                                     force_close=not http_session.get_option('keep_alive'))
+    timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def get_async_csp(csp_type, session=None, **kwargs):
+    """
+    CSPFactory.get_csp 와 같은 인자로 비동기 CSP 클라이언트를 생성하는 함수.
+
+    Args:
+        csp_type (str): CSP 유형 (예: "KTC", "NHN", "NCP", "KTCG", "NHNG", "NCPG").
+        session (aiohttp.ClientSession, optional): 여러 클라이언트가 공유할 세션.
+        **kwargs: CSPFactory.get_csp 에 전달할 인자들.
+
+    Returns:
+        AsyncCSPInterface: 비동기 CSP 클라이언트.
+    """
+    client = CSPFactory.get_csp(csp_type, **kwargs)
+    return ASYNC_CLIENTS[type(client)](client, session)
+
+
+async def collect_inventories(clients, limit=10):
+    """
+    여러 비동기 클라이언트의 인벤토리를 하나의 이벤트 루프에서 동시에 수집하는 코루틴.
+    한 계정의 실패는 다른 계정 수집에 영향을 주지 않습니다.
+
+    Args:
+        clients (dict): 계정 이름을 키로 하고, AsyncCSPInterface 를 값으로 가지는 사전.
+        limit (int, optional): 동시에 수집할 최대 계정 수. 기본값은 10.
+
+    Returns:
+        dict: 계정 이름을 키로 하고, 인벤토리 리스트 또는 발생한 예외를 값으로 가지는 사전.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def collect(client):
+        async with semaphore:
+            return await client.get_inventory()
+
+    results = await asyncio.gather(*(collect(client) for client in clients.values()), return_exceptions=True)
+    return dict(zip(clients.keys(), results))
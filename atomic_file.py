@@ -0,0 +1,49 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_path(path, private=False):
+    """
+    대상 파일과 같은 디렉토리에 고유한 임시 파일을 만들어 경로를 넘겨주고, 블록이 끝나면 대상 파일로 교체하는 컨텍스트 매니저.
+    임시 파일 이름이 호출마다 다르므로 같은 프로세스의 여러 스레드가 같은 파일을 동시에 저장해도
+    서로의 임시 파일을 덮어쓰지 않고, 읽는 쪽은 항상 완성된 파일만 봅니다. 예외가 나면 임시 파일을 지웁니다.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        private (bool, optional): True 면 소유자만 읽을 수 있는 권한(0o600)을 유지합니다 (예: 토큰). 기본값은 False (0o644).
+
+    Yields:
+        str: 내용을 기록할 임시 파일 경로.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f'.{os.path.basename(path)}.',
+                                    suffix='.tmp')
+    os.close(fd)
+    try:
+        yield tmp_path
+        if not private:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def atomic_write(path, private=False, encoding='utf-8'):
+    """
+    atomic_path 로 만든 임시 파일을 텍스트 모드로 열어 주는 컨텍스트 매니저.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        private (bool, optional): True 면 소유자만 읽을 수 있는 권한(0o600)을 유지합니다. 기본값은 False.
+        encoding (str, optional): 인코딩. 기본값은 'utf-8'.
+
+    Yields:
+        file: 쓰기용 파일 객체.
+    """
+    with atomic_path(path, private) as tmp_path:
+        with open(tmp_path, 'w', encoding=encoding) as f:
+            yield f
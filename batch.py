@@ -0,0 +1,307 @@
+import argparse
+import multiprocessing
+import os
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from datetime import datetime
+
+import yaml
+from yaml.loader import SafeLoader
+
+import metrics
+from csp_factory import CSPFactory
+from data_to_excel import data_to_excel, stream_to_excel, write_to_file
+from ktc_api import KTCAPI
+from nhn_api import NHNAPI
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PROVIDER_LIMIT = 2
+# CSP 별로 작업의 filters 에 쓸 수 있는 서버 측 필터 (CSPFactory.get_csp 인자)
+FILTER_KEYS = {'KTC': set(), 'NHN': set(), 'NCP': {'zone_code', 'server_nos'}}
+INCREMENTAL_PROVIDERS = {'KTC', 'NHN'}  # 서버 스냅샷(changes-since)으로 증분 수집할 수 있는 CSP
+
+
+def load_manifest(path):
+    """
+    배치 작업 매니페스트(YAML/JSON)를 읽는 함수.
+
+    매니페스트 형식::
+
+        user: admin                # 결과를 저장할 사용자 (files/{user}_files, 카탈로그 files/catalog.db)
+        max_workers: 4             # 선택, 전체 동시 작업 수
+        workbook_workers: 4        # 선택, 엑셀 파일을 만드는 프로세스 수 (기본값은 CPU 코어 수)
+        provider_limits:           # 선택, CSP 별 동시 작업 수
+          NHN: 1
+        jobs:
+          - customer: 고객사A
+            csp_type: KTC
+            credentials: {username: a@b.com, password: secret}
+            zones: [d1, d2, d3]    # 선택, KTC: d1/d2/d3/gd1, NHN: kr1/kr2/jp1 (공공 kr1/kr2), NCP: 리전 코드
+          - customer: 고객사B
+            csp_type: NCP
+            credentials: {access_key: AK, secret_key: SK}
+            filters: {zone_code: KR-1}   # 선택, 서버 측 필터 (NCP: zone_code, server_nos)
+            stream: true                 # 선택, 페이지가 도착하는 대로 엑셀 행을 기록 (메모리 일정)
+          - customer: 고객사C
+            csp_type: NHN
+            credentials: {username: a@b.com, password: secret, tenantid: T}
+            incremental: true            # 선택, 변경된 서버만 받아 스냅샷에 병합 (KTC, NHN, stream 과 함께 사용 불가)
+
+    Args:
+        path (str): 매니페스트 파일 경로.
+
+    Returns:
+        dict: 매니페스트 사전.
+
+    Raises:
+        ValueError: 필수 항목이 없거나 filters 에 해당 CSP 가 지원하지 않는 필터, zones 에 지원하지 않는 존이 있거나
+            증분 수집을 지원하지 않는 작업에 incremental 이 있을 때 발생.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = yaml.load(f, Loader=SafeLoader)
+    if not manifest or 'user' not in manifest or not manifest.get('jobs'):
+        raise ValueError(f"매니페스트에 user 와 jobs 가 필요합니다: {path}")
+    for job in manifest['jobs']:
+        missing = {'customer', 'csp_type', 'credentials'} - set(job)
+        if missing:
+            raise ValueError(f"작업에 필수 항목이 없습니다 ({', '.join(sorted(missing))}): {job.get('customer')}")
+        filters = job.get('filters', {})
+        if not isinstance(filters, dict):
+            raise ValueError(f"filters 는 사전이어야 합니다: {job['customer']}")
+        allowed = FILTER_KEYS.get(provider_of(job['csp_type']), set())
+        unknown = set(filters) - allowed
+        if unknown:
+            raise ValueError(f"{job['csp_type']} 에서 지원하지 않는 필터입니다 ({', '.join(sorted(unknown))}), "
+                             f"사용 가능: {', '.join(sorted(allowed)) or '없음'}: {job['customer']}")
+        zones = job.get('zones', [])
+        if not isinstance(zones, list):
+            raise ValueError(f"zones 는 목록이어야 합니다: {job['customer']}")
+        allowed = allowed_zones(job)
+        unknown = set(zones) - allowed if allowed is not None else set()
+        if unknown:
+            raise ValueError(f"{job['csp_type']} 에서 지원하지 않는 존입니다 ({', '.join(sorted(unknown))}), "
+                             f"사용 가능: {', '.join(sorted(allowed))}: {job['customer']}")
+        if job.get('incremental'):
+            if provider_of(job['csp_type']) not in INCREMENTAL_PROVIDERS:
+                raise ValueError(f"{job['csp_type']} 은 증분 수집(incremental)을 지원하지 않습니다: {job['customer']}")
+            if job.get('stream'):
+                raise ValueError(f"incremental 과 stream 은 함께 사용할 수 없습니다: {job['customer']}")
+    return manifest
+
+
+def provider_of(csp_type):
+    """
+    CSP 유형에서 공공/민간 구분을 뺀 CSP 이름을 반환하는 함수 (예: 'KTCG' -> 'KTC').
+    """
+    return csp_type[:3]
+
+
+def allowed_zones(job):
+    """
+    작업의 zones 에 쓸 수 있는 존을 반환하는 함수. NCP 처럼 존(리전 코드) 목록을 정해 두지 않은 CSP 는 None 을 반환합니다.
+
+    Args:
+        job (dict): 매니페스트의 작업 항목.
+
+    Returns:
+        set | None: 사용 가능한 존 집합.
+    """
+    provider = provider_of(job['csp_type'])
+    if provider == 'KTC':
+        return set(KTCAPI.BASE_URIS)
+    if provider == 'NHN':
+        gov = job['csp_type'] == 'NHNG' or job['credentials'].get('gov')
+        return set(NHNAPI.GOV_ZONES if gov else NHNAPI.ZONES)
+    return None
+
+
+def job_clients(job):
+    """
+    하나의 작업을 수집할 CSP 클라이언트들을 만드는 함수.
+    KTC 는 여러 존을 멀티존 클라이언트 하나로, 그 외 CSP 는 존별 클라이언트로 만듭니다.
+
+    Args:
+        job (dict): 매니페스트의 작업 항목.
+
+    Returns:
+        list: CSP 클라이언트 리스트.
+    """
+    csp_type = job['csp_type']
+    credentials, filters = job['credentials'], job.get('filters', {})
+    zones = job.get('zones')
+    if not zones:
+        return [CSPFactory.get_csp(csp_type, **credentials, **filters)]
+    if provider_of(csp_type) == 'KTC':
+        return [CSPFactory.get_csp(csp_type, zone=list(zones), **credentials, **filters)]
+    return [CSPFactory.get_csp(csp_type, zone=zone, **credentials, **filters) for zone in zones]
+
+
+def collect_job(job):
+    """
+    하나의 작업에 대해 인벤토리를 수집하는 함수. 존별 결과는 이어 붙입니다.
+    incremental 작업은 계정/존별 스냅샷에 변경된 서버만 병합하는 get_inventory_incremental 로 수집합니다.
+
+    Args:
+        job (dict): 매니페스트의 작업 항목.
+
+    Returns:
+        list: InventoryRecord 리스트.
+    """
+    inventories = []
+    for client in job_clients(job):
+        inventories.extend(client.get_inventory_incremental() if job.get('incremental') else client.get_inventory())
+    return inventories
+
+
+def run_job(job, user, provider_slots):
+    """
+    작업 하나를 수집하는 함수. stream 작업은 엑셀 파일 저장까지 수행합니다.
+    실패는 결과로 반환하며 다른 작업에 영향을 주지 않습니다.
+
+    Args:
+        job (dict): 매니페스트의 작업 항목.
+        user (str): 결과를 저장할 사용자.
+        provider_slots (dict): CSP 이름을 키로 하고, 동시 작업 수를 제한하는 세마포어를 값으로 가지는 사전.
+
+    Returns:
+        tuple: (결과 사전, InventoryRecord 리스트 (stream 작업이나 실패 시 None), 날짜(YYYYMMDD), 시간(HHMM)).
+    """
+    customer, csp_type = job['customer'], job['csp_type']
+    result = {'customer': customer, 'csp_type': csp_type, 'status': 'failed', 'count': 0, 'file': None,
+              'error': None, 'metrics': []}
+    now = datetime.now()
+    cday, ctime = now.strftime("%Y%m%d"), now.strftime("%H%M")
+    inventories = None
+    try:
+        with provider_slots[provider_of(csp_type)], metrics.track_run() as events:
+            try:
+                if job.get('stream'):
+                    result['count'] = stream_to_excel(job_clients(job), csp_type=csp_type, path=user, cday=cday,
+                                                      customer=customer)
+                else:
+                    inventories = collect_job(job)
+                    result['count'] = len(inventories)
+            finally:
+                result['metrics'] = metrics.summarize(events)
+    except Exception as e:
+        _fail(result, e)
+    return result, inventories, cday, ctime
+
+
+def _fail(result, error):
+    """
+    결과 사전에 오류와 트레이스백을 기록하는 헬퍼 함수. except 블록 안에서 호출합니다.
+    """
+    result['error'] = f'{type(error).__name__}: {error}'
+    result['traceback'] = traceback.format_exc()
+
+
+def finish_job(result, user, cday, ctime):
+    """
+    엑셀 파일 저장이 끝난 작업을 카탈로그에 기록하고 결과를 완료로 바꾸는 함수.
+
+    Args:
+        result (dict): run_job 이 반환한 결과 사전.
+        user (str): 결과를 저장할 사용자.
+        cday (str): 수집 날짜 (YYYYMMDD 형식).
+        ctime (str): 수집 시간 (HHMM 형식).
+    """
+    customer, csp_type = result['customer'], result['csp_type']
+    try:
+        write_to_file(type='API', csp_type=csp_type, customer=customer, path=user, cday=cday, ctime=ctime,
+                      count=result['count'])
+        result.update(status='done', file=f'{customer}-{csp_type}-inventory-{cday}.xlsx')
+    except Exception as e:
+        _fail(result, e)
+
+
+def run_batch(manifest, max_workers=None, provider_limits=None, on_result=None, workbook_workers=None):
+    """
+    매니페스트의 모든 작업을 실행하는 함수.
+
+    수집은 스레드 풀에서, 엑셀 파일 생성은 프로세스 풀에서 수행합니다. 수집 스레드는 수집이 끝나면 바로 다음 작업을
+    받고, 워크북은 수집이 끝난 순서대로 프로세스 풀에 넘겨 여러 고객사의 워크북을 모든 코어로 만듭니다.
+    카탈로그 기록(write_to_file)과 on_result 호출은 저장이 끝난 작업부터 이 함수(부모 프로세스)에서 수행합니다.
+
+    Args:
+        manifest (dict): load_manifest 가 반환한 매니페스트.
+        max_workers (int, optional): 전체 동시 수집 작업 수. 기본값은 매니페스트 값 또는 4.
+        provider_limits (dict, optional): CSP 별 동시 작업 수. 기본값은 매니페스트 값, 없으면 CSP 당 2.
+        on_result (callable, optional): 작업 결과 사전을 받는 콜백.
+        workbook_workers (int, optional): 엑셀 파일을 만드는 프로세스 수. 기본값은 매니페스트 값 또는 CPU 코어 수.
+            모든 작업이 stream 이면 프로세스 풀을 만들지 않습니다.
+
+    Returns:
+        list: 작업 순서대로 정렬된 결과 사전 리스트.
+    """
+    jobs, user = manifest['jobs'], manifest['user']
+    max_workers = max_workers or manifest.get('max_workers', DEFAULT_MAX_WORKERS)
+    workbook_workers = workbook_workers or manifest.get('workbook_workers')
+    limits = {**manifest.get('provider_limits', {}), **(provider_limits or {})}
+    provider_slots = {provider: threading.BoundedSemaphore(limits.get(provider, DEFAULT_PROVIDER_LIMIT))
+                      for provider in {provider_of(job['csp_type']) for job in jobs}}
+
+    os.makedirs(f"files/{user}_files", exist_ok=True)
+
+    results = [None] * len(jobs)
+    with ExitStack() as stack:
+        workbooks = None
+        if not all(job.get('stream') for job in jobs):
+            # 수집 스레드가 잡고 있을 수 있는 잠금(템플릿 캐시, 로깅, 토큰 저장소)을 fork 로 물려받으면 자식이 멈추므로 spawn 사용
+            workbooks = stack.enter_context(ProcessPoolExecutor(max_workers=workbook_workers,
+                                                                mp_context=multiprocessing.get_context('spawn')))
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+
+        # 수집 future 는 (작업 순번, None), 워크북 future 는 (작업 순번, (결과 사전, 날짜, 시간)) 으로 구분
+        pending = {executor.submit(run_job, job, user, provider_slots): (i, None) for i, job in enumerate(jobs)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, saving = pending.pop(future)
+                if saving is None:
+                    result, inventories, cday, ctime = future.result()
+                    if inventories is not None:
+                        saving = (result, cday, ctime)
+                        pending[workbooks.submit(data_to_excel, inventories, result['csp_type'], user, cday,
+                                                 result['customer'])] = (i, saving)
+                        continue
+                else:
+                    result, cday, ctime = saving
+                    try:
+                        future.result()
+                    except Exception as e:
+                        _fail(result, e)
+                if result['error'] is None:
+                    finish_job(result, user, cday, ctime)
+                results[i] = result
+                if on_result:
+                    on_result(result)
+    return results
+
+
+def print_result(result):
+    if result['status'] == 'done':
+        print(f"[완료] {result['customer']} ({result['csp_type']}): {result['count']}대 -> {result['file']}")
+    else:
+        print(f"[실패] {result['customer']} ({result['csp_type']}): {result['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='여러 고객사 인벤토리 일괄 수집')
+    parser.add_argument('manifest', help='작업 매니페스트 파일 (YAML/JSON)')
+    parser.add_argument('--max-workers', type=int, help='전체 동시 수집 작업 수')
+    parser.add_argument('--workbook-workers', type=int, help='엑셀 파일을 만드는 프로세스 수')
+    args = parser.parse_args(argv)
+
+    results = run_batch(load_manifest(args.manifest), max_workers=args.max_workers, on_result=print_result,
+                        workbook_workers=args.workbook_workers)
+    metrics.registry.export()
+    failed = [result for result in results if result['status'] != 'done']
+    print(f'전체 {len(results)}건, 성공 {len(results) - len(failed)}건, 실패 {len(failed)}건')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
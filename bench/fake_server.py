@@ -0,0 +1,183 @@
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from bench.synthetic import PROJECT_ID, TENANT_ID, TENANTS, _expires
+
+OSAPI_MAX_LIMIT = 1000  # Nova/Cinder osapi_max_limit 기본값
+
+
+class FakeCSPServer:
+    """
+    KTC/NHN/NCP API 응답을 합성 테넌트로 재현하는 로컬 HTTP 서버.
+
+    경로 접두사로 CSP 를 구분합니다 (/ktc, /nhn/auth, /nhn/vm, /nhn/st, /ncp).
+    limit/marker, pageNo/pageSize 페이지네이션을 실제 API 처럼 처리하고, 경로별 호출 수와 응답 바이트를 집계합니다.
+    limit/marker 목록은 Nova/Cinder 처럼 limit 을 max_limit 으로 줄이고, 꽉 찬 페이지에만 '{key}_links' next 링크를 붙입니다.
+
+    Args:
+        csp_type (str): 'KTC', 'NHN', 'NCP' 중 하나.
+        count (int): 합성 테넌트의 VM 수.
+        seed (int, optional): 난수 시드.
+        max_limit (int, optional): limit/marker 목록의 최대 페이지 크기. 기본값은 1000.
+    """
+
+    def __init__(self, csp_type, count, seed=0, max_limit=OSAPI_MAX_LIMIT):
+        self.csp_type = csp_type
+        self.max_limit = max_limit
+        self.tenant = TENANTS[csp_type](count, seed)
+        self.calls = Counter()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_stats(self):
+        with self.lock:
+            self.calls.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        지금까지의 호출 통계를 반환하는 메서드.
+
+        Returns:
+            dict: {'calls': 총 호출 수, 'bytes': 총 응답 바이트, 'endpoints': 경로별 호출 수}.
+        """
+        with self.lock:
+            return {'calls': sum(self.calls.values()), 'bytes': self.bytes, 'endpoints': dict(self.calls)}
+
+    def configure_client(self, client):
+        """
+        CSP 클라이언트의 엔드포인트를 이 서버로 바꾸는 메서드.
+
+        Args:
+            client (CSPInterface): KTCAPI, NHNAPI 또는 NCPAPI 인스턴스.
+        """
+        if self.csp_type == 'KTC':
+            client.BASE_URI = f'{self.url}/ktc'
+        elif self.csp_type == 'NHN':
+            client.BASE_AUTH_URI = f'{self.url}/nhn/auth'
+            client.VM_BASE_URI = f'{self.url}/nhn/vm'
+            client.ST_BASE_URI = f'{self.url}/nhn/st'
+        else:
+            client.BASE_URI = f'{self.url}/ncp'
+
+    def _openstack_page(self, path, key, items, query):
+        limit = min(int(query.get('limit', [self.max_limit])[0]), self.max_limit)
+        start = 0
+        if 'marker' in query:
+            marker = query['marker'][0]
+            start = next(i for i, item in enumerate(items) if item['id'] == marker) + 1
+        page = items[start:start + limit]
+        body = {key: page}
+        if len(page) == limit:
+            body[f'{key}_links'] = [{'rel': 'next', 'href': f"{self.url}{path}?limit={limit}&marker={page[-1]['id']}"}]
+        return body
+
+    @staticmethod
+    def _ncp_filter(items, query):
+        """
+        NCP 목록 API 의 zoneCode, serverInstanceNo, serverInstanceNoList.N 필터를 적용하는 헬퍼 메서드.
+        """
+        server_nos = {values[0] for key, values in query.items() if key.startswith('serverInstanceNoList.')}
+        server_nos.update(query.get('serverInstanceNo', []))
+        if server_nos:
+            items = [item for item in items if item.get('serverInstanceNo') in server_nos]
+        if 'zoneCode' in query:
+            items = [item for item in items if item.get('zoneCode', query['zoneCode'][0]) == query['zoneCode'][0]]
+        return items
+
+    @staticmethod
+    def _ncp_page(uri, list_key, items, query):
+        items = FakeCSPServer._ncp_filter(items, query)
+        page_size = int(query.get('pageSize', [len(items) or 1])[0])
+        page_no = int(query.get('pageNo', ['1'])[0])
+        start = (page_no - 1) * page_size
+        return {f'{uri}Response': {'totalRows': len(items), list_key: items[start:start + page_size]}}
+
+    def route(self, method, path, query):
+        """
+        요청 경로에 맞는 응답을 만드는 메서드.
+
+        Returns:
+            tuple: (상태 코드, 추가 헤더 사전, 응답 본문 사전).
+        """
+        tenant = self.tenant
+        if method == 'POST' and path == '/ktc/identity/auth/tokens':
+            return 201, {'X-Subject-Token': 'bench-token'}, {
+                'token': {'project': {'id': PROJECT_ID}, 'expires_at': _expires()}}
+        if method == 'POST' and path == '/nhn/auth/v2.0/tokens':
+            return 200, {}, {'access': {'token': {'id': 'bench-token', 'expires': _expires()}}}
+        if path == '/ktc/server/servers/detail':
+            return 200, {}, self._openstack_page(path, 'servers', tenant['servers'], query)
+        if path == f'/ktc/volume/{PROJECT_ID}/volumes/detail':
+            return 200, {}, self._openstack_page(path, 'volumes', tenant['volumes'], query)
+        if path == '/ktc/nc/IpAddress':
+            publicips = [ip for ip in tenant['publicips'] if ip['type'] in query.get('type', [ip['type']])]
+            return 200, {}, {'nc_listentpublicipsresponse': {'publicips': publicips}}
+        if path == f'/nhn/vm/v2/{TENANT_ID}/servers/detail':
+            return 200, {}, self._openstack_page(path, 'servers', tenant['servers'], query)
+        if path == f'/nhn/vm/v2/{TENANT_ID}/flavors/detail':
+            return 200, {}, {'flavors': tenant['flavors']}
+        if path == f'/nhn/st/v2/{TENANT_ID}/volumes/detail':
+            return 200, {}, self._openstack_page(path, 'volumes', tenant['volumes'], query)
+        if path == '/ncp/vserver/v2/getServerInstanceList':
+            return 200, {}, self._ncp_page('getServerInstanceList', 'serverInstanceList', tenant['servers'], query)
+        if path == '/ncp/vserver/v2/getNetworkInterfaceList':
+            return 200, {}, self._ncp_page('getNetworkInterfaceList', 'networkInterfaceList',
+                                           tenant['networks'], query)
+        if path == '/ncp/vserver/v2/getBlockStorageInstanceList':
+            return 200, {}, self._ncp_page('getBlockStorageInstanceList', 'blockStorageInstanceList',
+                                           tenant['volumes'], query)
+        return 404, {}, {'error': {'message': f'unknown path {path}'}}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _respond(self, method):
+                length = int(self.headers.get('Content-Length', 0))
+                if length:
+                    self.rfile.read(length)
+                url = urlsplit(self.path)
+                status, headers, body = server.route(method, url.path, parse_qs(url.query))
+                payload = json.dumps(body).encode('utf-8')
+                with server.lock:
+                    server.calls[f'{method} {url.path}'] += 1
+                    server.bytes += len(payload)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._respond('GET')
+
+            def do_POST(self):
+                self._respond('POST')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
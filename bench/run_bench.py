@@ -0,0 +1,168 @@
+"""
+실제 클라우드 계정 없이 수집기 성능을 측정하는 벤치마크.
+
+합성 테넌트(100/1k/10k VM)를 재현하는 로컬 서버를 띄우고, CSP 별로
+get_inventory, get_inventory_async(aiohttp), block_filter, data_to_excel, stream_to_excel(수집부터 저장까지 스트리밍)의 소요 시간, API 호출 수, 응답 바이트, 최대 메모리를 측정합니다.
+get_inventory_async 는 비동기 클라이언트가 실제로 aiohttp 로 요청을 보내 동기 클라이언트와 같은 인벤토리를 돌려주는지도 확인합니다.
+최대 메모리는 tracemalloc 기준이며 같은 프로세스에서 도는 재현 서버의 응답 직렬화도 포함됩니다.
+
+사용법 (저장소 루트에서):
+    python -m bench.run_bench
+    python -m bench.run_bench --csp NHN --sizes 100 1000 --json bench_output.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import rate_limit
+import token_cache
+from async_csp import ASYNC_CLIENTS
+from bench.fake_server import FakeCSPServer
+from bench.synthetic import SIZES, TENANT_ID
+from data_to_excel import data_to_excel, stream_to_excel
+from ktc_api import KTCAPI
+from ncp_api import NCPAPI
+from nhn_api import NHNAPI
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'files', 'template.xlsx')
+
+
+def make_client(csp_type):
+    """
+    벤치마크용 CSP 클라이언트를 생성하는 함수.
+    """
+    if csp_type == 'KTC':
+        return KTCAPI('bench', 'bench', 'd1')
+    if csp_type == 'NHN':
+        return NHNAPI('bench', 'bench', TENANT_ID, 'kr1')
+    return NCPAPI('bench', 'bench', 'KR')
+
+
+def measure(func, *args, **kwargs):
+    """
+    함수 실행 시간과 최대 메모리를 측정하는 함수.
+
+    Returns:
+        tuple: (반환값, 소요 시간(초), 최대 메모리(바이트)).
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+async def collect_async(client):
+    """
+    동기 클라이언트를 감싼 비동기 클라이언트로 인벤토리를 수집하는 코루틴.
+    """
+    async with ASYNC_CLIENTS[type(client)](client) as async_client:
+        return await async_client.get_inventory()
+
+
+def run_case(csp_type, count, workdir):
+    """
+    하나의 CSP/테넌트 크기 조합을 측정하는 함수.
+
+    Returns:
+        list: 단계별 측정 결과 사전 리스트.
+    """
+    results = []
+    with FakeCSPServer(csp_type, count) as server:
+        client = make_client(csp_type)
+        server.configure_client(client)
+
+        inventories, elapsed, peak = measure(client.get_inventory)
+        stats = server.stats()
+        results.append({'csp': csp_type, 'vms': count, 'stage': 'get_inventory', 'seconds': elapsed,
+                        'calls': stats['calls'], 'bytes': stats['bytes'], 'peak_bytes': peak,
+                        'endpoints': stats['endpoints']})
+
+        server.reset_stats()
+        async_client = make_client(csp_type)
+        server.configure_client(async_client)
+        async_inventories, elapsed, peak = measure(asyncio.run, collect_async(async_client))
+        if async_inventories != inventories:
+            raise Exception(f"{csp_type} 비동기 인벤토리가 동기 인벤토리와 다릅니다")
+        stats = server.stats()
+        results.append({'csp': csp_type, 'vms': count, 'stage': 'get_inventory_async', 'seconds': elapsed,
+                        'calls': stats['calls'], 'bytes': stats['bytes'], 'peak_bytes': peak,
+                        'endpoints': stats['endpoints']})
+
+        _, elapsed, peak = measure(client.block_filter, server.tenant['servers'], server.tenant['volumes'])
+        results.append({'csp': csp_type, 'vms': count, 'stage': 'block_filter', 'seconds': elapsed,
+                        'calls': 0, 'bytes': 0, 'peak_bytes': peak})
+
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            calls = server.stats()['calls']
+            _, elapsed, peak = measure(stream_to_excel, client, csp_type=csp_type, path='bench',
+                                       cday=f'{count}-stream', customer='bench')
+            size = os.path.getsize(f'files/bench_files/bench-{csp_type}-inventory-{count}-stream.xlsx')
+        finally:
+            os.chdir(cwd)
+        results.append({'csp': csp_type, 'vms': count, 'stage': 'stream_to_excel', 'seconds': elapsed,
+                        'calls': server.stats()['calls'] - calls, 'bytes': size, 'peak_bytes': peak})
+
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        _, elapsed, peak = measure(data_to_excel, inventories, csp_type=csp_type, path='bench',
+                                   cday=f'{count}', customer='bench')
+        size = os.path.getsize(f'files/bench_files/bench-{csp_type}-inventory-{count}.xlsx')
+    finally:
+        os.chdir(cwd)
+    results.append({'csp': csp_type, 'vms': count, 'stage': 'data_to_excel', 'seconds': elapsed,
+                    'calls': 0, 'bytes': size, 'peak_bytes': peak})
+    return results
+
+
+def print_report(results):
+    print(f"{'CSP':<5}{'VMs':>7}  {'stage':<20}{'seconds':>10}{'calls':>8}{'bytes':>14}{'peak MB':>10}")
+    for row in results:
+        print(f"{row['csp']:<5}{row['vms']:>7}  {row['stage']:<20}{row['seconds']:>10.3f}{row['calls']:>8}"
+              f"{row['bytes']:>14,}{row['peak_bytes'] / 1024 / 1024:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='CSP 수집기 벤치마크')
+    parser.add_argument('--csp', nargs='+', default=['KTC', 'NHN', 'NCP'], choices=['KTC', 'NHN', 'NCP'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='cci-bench-')
+    os.makedirs(os.path.join(workdir, 'files', 'bench_files'))
+    shutil.copy(TEMPLATE_PATH, os.path.join(workdir, 'files', 'template.xlsx'))
+    token_cache.TOKEN_DIR = os.path.join(workdir, 'tokens')
+    for provider in ('KTC', 'NHN', 'NCP'):
+        rate_limit.configure(provider, None)
+
+    results = []
+    try:
+        for csp_type in args.csp:
+            for count in args.sizes:
+                results.extend(run_case(csp_type, count, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+SIZES = (100, 1000, 10000)
+PROJECT_ID = 'bench-project'
+TENANT_ID = 'bench-tenant'
+NHN_FLAVORS = [('m2.c2m4', 2, 4096), ('m2.c4m8', 4, 8192), ('c2.c8m16', 8, 16384), ('r2.c16m64', 16, 65536)]
+
+
+def _expires():
+    return (datetime.now(timezone.utc) + timedelta(hours=1)).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+
+
+def _private_ip(i):
+    return f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256 + 1}'
+
+
+def _public_ip(i):
+    return f'203.0.{i // 256 % 256}.{i % 256}'
+
+
+def _volumes_per_server(rng):
+    """서버당 부트 볼륨 1개와 0~2개의 추가 볼륨."""
+    return 1 + rng.choice((0, 0, 1, 2))
+
+
+def ktc_tenant(count, seed=0):
+    """
+    KTC 응답 형식의 합성 테넌트를 생성하는 함수. 절반의 서버에 STATICNAT 공인 IP 를 붙입니다.
+
+    Args:
+        count (int): VM 수.
+        seed (int, optional): 난수 시드.
+
+    Returns:
+        dict: 'servers', 'volumes', 'publicips' 리스트를 가진 사전.
+    """
+    rng = random.Random(seed)
+    servers, volumes, publicips = [], [], []
+    for i in range(count):
+        server_id = f'ktc-server-{i:06d}'
+        servers.append({
+            'id': server_id,
+            'name': f'ktc-vm-{i}',
+            'addresses': {'DMZ': [{'addr': _private_ip(i), 'version': 4}]},
+            'OS-EXT-AZ:availability_zone': 'DX-M1',
+            'OS-EXT-STS:vm_state': 'active' if i % 10 else 'stopped',
+            'flavor': {'vcpus': rng.choice((2, 4, 8)), 'ram': rng.choice((4096, 8192, 16384))},
+            'created': '2024-03-01T09:00:00Z',
+        })
+        for v in range(_volumes_per_server(rng)):
+            volumes.append({
+                'id': f'ktc-volume-{i:06d}-{v}',
+                'volume_type': rng.choice(('HDD', 'SSD', 'Premium SSD')),
+                'size': 50 if v == 0 else rng.choice((100, 200, 500)),
+                'bootable': 'true' if v == 0 else 'false',
+                'attachments': [{'server_id': server_id, 'device': f'/dev/vd{chr(97 + v)}'}],
+            })
+        if i % 2 == 0:
+            publicips.append({'type': 'STATICNAT',
+                              'virtualips': [{'ipaddress': _public_ip(i), 'vmguestip': _private_ip(i)}]})
+        elif i % 7 == 0:
+            publicips.append({'type': 'PORTFORWARDING',
+                              'virtualips': [{'ipaddress': _public_ip(i), 'vmguestip': _private_ip(i)}]})
+    return {'servers': servers, 'volumes': volumes, 'publicips': publicips}
+
+
+def nhn_tenant(count, seed=0):
+    """
+    NHN 응답 형식의 합성 테넌트를 생성하는 함수. 절반의 서버에 floating IP 를 붙입니다.
+
+    Args:
+        count (int): VM 수.
+        seed (int, optional): 난수 시드.
+
+    Returns:
+        dict: 'servers', 'volumes', 'flavors' 리스트를 가진 사전.
+    """
+    rng = random.Random(seed)
+    flavors = [{'id': f'flavor-{n}', 'name': name, 'vcpus': vcpus, 'ram': ram}
+               for n, (name, vcpus, ram) in enumerate(NHN_FLAVORS)]
+    servers, volumes = [], []
+    for i in range(count):
+        server_id = f'nhn-server-{i:06d}'
+        addresses = [{'addr': _private_ip(i), 'OS-EXT-IPS:type': 'fixed'}]
+        if i % 2 == 0:
+            addresses.append({'addr': _public_ip(i), 'OS-EXT-IPS:type': 'floating'})
+        servers.append({
+            'id': server_id,
+            'name': f'nhn-vm-{i}',
+            'addresses': {'Default Network': addresses},
+            'OS-EXT-AZ:availability_zone': rng.choice(('kr-pub-a', 'kr-pub-b')),
+            'OS-EXT-STS:vm_state': 'active' if i % 10 else 'stopped',
+            'flavor': {'id': rng.choice(flavors)['id']},
+            'created': '2024-03-01T09:00:00Z',
+        })
+        for v in range(_volumes_per_server(rng)):
+            volumes.append({
+                'id': f'nhn-volume-{i:06d}-{v}',
+                'volume_type': rng.choice(('General HDD', 'General SSD')),
+                'size': 50 if v == 0 else rng.choice((100, 200, 500)),
+                'bootable': 'true' if v == 0 else 'false',
+                'attachments': [{'server_id': server_id, 'device': f'/dev/vd{chr(97 + v)}'}],
+            })
+    return {'servers': servers, 'volumes': volumes, 'flavors': flavors}
+
+
+def ncp_tenant(count, seed=0):
+    """
+    NCP 응답 형식의 합성 테넌트를 생성하는 함수. 절반의 서버에 공인 IP 를 붙입니다.
+
+    Args:
+        count (int): VM 수.
+        seed (int, optional): 난수 시드.
+
+    Returns:
+        dict: 'servers', 'volumes', 'networks' 리스트를 가진 사전.
+    """
+    rng = random.Random(seed)
+    servers, volumes, networks = [], [], []
+    gib = 1024 ** 3
+    for i in range(count):
+        server_no = str(1000000 + i)
+        servers.append({
+            'serverInstanceNo': server_no,
+            'serverName': f'ncp-vm-{i}',
+            'zoneCode': rng.choice(('KR-1', 'KR-2')),
+            'serverInstanceStatus': {'code': 'RUN' if i % 10 else 'NSTOP'},
+            'cpuCount': rng.choice((2, 4, 8)),
+            'memorySize': rng.choice((4, 8, 16)) * gib,
+            'createDate': '2024-03-01T09:00:00+0900',
+            'publicIp': _public_ip(i) if i % 2 == 0 else '',
+            'networkInterfaceNoList': [str(2000000 + i)],
+        })
+        networks.append({'networkInterfaceNo': str(2000000 + i), 'instanceNo': server_no, 'ip': _private_ip(i)})
+        for v in range(_volumes_per_server(rng)):
+            volumes.append({
+                'blockStorageInstanceNo': f'{3000000 + i}{v}',
+                'serverInstanceNo': server_no,
+                'deviceName': f'/dev/xvd{chr(97 + v)}',
+                'blockStorageDiskDetailType': {'code': rng.choice(('HDD', 'SSD'))},
+                'blockStorageSize': (50 if v == 0 else rng.choice((100, 200, 500))) * gib,
+                'blockStorageType': {'code': 'BASIC' if v == 0 else 'SVRBS'},
+            })
+    return {'servers': servers, 'volumes': volumes, 'networks': networks}
+
+
+TENANTS = {'KTC': ktc_tenant, 'NHN': nhn_tenant, 'NCP': ncp_tenant}
@@ -0,0 +1,243 @@
+import hashlib
+import os
+import re
+import sqlite3
+import time
+
+CATALOG_DB = 'files/catalog.db'
+LEGACY_DIR = 'files/{user}_custom'
+CSP_PATTERN = re.compile(r'-(KTC.?|NHN.?|NCP.?)-inventory-')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    user TEXT NOT NULL,
+    customer TEXT NOT NULL,
+    latest_id INTEGER,
+    legacy_offset INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (user, customer)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user TEXT NOT NULL,
+    customer TEXT NOT NULL,
+    csp_type TEXT,
+    file TEXT NOT NULL,
+    source TEXT NOT NULL,
+    rows INTEGER,
+    checksum TEXT,
+    collected_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_customer ON snapshots (user, customer, id);
+"""
+
+
+def file_checksum(file_path):
+    """
+    파일의 SHA-256 체크섬을 계산하는 함수.
+
+    Args:
+        file_path (str): 파일 경로.
+
+    Returns:
+        str | None: 16진수 체크섬. 파일이 없으면 None.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+class InventoryCatalog:
+    """
+    사용자별 고객사와 인벤토리 스냅샷(파일) 이력을 SQLite 에 보관하는 클래스.
+    고객사마다 최신 스냅샷 ID 를 함께 저장하므로 최신 파일 조회는 기본 키 조회 한 번으로 끝나고,
+    이력은 (user, customer, id) 인덱스로 조회합니다.
+    WAL 모드와 작업마다 새 연결을 사용하므로 병렬 수집기와 여러 프로세스가 동시에 기록해도 안전합니다.
+
+    Args:
+        path (str, optional): 데이터베이스 파일 경로. 기본값은 'files/catalog.db'.
+    """
+
+    COLUMNS = ('id', 'user', 'customer', 'csp_type', 'file', 'source', 'rows', 'checksum', 'collected_at')
+
+    def __init__(self, path=CATALOG_DB):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _to_snapshot(self, row):
+        return dict(zip(self.COLUMNS, row))
+
+    def add_customer(self, user, customer):
+        """
+        고객사를 등록하는 메서드.
+
+        Returns:
+            bool: 새로 등록했으면 True, 이미 있으면 False.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute('INSERT OR IGNORE INTO customers (user, customer, created_at) VALUES (?, ?, ?)',
+                                  (user, customer, time.time()))
+        return cursor.rowcount == 1
+
+    def has_customer(self, user, customer):
+        """
+        고객사가 등록되어 있는지 확인하는 메서드.
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT 1 FROM customers WHERE user = ? AND customer = ?', (user, customer)).fetchone()
+        return row is not None
+
+    def delete_customer(self, user, customer):
+        """
+        고객사와 스냅샷 이력을 삭제하는 메서드. 이전 기록 파일이 남아 있으면 다시 가져오지 않도록 함께 삭제합니다.
+        엑셀 파일은 삭제하지 않습니다.
+        """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM snapshots WHERE user = ? AND customer = ?', (user, customer))
+            conn.execute('DELETE FROM customers WHERE user = ? AND customer = ?', (user, customer))
+        legacy_path = os.path.join(LEGACY_DIR.format(user=user), customer)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+
+    def customers(self, user):
+        """
+        사용자의 고객사 이름을 등록순으로 반환하는 메서드.
+
+        Returns:
+            list: 고객사명 리스트.
+        """
+        with self._connect() as conn:
+            rows = conn.execute('SELECT customer FROM customers WHERE user = ? ORDER BY created_at, customer',
+                                (user,)).fetchall()
+        return [row[0] for row in rows]
+
+    def record(self, user, customer, file, collected_at, csp_type=None, source='API', rows=None, checksum=None):
+        """
+        스냅샷을 기록하고 고객사의 최신 스냅샷으로 지정하는 메서드. 등록되지 않은 고객사는 함께 등록합니다.
+
+        Args:
+            user (str): 사용자 이름.
+            customer (str): 고객사명.
+            file (str): files/{user}_files 아래의 파일 이름.
+            collected_at (str): 수집 시각 (YYYYMMDDHHMM 형식).
+            csp_type (str, optional): CSP 유형. 수동 등록 파일은 None.
+            source (str, optional): 'API', 'manual' 등 스냅샷 출처. 기본값은 'API'.
+            rows (int, optional): VM 수.
+            checksum (str, optional): 파일 SHA-256 체크섬.
+
+        Returns:
+            int: 스냅샷 ID.
+        """
+        with self._connect() as conn:
+            return self._insert(conn, user, customer, file, collected_at, csp_type, source, rows, checksum)
+
+    def _insert(self, conn, user, customer, file, collected_at, csp_type, source, rows, checksum):
+        """
+        한 트랜잭션 안에서 스냅샷을 추가하고 최신 스냅샷 ID 를 갱신하는 헬퍼 메서드.
+        """
+        conn.execute('INSERT OR IGNORE INTO customers (user, customer, created_at) VALUES (?, ?, ?)',
+                     (user, customer, time.time()))
+        snapshot_id = conn.execute(
+            'INSERT INTO snapshots (user, customer, csp_type, file, source, rows, checksum, collected_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (user, customer, csp_type, file, source, rows, checksum, collected_at)).lastrowid
+        conn.execute('UPDATE customers SET latest_id = ? WHERE user = ? AND customer = ?',
+                     (snapshot_id, user, customer))
+        return snapshot_id
+
+    def latest(self, user, customer):
+        """
+        고객사의 최신 스냅샷을 반환하는 메서드.
+
+        Returns:
+            dict | None: 스냅샷 사전. 없으면 None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(f's.{column}' for column in self.COLUMNS)} FROM customers c "
+                               f"JOIN snapshots s ON s.id = c.latest_id WHERE c.user = ? AND c.customer = ?",
+                               (user, customer)).fetchone()
+        return self._to_snapshot(row) if row else None
+
+    def latest_all(self, user):
+        """
+        사용자의 모든 고객사와 각 고객사의 최신 스냅샷을 한 번에 반환하는 메서드.
+
+        Returns:
+            dict: 고객사명을 키로, 최신 스냅샷 사전(없으면 None)을 값으로 가지는 사전 (등록순).
+        """
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT c.customer, {', '.join(f's.{column}' for column in self.COLUMNS)} "
+                                f"FROM customers c LEFT JOIN snapshots s ON s.id = c.latest_id "
+                                f"WHERE c.user = ? ORDER BY c.created_at, c.customer", (user,)).fetchall()
+        return {row[0]: self._to_snapshot(row[1:]) if row[1] is not None else None for row in rows}
+
+    def history(self, user, customer, limit=None):
+        """
+        고객사의 스냅샷 이력을 최신순으로 반환하는 메서드.
+
+        Args:
+            limit (int, optional): 최대 개수. 기본값은 전체.
+
+        Returns:
+            list: 스냅샷 사전 리스트.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM snapshots WHERE user = ? AND customer = ? "
+                                f"ORDER BY id DESC LIMIT ?", (user, customer, -1 if limit is None else limit))
+            return [self._to_snapshot(row) for row in rows.fetchall()]
+
+    def sync_legacy(self, user):
+        """
+        files/{user}_custom/{customer} 기록 파일('파일명,YYYYMMDDHHMM' 줄)을 카탈로그로 가져오는 메서드.
+        고객사별로 가져온 위치(바이트)를 저장해 두므로 여러 번 호출해도 새로 추가된 줄만 가져옵니다
+        (예: GUI 원격 업데이트 도구가 기록 파일에 추가한 줄). 가져온 위치는 한 번의 조회로 읽고 파일 크기와 비교하므로,
+        새 줄이 없으면 파일을 열거나 쓰기 트랜잭션을 시작하지 않아 화면을 그릴 때마다 호출해도 부담이 적습니다.
+
+        Args:
+            user (str): 사용자 이름.
+
+        Returns:
+            int: 가져온 스냅샷 수.
+        """
+        legacy_dir = LEGACY_DIR.format(user=user)
+        if not os.path.isdir(legacy_dir):
+            return 0
+        with self._connect() as conn:
+            offsets = dict(conn.execute('SELECT customer, legacy_offset FROM customers WHERE user = ?', (user,)))
+        imported = 0
+        for customer in os.listdir(legacy_dir):
+            legacy_path = os.path.join(legacy_dir, customer)
+            if customer in offsets and os.path.getsize(legacy_path) <= offsets[customer]:
+                continue
+            with self._connect() as conn:
+                conn.execute('INSERT OR IGNORE INTO customers (user, customer, created_at) VALUES (?, ?, ?)',
+                             (user, customer, os.path.getmtime(legacy_path)))
+                offset = conn.execute('SELECT legacy_offset FROM customers WHERE user = ? AND customer = ?',
+                                      (user, customer)).fetchone()[0]
+                with open(legacy_path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read()
+                data = data[:data.rfind(b'\n') + 1]  # 기록 중인 마지막 줄은 다음에 가져옴
+                for line in data.decode('utf-8').splitlines():
+                    filename, _, collected_at = line.strip().rpartition(',')
+                    if not filename:
+                        continue
+                    match = CSP_PATTERN.search(filename)
+                    checksum = file_checksum(os.path.join(f'files/{user}_files', filename))
+                    self._insert(conn, user, customer, filename, collected_at, match.group(1) if match else None,
+                                 'legacy', None, checksum)
+                    imported += 1
+                conn.execute('UPDATE customers SET legacy_offset = ? WHERE user = ? AND customer = ?',
+                             (offset + len(data), user, customer))
+        return imported
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import token_cache
+from csp_factory import CSPFactory
+
+DEFAULT_IDLE_TTL = 30 * 60  # 이 시간 동안 사용되지 않은 클라이언트는 제거(초)
+DEFAULT_MAX_SIZE = 64
+
+
+class ClientPool:
+    """
+    인증된 CSP 클라이언트를 재사용하기 위한 서버 측 풀 클래스.
+
+    세션 사용자, CSP 유형, 존, 자격 증명 지문(해시)을 키로 클라이언트를 보관하므로,
+    같은 계정으로 다시 수집할 때 인증 토큰과 프로젝트 정보를 그대로 사용합니다.
+    오래 사용되지 않은 클라이언트는 조회할 때마다 정리합니다.
+
+    Args:
+        idle_ttl (int, optional): 유휴 클라이언트 제거 시간(초). 기본값은 1800.
+        max_size (int, optional): 최대 보관 클라이언트 수. 넘으면 가장 오래 사용하지 않은 것부터 제거. 기본값은 64.
+    """
+
+    def __init__(self, idle_ttl=DEFAULT_IDLE_TTL, max_size=DEFAULT_MAX_SIZE):
+        self.idle_ttl = idle_ttl
+        self.max_size = max_size
+        self._clients = {}  # key -> [client, last_used]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def pool_key(user, csp_type, **kwargs):
+        """
+        풀 키를 만드는 메서드. 자격 증명은 평문 대신 지문으로만 보관합니다.
+
+        Args:
+            user (str): 세션 사용자 이름.
+            csp_type (str): CSP 유형.
+            **kwargs: CSPFactory.get_csp 에 전달할 인자.
+
+        Returns:
+            tuple: (사용자, CSP 유형, 존, 자격 증명 지문).
+        """
+        zone = kwargs.get('zone')
+        zone = tuple(zone) if isinstance(zone, list) else zone
+        fingerprint = token_cache.cache_key(*(f'{name}={kwargs[name]}' for name in sorted(kwargs)))
+        return user, csp_type, zone, fingerprint
+
+    def get(self, user, csp_type, **kwargs):
+        """
+        풀에서 클라이언트를 꺼내거나, 없으면 CSPFactory 로 새로 만들어 보관하는 메서드.
+
+        Args:
+            user (str): 세션 사용자 이름.
+            csp_type (str): CSP 유형.
+            **kwargs: CSPFactory.get_csp 에 전달할 인자.
+
+        Returns:
+            object: CSP API 인스턴스.
+        """
+        key = self.pool_key(user, csp_type, **kwargs)
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._clients.get(key)
+            if entry is None:
+                entry = self._clients[key] = [CSPFactory.get_csp(csp_type, **kwargs), now]
+            entry[1] = now
+            return entry[0]
+
+    def discard(self, user, csp_type, **kwargs):
+        """
+        풀에서 클라이언트를 제거하는 메서드 (예: 인증 실패 후).
+        """
+        with self._lock:
+            self._clients.pop(self.pool_key(user, csp_type, **kwargs), None)
+
+    def _evict(self, now):
+        """
+        유휴 시간이 지났거나 최대 개수를 넘는 클라이언트를 제거하는 헬퍼 메서드. 잠금을 잡은 상태로 호출합니다.
+        """
+        for key in [key for key, (_, last_used) in self._clients.items() if now - last_used > self.idle_ttl]:
+            del self._clients[key]
+        while len(self._clients) >= self.max_size:
+            del self._clients[min(self._clients, key=lambda key: self._clients[key][1])]
+
+    def __len__(self):
+        return len(self._clients)
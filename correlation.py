@@ -0,0 +1,63 @@
+def index_volumes(attachments, instance_volumes=None):
+    """
+    (인스턴스 ID, 볼륨 정보) 쌍으로 인스턴스 ID → 볼륨 리스트 인덱스를 만드는 함수.
+
+    Args:
+        attachments (iterable): 각 CSP 의 _volume_attachments 가 생성하는 (인스턴스 ID, 볼륨 정보) 쌍.
+        instance_volumes (dict, optional): 이어서 채울 기존 인덱스. 페이지 단위로 누적할 때 사용.
+
+    Returns:
+        dict: 인스턴스 ID를 키로 하고, 볼륨 정보 리스트를 값으로 가지는 사전.
+    """
+    if instance_volumes is None:
+        instance_volumes = {}
+    for instance_id, volume in attachments:
+        instance_volumes.setdefault(instance_id, []).append(volume)
+    return instance_volumes
+
+
+def index_nics(networks, instance_nics=None):
+    """
+    네트워크 인터페이스 리스트로 인스턴스 ID → 사설 IP 리스트 인덱스를 만드는 함수.
+
+    Args:
+        networks (list): {'instanceNo', 'ip'} 사전 리스트.
+        instance_nics (dict, optional): 이어서 채울 기존 인덱스.
+
+    Returns:
+        dict: 인스턴스 ID를 키로 하고, 사설 IP 리스트(응답 순서 유지)를 값으로 가지는 사전.
+    """
+    if instance_nics is None:
+        instance_nics = {}
+    for network in networks:
+        instance_nics.setdefault(network['instanceNo'], []).append(network['ip'])
+    return instance_nics
+
+
+def index_public_ips(pairs):
+    """
+    (공인 IP, 사설 IP) 쌍으로 사설 IP → 공인 IP 인덱스를 만드는 함수.
+    사설 IP 는 정확히 일치하는 경우에만 매칭되므로 10.0.0.1 이 10.0.0.12 와 짝지어지지 않습니다.
+
+    Args:
+        pairs (list): {'pubip', 'privateip'} 사전 리스트.
+
+    Returns:
+        dict: 사설 IP를 키로 하고, 공인 IP를 값으로 가지는 사전. 중복 시 마지막 항목이 우선합니다.
+    """
+    return {pair['privateip'].strip(): pair['pubip'] for pair in pairs if pair['privateip']}
+
+
+def join_volumes(instance_ids, instance_volumes):
+    """
+    주어진 인스턴스들에 볼륨 리스트를 연결하는 함수 (block_filter 반환 형식).
+
+    Args:
+        instance_ids (dict): 인스턴스 ID를 키로 하고, 인스턴스 이름을 값으로 가지는 사전.
+        instance_volumes (dict): index_volumes 가 반환한 인덱스.
+
+    Returns:
+        dict: 인스턴스 ID를 키로 하고, {'instance_name', 'volumes'} 를 값으로 가지는 사전.
+    """
+    return {instance_id: {"instance_name": name, "volumes": instance_volumes.get(instance_id, [])}
+            for instance_id, name in instance_ids.items()}
@@ -1,6 +1,6 @@
 # csp_factory.py
 
-from ktc_api import KTCAPI
+from ktc_api import KTCAPI, KTCMultiZoneAPI
 from nhn_api import NHNAPI
 from ncp_api import NCPAPI
 
@@ -44,7 +44,7 @@ class CSPFactory:
             raise ValueError(f"Unknown CSP type: {csp_type}")
 
     @staticmethod
-    def _create_ktc_api(csp_type, username, password, zone='d1', gov=False):
+    def _create_ktc_api(csp_type, username, password, zone='d1', gov=False, max_workers=None, response_cache=None):
         """
         KTC API 인스턴스를 생성하는 헬퍼 메서드.
 
@@ -52,19 +52,24 @@ class CSPFactory:
             csp_type (str): CSP 유형 (예: "KTC", "KTCG").
             username (str): 사용자 이름.
             password (str): 비밀번호.
-            zone (str, optional): 존(zone) 정보. 기본값은 'd1'.
+            zone (str | list, optional): 존(zone) 정보. 목록을 주면 멀티존 모드로 동작. 기본값은 'd1'.
             gov (bool, optional): 공공 클라우드 여부. 기본값은 False.
+            max_workers (int, optional): 멀티존 모드에서 동시에 수집할 최대 존 수.
+            response_cache (ResponseCache, optional): 참조 데이터 응답 캐시. 기본값은 None(미사용).
 
         Returns:
-            KTCAPI: KTC API 인스턴스.
+            KTCAPI | KTCMultiZoneAPI: KTC API 인스턴스.
         """
         if csp_type == "KTCG":
             zone = 'gd1'
             gov = True
-        return KTCAPI(username, password, zone, gov)
+        if isinstance(zone, (list, tuple)):
+            return KTCMultiZoneAPI(username, password, zone, max_workers, response_cache)
+        return KTCAPI(username, password, zone, gov, response_cache)
 
     @staticmethod
-    def _create_nhn_api(csp_type, username, password, tenantid, zone='kr1', gov=False):
+    def _create_nhn_api(csp_type, username, password, tenantid, zone='kr1', gov=False, flavor_cache_ttl=None,
+                        response_cache=None):
         """
         NHN API 인스턴스를 생성하는 헬퍼 메서드.
 
@@ -75,16 +80,19 @@ class CSPFactory:
             tenantid (str): 테넌트 ID.
             zone (str, optional): 존(zone) 정보. 기본값은 'kr1'.
             gov (bool, optional): 공공 클라우드 여부. 기본값은 False.
+            flavor_cache_ttl (int, optional): 플레이버 카탈로그 디스크 캐시 유효 시간(초). 기본값은 None(미사용).
+            response_cache (ResponseCache, optional): 참조 데이터 응답 캐시. 기본값은 None(미사용).
 
         Returns:
             NHNAPI: NHN API 인스턴스.
         """
         if csp_type == "NHNG":
             gov = True
-        return NHNAPI(username, password, tenantid, zone, gov)
+        return NHNAPI(username, password, tenantid, zone, gov, flavor_cache_ttl, response_cache)
 
     @staticmethod
-    def _create_ncp_api(csp_type, access_key, secret_key, zone='KR', gov=False):
+    def _create_ncp_api(csp_type, access_key, secret_key, zone='KR', gov=False, response_cache=None, zone_code=None,
+                        server_nos=None):
         """
         NCP API 인스턴스를 생성하는 헬퍼 메서드.
 
@@ -92,12 +100,15 @@ class CSPFactory:
             csp_type (str): CSP 유형 (예: "NCP", "NCPG").
             access_key (str): 액세스 키.
             secret_key (str): 비밀 키.
-            zone (str, optional): 존(zone) 정보. 기본값은 'KR'.
+            zone (str, optional): 리전 코드. 기본값은 'KR'.
             gov (bool, optional): 공공 클라우드 여부. 기본값은 False.
+            response_cache (ResponseCache, optional): 참조 데이터 응답 캐시. 기본값은 None(미사용).
+            zone_code (str, optional): 수집할 존 코드 (예: 'KR-1'). 기본값은 None(전체 존).
+            server_nos (list, optional): 수집할 서버 인스턴스 번호 리스트. 기본값은 None(전체 서버).
 
         Returns:
             NCPAPI: NCP API 인스턴스.
         """
         if csp_type == "NCPG":
             gov = True
-        return NCPAPI(access_key, secret_key, zone, gov)
\ No newline at end of file
+        return NCPAPI(access_key, secret_key, zone, gov, response_cache, zone_code, server_nos)
\ No newline at end of file
@@ -1,4 +1,6 @@
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
 class CSPInterface(ABC):
@@ -23,10 +25,24 @@ class CSPInterface(ABC):
         클라우드 인프라의 인벤토리 정보를 가져오는 메서드.
         이 메서드는 각 CSP에서 인벤토리 정보를 수집하여 반환하도록 구현되어야 합니다.
         Returns:
-            dict: 인벤토리 정보가 담긴 사전(dict).
+            list: InventoryRecord 리스트.
         """
         pass
 
+    def iter_inventory(self, page_size=100):
+        """
+        인벤토리 정보를 페이지 단위로 하나씩 생성하는 제너레이터 메서드.
+        페이지네이션을 지원하는 CSP 는 이 메서드를 재정의하여 페이지가 도착하는 대로 레코드를 생성해야 합니다.
+        기본 구현은 get_inventory 결과를 순회합니다.
+
+        Args:
+            page_size (int, optional): 한 번에 가져올 페이지 크기. 기본값은 100.
+
+        Yields:
+            InventoryRecord: 인벤토리 레코드.
+        """
+        yield from self.get_inventory()
+
     @abstractmethod
     def get_blockstorage(self):
         """
@@ -36,3 +52,19 @@ class CSPInterface(ABC):
             list: 블록 스토리지 정보 리스트.
         """
         pass
+
+    @staticmethod
+    def fetch_parallel(**calls):
+        """
+        서로 의존하지 않는 API 호출들을 동시에 실행하고 모두 끝날 때까지 기다리는 메서드.
+
+        Args:
+            **calls: 결과 이름을 키로 하고, 인자 없는 호출 가능 객체를 값으로 가지는 키워드 인자.
+
+        Returns:
+            dict: 결과 이름을 키로 하고, 각 호출의 반환값을 값으로 가지는 사전.
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            # 호출별 지표(metrics.track_run)가 작업 스레드에서도 모이도록 컨텍스트를 복사
+            futures = {name: executor.submit(contextvars.copy_context().run, call) for name, call in calls.items()}
+            return {name: future.result() for name, future in futures.items()}
@@ -1,100 +1,85 @@
-from openpyxl import load_workbook
-from openpyxl.styles import Border, Side, Alignment
-from datetime import datetime
-import string
-import os
-
-
-def data_to_excel(inventories, csp_type, path, cday, customer=''):
-    """
-    인벤토리 데이터를 엑셀 파일로 저장하는 함수.
-
-    Args:
-        inventories (list): 인벤토리 데이터 리스트.
-        csp_type (str): CSP 유형.
-        path (str): 파일 저장 경로.
-        cday (str): 현재 날짜 (YYYYMMDD 형식).
-        customer (str, optional): 고객사명. 기본값은 ''.
-    """
-    thin_border = Border(left=Side(style='thin'),
-                         right=Side(style='thin'),
-                         top=Side(style='thin'),
-                         bottom=Side(style='thin'))
-    try:
-        wb = load_workbook('files/template.xlsx')
-    except FileNotFoundError:
-        raise FileNotFoundError("템플릿 파일을 찾을 수 없습니다: files/template.xlsx")
-
-    ws = wb.active
-    create_time_in_excel = datetime.now().strftime("%Y년%m월%d일")
-    ws['A1'].value = customer
-    ws['O1'].value = create_time_in_excel
-
-    for i, inventory in enumerate(inventories):
-        ext_ssd = 0
-        ext_hdd = 0
-        vmguestip = next(iter(inventory))
-        inventory = inventory[vmguestip]
-
-        ws[f'A{i + 5}'].value = inventory['availability_zone']  # zone
-        ws[f'B{i + 5}'].value = inventory['name']  # name
-        ws[f'D{i + 5}'].value = inventory['vcpus']  # vcpu
-        ws[f'E{i + 5}'].value = inventory['ram']  # ram
-
-        for volume in inventory['volumes']:
-            if volume['bootable']:
-                if volume['volume_type'] == 'HDD':
-                    ws[f'F{i + 5}'].value = str(volume['size'])  # HDD size
-                else:
-                    ws[f'G{i + 5}'].value = str(volume['size'])  # SSD size
-            else:
-                if volume['volume_type'] == 'HDD':
-                    ext_hdd += volume['size']
-                else:
-                    ext_ssd += volume['size']
-
-        if ext_ssd != 0:
-            ws[f'J{i + 5}'].value = str(ext_ssd)  # ext SSD total(sum) size
-        if ext_hdd != 0:
-            ws[f'I{i + 5}'].value = str(ext_hdd)  # ext HDD total(sum) size
-
-        ws[f'M{i + 5}'].value = inventory['publicip']  # pub ip
-        ws[f'N{i + 5}'].value = vmguestip  # pri ip
-        ws[f'O{i + 5}'].value = inventory['created']  # created
-        ws[f'P{i + 5}'].value = inventory['vm_state']  # vm state
-
-        for uppercase in string.ascii_uppercase[:-10]:
-            ws[f'{uppercase}{i + 5}'].border = thin_border
-            ws[f'{uppercase}{i + 5}'].alignment = Alignment(horizontal='center', vertical='center')
-
-    output_path = f'files/{path}_files/{customer}-{csp_type}-inventory-{cday}.xlsx'
-
-    try:
-        wb.save(output_path)
-    except Exception as e:
-        raise IOError(f"엑셀 파일 저장 중 오류 발생: {str(e)}")
-
-
-def write_to_file(type, csp_type, customer, path, cday, ctime, filename=''):
-    """
-        인벤토리 파일 정보를 기록하는 함수.
-
-        Args:
-            type (str): 수집 타입 (API 또는 기타).
-            csp_type (str): CSP 유형.
-            customer (str): 고객사명.
-            path (str): 파일 저장 경로.
-            cday (str): 현재 날짜 (YYYYMMDD 형식).
-            ctime (str): 현재 시간 (HHMM 형식).
-            filename (str, optional): 파일 이름. 기본값은 ''.
-        """
-    customer_path = f'files/{path}_custom/{customer}'
-    try:
-        with open(customer_path, 'a+', encoding='utf-8') as f:
-            if type == 'API':
-                record = f'{customer}-{csp_type}-inventory-{cday}.xlsx,{cday}{ctime}\n'
-            else:
-                record = f'{filename},{cday}{ctime}\n'
-            f.write(record)
-    except Exception as e:
-        raise IOError(f"고객 파일 기록 중 오류 발생: {str(e)}")
\ No newline at end of file
+import sqlite3
+
+import pandas as pd
+from catalog import InventoryCatalog, file_checksum
+from excel_writer import InventoryWriter
+from normalize import frame_to_records
+from pagination import DEFAULT_PAGE_SIZE
+
+
+def data_to_excel(inventories, csp_type, path, cday, customer=''):
+    """
+    인벤토리 데이터를 엑셀 파일로 저장하는 함수.
+    템플릿 헤더를 옮긴 write-only 워크북에 행을 순서대로 기록하므로(InventoryWriter), 제너레이터를 주면
+    레코드를 메모리에 쌓지 않습니다.
+
+    Args:
+        inventories (iterable | pd.DataFrame): InventoryRecord 들 또는 normalize 의 인벤토리 프레임.
+        csp_type (str): CSP 유형.
+        path (str): 파일 저장 경로.
+        cday (str): 현재 날짜 (YYYYMMDD 형식).
+        customer (str, optional): 고객사명. 기본값은 ''.
+
+    Returns:
+        int: 기록한 VM 수.
+    """
+    if isinstance(inventories, pd.DataFrame):
+        inventories = frame_to_records(inventories)
+
+    writer = InventoryWriter(f'files/{path}_files/{customer}-{csp_type}-inventory-{cday}.xlsx', customer)
+    writer.extend(inventories)
+    writer.save()
+    return writer.count
+
+
+def stream_to_excel(client, csp_type, path, cday, customer='', page_size=DEFAULT_PAGE_SIZE):
+    """
+    CSP 클라이언트의 iter_inventory 가 페이지 단위로 만드는 레코드를 도착하는 대로 엑셀 행으로 기록하는 함수.
+    전체 응답이나 인벤토리 리스트, 워크북을 메모리에 쌓지 않으므로 테넌트 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        client (CSPInterface | list): CSP 클라이언트. 리스트를 주면 순서대로 이어서 기록합니다 (예: 존별 클라이언트).
+        csp_type (str): CSP 유형.
+        path (str): 파일 저장 경로.
+        cday (str): 현재 날짜 (YYYYMMDD 형식).
+        customer (str, optional): 고객사명. 기본값은 ''.
+        page_size (int, optional): 페이지 크기.
+
+    Returns:
+        int: 기록한 VM 수.
+    """
+    writer = InventoryWriter(f'files/{path}_files/{customer}-{csp_type}-inventory-{cday}.xlsx', customer)
+    for csp in client if isinstance(client, list) else [client]:
+        writer.extend(csp.iter_inventory(page_size))
+    writer.save()
+    return writer.count
+
+
+def write_to_file(type, csp_type, customer, path, cday, ctime, filename='', count=None, catalog=None):
+    """
+        인벤토리 파일 정보를 카탈로그(catalog.InventoryCatalog)에 기록하는 함수.
+        파일 이름, CSP 유형, VM 수, 체크섬을 저장하고 해당 파일을 고객사의 최신 스냅샷으로 지정합니다.
+
+        Args:
+            type (str): 수집 타입 (API 또는 기타).
+            csp_type (str): CSP 유형. 수동 등록 파일은 ''.
+            customer (str): 고객사명.
+            path (str): 파일 저장 경로.
+            cday (str): 현재 날짜 (YYYYMMDD 형식).
+            ctime (str): 현재 시간 (HHMM 형식).
+            filename (str, optional): 파일 이름. 기본값은 ''.
+            count (int, optional): VM 수.
+            catalog (InventoryCatalog, optional): 기록할 카탈로그. 기본값은 'files/catalog.db'.
+
+        Raises:
+            IOError: 기록 실패 시 발생.
+        """
+    if type == 'API':
+        filename = f'{customer}-{csp_type}-inventory-{cday}.xlsx'
+    try:
+        (catalog or InventoryCatalog()).record(
+            user=path, customer=customer, file=filename, collected_at=f'{cday}{ctime}', csp_type=csp_type or None,
+            source='API' if type == 'API' else 'manual', rows=count,
+            checksum=file_checksum(f'files/{path}_files/{filename}'))
+    except (OSError, sqlite3.Error) as e:
+        raise IOError(f"고객 파일 기록 중 오류 발생: {str(e)}")
@@ -0,0 +1,215 @@
+import io
+import os
+import threading
+from copy import copy
+from datetime import datetime
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, Border, NamedStyle, Side
+
+from sidecar import SidecarWriter
+
+TEMPLATE_PATH = 'files/template.xlsx'
+HEADER_ROWS = 4  # 템플릿의 제목/헤더 행 수. 데이터는 5행부터 기록
+COLUMN_COUNT = 16  # A~P 열
+
+_thin = Side(style='thin')
+ROW_BORDER = Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
+ROW_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+ROW_STYLE = 'inventory_row'
+
+_template_cache = {}
+_template_lock = threading.Lock()
+
+
+def record_values(record):
+    """
+    InventoryRecord 를 템플릿 A~P 열 순서의 값 리스트로 변환하는 함수.
+    OS, SWAP, NAS, Mount Point 열은 비워 두고, 디스크 용량은 0 이면 비워 둡니다.
+
+    Args:
+        record (InventoryRecord): 인벤토리 레코드.
+
+    Returns:
+        list: 16개 열 값 리스트.
+    """
+    return [
+        record.zone, record.name, None, record.vcpus, record.ram_gb,
+        str(record.boot_hdd) if record.boot_hdd else None,
+        str(record.boot_ssd) if record.boot_ssd else None,
+        None,
+        str(record.ext_hdd) if record.ext_hdd else None,
+        str(record.ext_ssd) if record.ext_ssd else None,
+        None, None,
+        record.public_ip, record.private_ip, record.created, record.state,
+    ]
+
+
+class TemplateLayout:
+    """
+    템플릿에서 헤더 작성에 필요한 정보만 뽑아 둔 클래스.
+    서식 객체는 openpyxl 에서 값처럼 다뤄지므로(변경 불가) 여러 워크북이 같은 객체를 그대로 공유합니다.
+
+    Args:
+        data (bytes): 템플릿 파일 내용.
+        mtime (int): 템플릿 파일 수정 시각(ns).
+    """
+
+    def __init__(self, data, mtime):
+        self.data = data
+        self.mtime = mtime
+        template = load_workbook(io.BytesIO(data))
+        ws = template.active
+        self.title = ws.title
+        self.default_font = copy(Cell(ws).font)  # 서식이 없는 셀의 글꼴 = 템플릿 기본 글꼴
+        self.column_widths = {key: dimension.width for key, dimension in ws.column_dimensions.items()}
+        self.merged_cells = [merged.coord for merged in ws.merged_cells.ranges if merged.max_row <= HEADER_ROWS]
+        self.header_rows = [
+            [(source.coordinate, source.value,
+              (copy(source.font), copy(source.fill), copy(source.border), copy(source.alignment),
+               source.number_format) if source.has_style else None)
+             for source in row]
+            for row in ws.iter_rows(min_row=1, max_row=HEADER_ROWS, max_col=COLUMN_COUNT)
+        ]
+
+
+def load_template(template_path=TEMPLATE_PATH):
+    """
+    템플릿을 한 번만 해석해 두고 재사용하는 함수. 파일 수정 시각이 바뀌면 다시 읽습니다.
+
+    Args:
+        template_path (str, optional): 템플릿 경로. 기본값은 'files/template.xlsx'.
+
+    Returns:
+        TemplateLayout: 해석된 템플릿.
+
+    Raises:
+        FileNotFoundError: 템플릿 파일이 없을 때 발생.
+    """
+    try:
+        mtime = os.stat(template_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
+    with _template_lock:
+        layout = _template_cache.get(template_path)
+        if layout is None or layout.mtime != mtime:
+            with open(template_path, 'rb') as f:
+                layout = _template_cache[template_path] = TemplateLayout(f.read(), mtime)
+        return layout
+
+
+def template_bytes(template_path=TEMPLATE_PATH):
+    """
+    캐시된 템플릿 파일 내용을 반환하는 함수 (예: 템플릿 다운로드 버튼).
+
+    Args:
+        template_path (str, optional): 템플릿 경로. 기본값은 'files/template.xlsx'.
+
+    Returns:
+        bytes: 템플릿 파일 내용.
+    """
+    return load_template(template_path).data
+
+
+class InventoryWriter:
+    """
+    인벤토리 엑셀 파일을 write-only 모드로 한 행씩 기록하는 클래스.
+
+    캐시된 템플릿(load_template)의 헤더(1~4행) 값, 서식, 병합 셀, 열 너비를 그대로 옮긴 뒤 데이터 행을 바로 스트림에 씁니다.
+    기록한 행은 메모리에 남지 않으므로 VM 수와 관계없이 메모리 사용량이 일정합니다.
+    sidecar 를 켜면 같은 행 값을 대시보드용 Parquet 사이드카(sidecar.SidecarWriter)에도 배치 단위로 이어 쓰며,
+    한 배치만 메모리에 두므로 메모리 사용량은 여전히 일정합니다.
+
+    데이터 행 서식(얇은 테두리, 가운데 정렬)은 워크북에 이름 있는 스타일로 한 번만 등록하고,
+    그 스타일을 입힌 16개 셀을 미리 만들어 값만 바꿔 가며 재사용합니다.
+    write-only 시트는 append 시점에 행을 바로 직렬화하므로 셀을 재사용해도 안전하며,
+    셀마다 서식 객체를 만들고 스타일 테이블을 조회하는 비용이 없습니다.
+
+    Args:
+        output_path (str): 저장할 파일 경로.
+        customer (str, optional): 고객사명 (A1 셀). 기본값은 ''.
+        template_path (str, optional): 템플릿 경로. 기본값은 'files/template.xlsx'.
+        sidecar (bool, optional): 저장할 때 사이드카도 함께 저장할지 여부. 기본값은 True.
+
+    Raises:
+        FileNotFoundError: 템플릿 파일이 없을 때 발생.
+    """
+
+    def __init__(self, output_path, customer='', template_path=TEMPLATE_PATH, sidecar=True):
+        self.output_path = output_path
+        self.sidecar = SidecarWriter(output_path) if sidecar else None
+        self.count = 0
+        self.wb = Workbook(write_only=True)
+        template = load_template(template_path)
+        self.ws = self.wb.create_sheet(template.title)
+        self._write_header(template, customer)
+
+        self.wb.add_named_style(NamedStyle(ROW_STYLE, font=template.default_font, border=ROW_BORDER,
+                                           alignment=ROW_ALIGNMENT))
+        self.row_cells = [WriteOnlyCell(self.ws) for _ in range(COLUMN_COUNT)]
+        for cell in self.row_cells:
+            cell.style = ROW_STYLE
+
+    def _write_header(self, template, customer):
+        """
+        템플릿 헤더 행을 값과 서식째로 옮기고 고객사명과 문서 생성 날짜를 채우는 헬퍼 메서드.
+        """
+        ws = self.ws
+        for key, width in template.column_widths.items():
+            ws.column_dimensions[key].width = width
+        for coord in template.merged_cells:
+            ws.merged_cells.add(coord)
+
+        values = {'A1': customer, 'O1': datetime.now().strftime("%Y년%m월%d일")}
+        for row in template.header_rows:
+            cells = []
+            for coordinate, value, style in row:
+                cell = WriteOnlyCell(ws, values.get(coordinate, value))
+                if style:
+                    cell.font, cell.fill, cell.border, cell.alignment, cell.number_format = style
+                else:  # 서식이 없는 셀도 템플릿과 같은 기본 글꼴(맑은 고딕)로 보이도록 글꼴을 지정
+                    cell.font = template.default_font
+                cells.append(cell)
+            ws.append(cells)
+
+    def append(self, record):
+        """
+        레코드 하나를 데이터 행으로 기록하는 메서드.
+
+        Args:
+            record (InventoryRecord): 인벤토리 레코드.
+        """
+        values = record_values(record)
+        for cell, value in zip(self.row_cells, values):
+            cell.value = value
+        if self.sidecar:
+            self.sidecar.append(values)
+        self.ws.append(self.row_cells)
+        self.count += 1
+
+    def extend(self, records):
+        """
+        여러 레코드를 순서대로 기록하는 메서드.
+
+        Args:
+            records (iterable): InventoryRecord 들. 제너레이터를 주면 도착하는 대로 기록합니다.
+        """
+        for record in records:
+            self.append(record)
+
+    def save(self):
+        """
+        파일을 저장하는 메서드. sidecar 를 켰으면 엑셀 저장이 끝난 뒤 사이드카를 저장합니다.
+
+        Raises:
+            IOError: 저장 실패 시 발생.
+        """
+        try:
+            self.wb.save(self.output_path)
+        except Exception as e:
+            if self.sidecar:
+                self.sidecar.abort()
+            raise IOError(f"엑셀 파일 저장 중 오류 발생: {str(e)}")
+        if self.sidecar:
+            self.sidecar.close()
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import re
+import time
+
+from atomic_file import atomic_write
+
+FLAVOR_PATTERN = re.compile(r'c(\d+)m(\d+)')
+CACHE_DIR = 'files/cache'
+
+
+def parse_flavors(flavors):
+    """
+    플레이버 목록을 ID 기준 카탈로그로 변환하는 함수.
+    CPU/MEM 은 플레이버 이름(예: 'm2.c4m8')에서 추출하고, 추출할 수 없으면 API 값(vcpus, ram)을 사용합니다.
+
+    Args:
+        flavors (list): /flavors/detail 응답의 플레이버 리스트.
+
+    Returns:
+        dict: 플레이버 ID를 키로 하고, {'name', 'vcpus', 'ram'} 을 값으로 가지는 사전.
+    """
+    catalog = {}
+    for flavor in flavors:
+        type_info = flavor['name'].split('.')[1] if '.' in flavor['name'] else flavor['name']
+        match = FLAVOR_PATTERN.match(type_info)
+        if match:
+            vcpus, ram = match.group(1), match.group(2)
+        else:
+            vcpus, ram = flavor.get('vcpus'), (flavor.get('ram') or 0) // 1024
+        catalog[flavor['id']] = {'name': type_info, 'vcpus': vcpus, 'ram': ram}
+    return catalog
+
+
+class FlavorCatalog:
+    """
+    리전별 플레이버 카탈로그를 디스크에 TTL 과 함께 보관하는 클래스.
+
+    Args:
+        key (str): 카탈로그를 구분할 키 (예: 리전 URI + 테넌트 ID).
+        ttl (int): 디스크 캐시 유효 시간(초).
+        cache_dir (str, optional): 캐시 디렉토리. 기본값은 'files/cache'.
+    """
+
+    def __init__(self, key, ttl, cache_dir=CACHE_DIR):
+        self.ttl = ttl
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(cache_dir, f'flavors-{digest}.json')
+
+    def load(self):
+        """
+        유효한 캐시가 있으면 카탈로그를 반환하는 메서드.
+
+        Returns:
+            dict | None: 캐시된 카탈로그. 없거나 만료되었으면 None.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached.get('saved_at', 0) > self.ttl:
+            return None
+        return cached['catalog']
+
+    def save(self, catalog):
+        """
+        카탈로그를 디스크에 저장하는 메서드. 임시 파일에 쓴 뒤 교체하므로 동시 실행에도 안전합니다.
+
+        Args:
+            catalog (dict): 저장할 카탈로그.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with atomic_write(self.path) as f:
+            json.dump({'saved_at': time.time(), 'catalog': catalog}, f)
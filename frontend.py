@@ -3,12 +3,16 @@ from datetime import datetime
 import json
 from streamlit_option_menu import option_menu
 from st_aggrid import AgGrid, GridOptionsBuilder
-from csp_factory import CSPFactory
+from catalog import LEGACY_DIR, InventoryCatalog
+from client_pool import ClientPool
+from data_to_excel import write_to_file
+from excel_writer import template_bytes
+from sidecar import write_sidecar
+from jobs import JobRunner
 import streamlit as st
 import pandas as pd
 from st_keyup import st_keyup
-from data_to_excel import data_to_excel, write_to_file
-from read_inventory import read_template, read_customer_file
+from read_inventory import read_template, read_customer_file, read_excel_frame
 import streamlit_authenticator as stauth
 import yaml
 from yaml.loader import SafeLoader
@@ -36,6 +40,39 @@ csp_dict = {'민간NCP[VPC]': 'NCP', '공공NCP[VPC]': 'NCPG',
             }
 
 
+@st.cache_resource
+def get_client_pool():
+    """
+    모든 세션이 공유하는 CSP 클라이언트 풀을 반환하는 함수.
+
+    Returns:
+        ClientPool: 클라이언트 풀.
+    """
+    return ClientPool()
+
+
+@st.cache_resource
+def get_job_runner():
+    """
+    모든 세션이 공유하는 백그라운드 수집 작업 실행기를 반환하는 함수.
+
+    Returns:
+        JobRunner: 작업 실행기.
+    """
+    return JobRunner(pool=get_client_pool())
+
+
+@st.cache_resource
+def get_catalog():
+    """
+    모든 세션이 공유하는 인벤토리 카탈로그를 반환하는 함수.
+
+    Returns:
+        InventoryCatalog: 인벤토리 카탈로그.
+    """
+    return InventoryCatalog()
+
+
 def get_current_datetime():
     """
     현재 날짜와 시간을 반환하는 함수.
@@ -47,22 +84,63 @@ def get_current_datetime():
     return now.strftime("%Y%m%d"), now.strftime("%H%M")
 
 
-def handle_inventory_save(csp, csp_type, customer, session_username):
+def handle_inventory_save(csp_type, customer, session_username, incremental=False, **kwargs):
     """
-    수집된 인벤토리 데이터를 엑셀 파일로 저장하고 기록 파일에 정보를 기록하는 함수.
+    인벤토리 수집 작업을 백그라운드 작업 실행기에 등록하는 함수.
+    수집, 엑셀 저장, 기록 파일 작성은 작업 실행기가 처리하며 진행 상황은 show_jobs 로 확인합니다.
 
     Args:
-        csp: CSP 객체.
         csp_type (str): CSP 유형.
         customer (str): 고객명.
         session_username (str): 현재 세션의 사용자 이름.
+        incremental (bool, optional): 변경된 서버만 수집할지 여부 (KTC, NHN). 기본값은 False.
+        **kwargs: CSPFactory.get_csp 에 전달할 인증 정보와 존.
     """
-    create_day_in_file, create_time_in_file = get_current_datetime()
-    data_to_excel(csp.get_inventory(), csp_type=csp_type, customer=customer,
-                  path=f'{session_username}', cday=create_day_in_file)
-    write_to_file(type='API', customer=customer, csp_type=csp_type,
-                  path=f'{session_username}', cday=create_day_in_file, ctime=create_time_in_file)
-    st.success(f'{customer} 등록 완료. 인벤토리에서 확인하세요')
+    get_job_runner().submit(session_username, customer, csp_type, incremental=incremental, **kwargs)
+    st.success(f'{customer} 수집 작업을 등록했습니다. 아래 작업 현황에서 진행 상황을 확인하세요')
+
+
+def show_jobs(session_username):
+    """
+    사용자의 최근 수집 작업 현황을 보여주는 함수. 새로고침 버튼으로 상태를 다시 조회합니다.
+
+    Args:
+        session_username (str): 현재 세션의 사용자 이름.
+    """
+    jobs = get_job_runner().store.list_jobs(session_username)
+    if not jobs:
+        return
+    st.subheader('작업 현황')
+    st.button('새로고침', key='jobs_refresh')
+    status_names = {'queued': '대기', 'running': '진행 중', 'done': '완료', 'failed': '실패'}
+    stage_names = {'auth': '인증', 'fetch': '수집', 'normalize': '정규화', 'write': '저장'}
+    st.dataframe(pd.DataFrame([{
+        '고객사': job['customer'],
+        'CSP': job['csp_type'],
+        '상태': status_names.get(job['status'], job['status']),
+        '단계': stage_names.get(job['stage'], job['stage']),
+        'VM 수': job['count'],
+        '파일': job['file'],
+        '오류': job['error'],
+        '등록 시각': datetime.fromtimestamp(job['created_at']).strftime('%Y-%m-%d %H:%M:%S'),
+    } for job in jobs]), hide_index=True, use_container_width=True)
+
+    measured = [job for job in jobs if job['metrics']]
+    if measured:
+        job = st.selectbox('API 호출 분석', options=measured, key='jobs_metrics',
+                           format_func=lambda job: f"{job['customer']} ({job['csp_type']}) "
+                                                   f"{datetime.fromtimestamp(job['created_at']):%m-%d %H:%M}")
+        st.dataframe(pd.DataFrame([{
+            'CSP': row['provider'],
+            '엔드포인트': f"{row['method']} {row['endpoint']}",
+            '호출 수': row['calls'],
+            '소요 시간(초)': round(row['seconds'], 3),
+            '최대(초)': round(row['max_seconds'], 3),
+            '응답 KB': round(row['bytes'] / 1024, 1),
+            '재시도': row['retries'],
+            '항목 수': row['records'],
+            '오류': row['errors'],
+        } for row in job['metrics']]), hide_index=True, use_container_width=True)
 
 
 def manage_inventory(session: str):
@@ -71,13 +149,13 @@ def manage_inventory(session: str):
 
         사용자는 고객을 선택하고 CSP 유형에 따라 API 키 또는 사용자 정보를 입력하여
         인벤토리를 수집할 수 있습니다. 수집된 데이터는 엑셀 파일로 저장되고,
-        기록 파일에도 해당 정보가 기록됩니다.
+        인벤토리 카탈로그에도 해당 정보가 기록됩니다.
 
         Args:
             session (str): 현재 세션의 사용자 이름.
         """
     session_username = session
-    customers = os.listdir(f'files/{session_username}_custom')
+    customers = get_catalog().customers(session_username)
     auto, manual, remote_comm = st.tabs(['자동', '수동', '명령어 수집'])
     with auto:
         if customers:
@@ -90,10 +168,8 @@ def manage_inventory(session: str):
                 secret_key = st.text_input('Secret Key', placeholder='API secret Key', type="password").strip()
                 if st.button(label='API를 통한 수집', key='ncpb'):
                     if all([name, access_key, secret_key]):
-                        with st.spinner('진행 중'):
-                            csp = CSPFactory.get_csp(csp_type=csp_dict[csp_type], access_key=access_key,
-                                                     secret_key=secret_key)
-                            handle_inventory_save(csp, csp_dict[csp_type], name, session_username)
+                        handle_inventory_save(csp_dict[csp_type], name, session_username,
+                                              access_key=access_key, secret_key=secret_key)
                     else:
                         st.warning('모든 입력을 완료해주세요.')
 
@@ -107,12 +183,11 @@ def manage_inventory(session: str):
                 tenantid = st.text_input('Tenant ID', placeholder='API endpoint tenantid').strip()
                 username = st.text_input('Username', placeholder='root@mail.com').strip()
                 password = st.text_input('Password', placeholder='API endpoint password', type="password").strip()
+                incremental = st.checkbox('변경분만 수집', key='nhninc', help='지난 수집 이후 변경된 서버만 받아 병합합니다')
                 if st.button(label='API를 통한 수집', key='nhnb'):
                     if all([name, tenantid, username, password]):
-                        with st.spinner('진행 중'):
-                            csp = CSPFactory.get_csp(csp_type=csp_dict[csp_type], tenantid=tenantid, username=username,
-                                                     password=password, zone=zone)
-                            handle_inventory_save(csp, csp_dict[csp_type], name, session_username)
+                        handle_inventory_save(csp_dict[csp_type], name, session_username, incremental,
+                                              tenantid=tenantid, username=username, password=password, zone=zone)
                     else:
                         st.warning('모든 입력을 완료해주세요.')
 
@@ -123,19 +198,19 @@ def manage_inventory(session: str):
                     zone = st.radio(label='Zone', options=zones, key='ktczone', horizontal=True)
                 username = st.text_input('Username', placeholder='root@mail.com').strip()
                 password = st.text_input('Password', placeholder='root\'s password', type="password").strip()
+                incremental = st.checkbox('변경분만 수집', key='ktcinc', help='지난 수집 이후 변경된 서버만 받아 병합합니다')
                 if st.button(label='API를 통한 수집', key='ktcb'):
                     if all([name, username, password]):
-                        with st.spinner('진행 중'):
-                            if zone:
-                                csp = CSPFactory.get_csp(csp_dict[csp_type], username=username, password=password,
-                                                         zone=zone)
-                            else:
-                                csp = CSPFactory.get_csp(csp_dict[csp_type], username=username, password=password)
-                            handle_inventory_save(csp, csp_dict[csp_type], name, session_username)
+                        if zone:
+                            handle_inventory_save(csp_dict[csp_type], name, session_username, incremental,
+                                                  username=username, password=password, zone=zone)
+                        else:
+                            handle_inventory_save(csp_dict[csp_type], name, session_username, incremental,
+                                                  username=username, password=password)
                     else:
                         st.warning('모든 입력을 완료해주세요.')
 
-
+            show_jobs(session_username)
         else:
             st.warning('등록된 고객이 없습니다.')
     with manual:
@@ -143,9 +218,7 @@ def manage_inventory(session: str):
             name = st.selectbox(label='고객명', options=customers, key='manual')
             col1, col2 = st.columns([1, 6])
             with col1:
-                with open('files/template.xlsx', 'rb') as file:
-                    file_data = file.read()
-                st.download_button(label='템플릿 다운로드', data=file_data, file_name='files/template.xlsx',
+                st.download_button(label='템플릿 다운로드', data=template_bytes(), file_name='files/template.xlsx',
                                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
             with col2:
                 upload_template = st.file_uploader(label='파일 업로드', type='xlsx')
@@ -155,9 +228,17 @@ def manage_inventory(session: str):
                         save_path = os.path.join(f"files/{session_username}_files", upload_template.name)
                         with open(save_path, "wb") as f:
                             f.write(upload_template.getbuffer())
-                        with open(f'files/{session_username}_custom/{name}', 'a+', encoding='utf-8') as f:
-                            create_day_in_file, create_time_in_file = get_current_datetime()
-                            f.write(f'{upload_template.name},{create_day_in_file}{create_time_in_file}\n')
+                        count = None
+                        try:
+                            frame = read_excel_frame(save_path)
+                            count = len(frame)
+                            write_sidecar(save_path, frame)
+                        except Exception as e:
+                            st.warning(f'대시보드용 사이드카 생성 중 오류 발생: {str(e)}')
+                        create_day_in_file, create_time_in_file = get_current_datetime()
+                        write_to_file(type='manual', csp_type='', customer=name, path=session_username,
+                                      cday=create_day_in_file, ctime=create_time_in_file,
+                                      filename=upload_template.name, count=count, catalog=get_catalog())
                         st.success(f'{name} 등록 완료. 인벤토리에서 확인하세요')
                 else:
                     st.warning('파일을 업로드 해주세요.')
@@ -169,33 +250,31 @@ def manage_inventory(session: str):
                                 placeholder='고객사를 선택해주세요')
             if name:
                 try:
-                    with open(f'files/{session_username}_custom/{name}', 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        if len(lines) != 0:
-                            flines = lines[-1].strip()
-                            filename = flines.split(',')[0]
-                            df = read_customer_file(filename=filename, userid=session_username)
-                            command_df = st.data_editor(df)
-                            if st.button(label='추출'):
-                                with st.spinner('진행 중'):
-                                    command_df_dict = command_df[
-                                        (command_df['user'] != '') & (command_df['password'] != '')].to_dict(
-                                        orient='records')
-                                    command_df_dict.append({'filename': filename})
-                                    command_df_dict.append({'user': session_username})
-                                    with open(f'files/{session_username}_files/{name}_remote_comm.json', 'w') as f:
-                                        f.write(json.dumps(command_df_dict))
-                                    st.success('추출 완료')
-                                    with open(f'files/{session_username}_files/{name}_remote_comm.json', 'r') as file:
-                                        file_data = file.read()
-                                    st.download_button(label='추출파일 다운로드', data=file_data, file_name='remote_comm.json',
-                                                       mime="application/json")
-                            with open('files/inventory_remote.exe', "rb") as f:
-                                binary_file = f.read()
-                            st.download_button(label="실행기", data=binary_file, file_name="inventory_remote.exe",
-                                               mime="application/octet-stream")
-                        else:
-                            st.warning('등록된 인벤토리가 없습니다.')
+                    snapshot = get_catalog().latest(session_username, name)
+                    if snapshot:
+                        filename = snapshot['file']
+                        df = read_customer_file(filename=filename, userid=session_username)
+                        command_df = st.data_editor(df)
+                        if st.button(label='추출'):
+                            with st.spinner('진행 중'):
+                                command_df_dict = command_df[
+                                    (command_df['user'] != '') & (command_df['password'] != '')].to_dict(
+                                    orient='records')
+                                command_df_dict.append({'filename': filename})
+                                command_df_dict.append({'user': session_username})
+                                with open(f'files/{session_username}_files/{name}_remote_comm.json', 'w') as f:
+                                    f.write(json.dumps(command_df_dict))
+                                st.success('추출 완료')
+                                with open(f'files/{session_username}_files/{name}_remote_comm.json', 'r') as file:
+                                    file_data = file.read()
+                                st.download_button(label='추출파일 다운로드', data=file_data, file_name='remote_comm.json',
+                                                   mime="application/json")
+                        with open('files/inventory_remote.exe', "rb") as f:
+                            binary_file = f.read()
+                        st.download_button(label="실행기", data=binary_file, file_name="inventory_remote.exe",
+                                           mime="application/octet-stream")
+                    else:
+                        st.warning('등록된 인벤토리가 없습니다.')
                 except Exception as e:
                     st.error(f'오류 발생: {str(e)}')
         else:
@@ -216,7 +295,7 @@ def manage_customer(session: str):
     create, delete = st.tabs(['등록', '삭제'])
     with create:
         customer = st.text_input('고객사명', key='customer').strip()
-        if customer and os.path.exists(f'files/{session_username}_custom/{customer}'):
+        if customer and get_catalog().has_customer(session_username, customer):
             st.warning(f'{customer}은 존재합니다.')
         if st.button(label='등록', key='create'):
             if not customer:  # 고객사명이 공백일 경우
@@ -224,19 +303,18 @@ def manage_customer(session: str):
             else:
                 try:
                     with st.spinner('진행 중'):
-                        with open(f'files/{session_username}_custom/{customer}', 'w') as f:
-                            pass
+                        get_catalog().add_customer(session_username, customer)
                         st.success(f'{customer} 고객 등록 완료')
                 except Exception as e:
                     st.error(f'오류 발생: {str(e)}')
 
     with delete:
-        customers = os.listdir(f'files/{session_username}_custom')
+        customers = get_catalog().customers(session_username)
         if customers:
             selected = st.selectbox(label='고객명', options=customers, key='delete')
             if st.button('삭제'):
                 try:
-                    os.remove(f'files/{session_username}_custom/{selected}')
+                    get_catalog().delete_customer(session_username, selected)
                     st.rerun()
                 except Exception as e:
                     st.error(f'오류 발생: {str(e)}')
@@ -257,29 +335,23 @@ def front(session: str):
     session_username = session
 
     try:
-        if not os.path.exists(f"files/{session_username}_custom"):
-            os.makedirs(f"files/{session_username}_custom")
         if not os.path.exists(f"files/{session_username}_files"):
             os.makedirs(f"files/{session_username}_files")
     except Exception as e:
         st.error(f'디렉토리 생성 중 오류 발생: {str(e)}')
         return
 
-    customers = os.listdir(f'files/{session_username}_custom')
+    try:
+        latest = get_catalog().latest_all(session_username)
+    except Exception as e:
+        st.error(f'카탈로그 조회 중 오류 발생: {str(e)}')
+        return
+    customers = list(latest)
     df = None
     if customers:
         options = st.multiselect(options=customers, label='고객사 선택', default=customers, placeholder='고객사를 선택하세요.', )
         for customer in options:
-            filename = None
-            try:
-                with open(f'files/{session_username}_custom/{customer}', 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    if len(lines) != 0:
-                        flines = lines[-1].strip()
-                        filename = flines.split(',')[0]
-            except Exception as e:
-                st.error(f'파일 읽기 중 오류 발생: {str(e)}')
-                continue
+            filename = latest[customer]['file'] if latest[customer] else None
 
             if filename is not None and 'xlsx' in filename:
                 userid = f'{session_username}'
@@ -349,6 +421,14 @@ if st.session_state['authentication_status'] and st.session_state['logout'] is N
                                                       }
                                                       )
 
+    # GUI 원격 업데이트 도구는 files/{user}_custom/{customer} 기록 파일에 새 파일을 추가하므로
+    # 디렉토리를 유지하고, 화면을 그릴 때마다 새로 추가된 줄을 카탈로그로 가져옴
+    try:
+        os.makedirs(LEGACY_DIR.format(user=session_username), exist_ok=True)
+        get_catalog().sync_legacy(session_username)
+    except Exception as e:
+        st.error(f'고객 기록 파일 동기화 중 오류 발생: {str(e)}')
+
     # 선택된 메뉴에 따른 화면 표시
     if st.session_state['menu_choice'] == '인벤토리':
         front(session=session_username)
@@ -0,0 +1,193 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+import metrics
+import rate_limit
+
+# 모든 CSP 클라이언트가 공유하는 HTTP 세션 설정
+# pool_connections: 캐시할 호스트별 커넥션 풀 개수
+# pool_maxsize: 호스트당 최대 커넥션 수 (동시 수집 시 커넥션 예산)
+# timeout: (connect, read) 초 단위 기본 타임아웃
+# keep_alive: False 이면 요청마다 커넥션을 닫음
+# retries: 429/5xx 또는 연결 오류 시 최대 재시도 횟수
+# backoff_base, backoff_max: 지수 백오프 기본/최대 대기 시간(초)
+DEFAULT_CONFIG = {
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+    'pool_block': True,
+    'timeout': (5, 60),
+    'keep_alive': True,
+    'retries': 4,
+    'backoff_base': 0.5,
+    'backoff_max': 30,
+}
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_config = dict(DEFAULT_CONFIG)
+_session = None
+_lock = threading.Lock()
+
+
+def configure(**kwargs):
+    """
+    공유 세션 설정을 변경하는 함수. 변경 후 다음 요청부터 새 세션이 사용됩니다.
+
+    Args:
+        **kwargs: DEFAULT_CONFIG 에 정의된 키 (pool_connections, pool_maxsize, pool_block, timeout, keep_alive).
+
+    Raises:
+        ValueError: 알 수 없는 설정 키가 주어졌을 때 발생.
+    """
+    global _session
+    unknown = set(kwargs) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown session option: {', '.join(sorted(unknown))}")
+    with _lock:
+        _config.update(kwargs)
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_option(name):
+    """
+    현재 공유 세션 설정 값을 반환하는 함수.
+
+    Args:
+        name (str): 설정 키.
+
+    Returns:
+        object: 설정 값.
+    """
+    return _config[name]
+
+
+def _build_session():
+    """
+    커넥션 풀이 설정된 requests 세션을 생성하는 헬퍼 함수.
+
+    Returns:
+        requests.Session: 설정이 적용된 세션.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_config['pool_connections'],
+                          pool_maxsize=_config['pool_maxsize'],
+                          pool_block=_config['pool_block'])
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not _config['keep_alive']:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def get_session():
+    """
+    공유 세션을 반환하는 함수. 처음 호출될 때 생성됩니다.
+
+    Returns:
+        requests.Session: 모든 CSP 클라이언트가 공유하는 세션.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def retry_delay(attempt, retry_after=None):
+    """
+    재시도 전 대기 시간을 계산하는 함수.
+    Retry-After 헤더가 있으면 그 값을 따르고, 없으면 지터가 섞인 지수 백오프를 사용합니다.
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 순번.
+        retry_after (str, optional): Retry-After 헤더 값 (초 또는 HTTP 날짜).
+
+    Returns:
+        float: 대기 시간(초).
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), _config['backoff_max'])
+        except ValueError:
+            try:
+                wait = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                return min(max(wait, 0), _config['backoff_max'])
+            except (TypeError, ValueError):
+                pass
+    return random.uniform(0, min(_config['backoff_max'], _config['backoff_base'] * 2 ** attempt))
+
+
+def request(method, url, provider=None, **kwargs):
+    """
+    공유 세션으로 HTTP 요청을 보내는 함수. timeout 이 없으면 기본 타임아웃을 적용합니다.
+
+    provider 가 주어지면 해당 CSP 의 공유 토큰 버킷으로 호출 속도를 제한합니다.
+    429/5xx 응답과 연결 오류는 Retry-After 또는 지터 지수 백오프에 따라 재시도하고,
+    재시도 횟수를 모두 쓰면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킵니다.
+    호출마다 소요 시간, 상태, 응답 바이트, 재시도 수를 metrics.registry 에 기록하고,
+    기록은 response.metrics_event 로 남깁니다.
+
+    Args:
+        method (str): HTTP 메서드.
+        url (str): 요청 URL.
+        provider (str, optional): 호출 한도를 적용할 CSP 이름 (예: 'KTC', 'NHN', 'NCP').
+        **kwargs: requests 에 전달할 추가 인자.
+
+    Returns:
+        requests.Response: 응답 객체.
+    """
+    kwargs.setdefault('timeout', _config['timeout'])
+    bucket = rate_limit.get_bucket(provider) if provider else None
+    retries = _config['retries']
+    started = time.perf_counter()
+
+    for attempt in range(retries + 1):
+        if bucket:
+            bucket.acquire()
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                metrics.registry.record(provider, method, url, 'error', time.perf_counter() - started,
+                                        retries=attempt)
+                raise
+            time.sleep(retry_delay(attempt))
+            continue
+        if response.status_code not in RETRY_STATUS or attempt == retries:
+            response.metrics_event = metrics.registry.record(provider, method, url, response.status_code,
+                                                             time.perf_counter() - started,
+                                                             len(response.content), attempt)
+            return response
+        time.sleep(retry_delay(attempt, response.headers.get('Retry-After')))
+
+
+def get(url, **kwargs):
+    """
+    공유 세션으로 GET 요청을 보내는 함수.
+    """
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    """
+    공유 세션으로 POST 요청을 보내는 함수.
+    """
+    return request('POST', url, **kwargs)
+
+
+def close():
+    """
+    공유 세션과 커넥션 풀을 닫는 함수.
+    """
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import token_cache
+from atomic_file import atomic_write
+
+SNAPSHOT_DIR = 'files/cache/snapshots'
+CLOCK_SKEW = 120  # 클라이언트/서버 시계 차이를 흡수하기 위해 changes-since 를 앞당기는 시간(초)
+FULL_REFRESH_AGE = 24 * 3600  # 이 시간이 지난 스냅샷은 전체 수집으로 다시 만듦(초)
+DELETED_SERVER_STATUS = {'DELETED', 'SOFT_DELETED'}
+DELETED_VOLUME_STATUS = {'deleted', 'deleting'}
+
+
+class SnapshotStore:
+    """
+    계정별 서버/볼륨 스냅샷과 마지막 수집 시각을 디스크에 보관하는 클래스.
+
+    Args:
+        key (str): 계정을 구분하는 키 (token_cache.cache_key 로 만든 해시).
+        snapshot_dir (str, optional): 스냅샷 디렉토리. 기본값은 'files/cache/snapshots'.
+    """
+
+    def __init__(self, key, snapshot_dir=SNAPSHOT_DIR):
+        self.path = os.path.join(snapshot_dir, f'{key}.json')
+
+    def load(self):
+        """
+        저장된 스냅샷을 반환하는 메서드.
+
+        Returns:
+            dict | None: {'collected_at', 'full_at', 'servers', 'volumes'} 사전. 없으면 None.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, snapshot):
+        """
+        스냅샷을 저장하는 메서드. 임시 파일에 쓴 뒤 교체합니다.
+
+        Args:
+            snapshot (dict): 저장할 스냅샷.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with atomic_write(self.path) as f:
+            json.dump(snapshot, f)
+
+    def clear(self):
+        """
+        스냅샷을 삭제하여 다음 수집이 전체 수집이 되도록 하는 메서드.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _changes_since(collected_at):
+    """
+    마지막 수집 시각에서 CLOCK_SKEW 만큼 앞당긴 changes-since 값(ISO 8601, UTC)을 만드는 함수.
+    """
+    return datetime.fromtimestamp(collected_at - CLOCK_SKEW, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def merge_changes(snapshot, servers):
+    """
+    변경된 서버를 스냅샷에 반영하는 함수. 삭제된 서버(status DELETED, SOFT_DELETED)는 스냅샷에서 제거합니다.
+
+    Args:
+        snapshot (dict): ID 를 키로 하는 'servers' 사전을 가진 스냅샷.
+        servers (list): changes-since 로 받은 서버 리스트.
+
+    Returns:
+        dict: 변경이 반영된 스냅샷 (같은 객체).
+    """
+    for server in servers:
+        if server.get('status') in DELETED_SERVER_STATUS:
+            snapshot['servers'].pop(server['id'], None)
+        else:
+            snapshot['servers'][server['id']] = server
+    return snapshot
+
+
+def _volume_map(pages):
+    """
+    볼륨 페이지들을 ID 를 키로 하는 사전으로 모으는 헬퍼 함수. 삭제 중이거나 삭제된 볼륨은 제외합니다.
+    """
+    return {volume['id']: volume for page in pages for volume in page
+            if volume.get('status') not in DELETED_VOLUME_STATUS}
+
+
+def sync_snapshot(client, store=None):
+    """
+    OpenStack 기반 클라이언트(KTCAPI, NHNAPI)의 서버/볼륨 스냅샷을 최신 상태로 만드는 함수.
+
+    스냅샷이 없거나 FULL_REFRESH_AGE 보다 오래되었으면 전체를 수집하고,
+    그렇지 않으면 서버는 changes-since 로 변경분만 받아 병합합니다.
+    Cinder 는 changes-since 를 릴리스에 따라 무시하거나 거부하고 삭제된 볼륨을 돌려주지 않으므로,
+    볼륨은 매번 전체 목록을 다시 받아 스냅샷을 교체합니다 (분리/삭제된 볼륨이 남지 않음).
+
+    Args:
+        client (KTCAPI | NHNAPI): iter_instance_pages / iter_blockstorage_pages 를 제공하는 클라이언트.
+        store (SnapshotStore, optional): 스냅샷 저장소. 기본값은 client.snapshot_key 로 만든 저장소.
+
+    Returns:
+        tuple: (서버 리스트, 볼륨 리스트).
+    """
+    store = store or SnapshotStore(client.snapshot_key)
+    snapshot = store.load()
+    started = time.time()
+    client.get_token()
+
+    if snapshot is None or started - snapshot.get('full_at', 0) > FULL_REFRESH_AGE:
+        snapshot = {
+            'full_at': started,
+            'servers': {server['id']: server for page in client.iter_instance_pages() for server in page},
+            'volumes': _volume_map(client.iter_blockstorage_pages()),
+        }
+    else:
+        params = {'changes-since': _changes_since(snapshot['collected_at'])}
+        results = client.fetch_parallel(
+            servers=lambda: [server for page in client.iter_instance_pages(params=params) for server in page],
+            volumes=lambda: _volume_map(client.iter_blockstorage_pages()))
+        merge_changes(snapshot, results['servers'])
+        snapshot['volumes'] = results['volumes']
+
+    snapshot['collected_at'] = started
+    store.save(snapshot)
+    return list(snapshot['servers'].values()), list(snapshot['volumes'].values())
+
+
+def snapshot_key(*parts):
+    """
+    계정 식별 값으로 스냅샷 키를 만드는 함수. 비밀번호는 포함하지 않습니다.
+
+    Args:
+        *parts (str): 엔드포인트, 사용자 이름, 테넌트 등 계정을 구분하는 값.
+
+    Returns:
+        str: 해시 문자열.
+    """
+    return token_cache.cache_key('snapshot', *parts)
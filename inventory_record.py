@@ -0,0 +1,95 @@
+class InventoryRecord:
+    """
+    VM 한 대의 인벤토리 정보를 담는 레코드 클래스.
+    모든 CSP 클라이언트가 같은 형식으로 반환하고, 엑셀 작성기와 대시보드가 그대로 사용합니다.
+    __slots__ 로 VM 당 메모리와 할당을 줄였고, 볼륨은 부트/추가 HDD/SSD 용량(GB)으로 미리 합산해 둡니다.
+
+    Args:
+        zone (str): 가용 영역 (엑셀 Zone 열).
+        name (str): VM 이름.
+        vcpus (int): vCPU 수.
+        ram_gb (int): 메모리 크기(GB).
+        boot_hdd (int): 부트 HDD 용량(GB). 없으면 0.
+        boot_ssd (int): 부트 SSD 용량(GB). 없으면 0.
+        ext_hdd (int): 추가 HDD 용량 합계(GB). 없으면 0.
+        ext_ssd (int): 추가 SSD 용량 합계(GB). 없으면 0.
+        public_ip (str): 공인 IP. 없으면 None.
+        private_ip (str): 사설 IP. 없으면 None.
+        created (str): 생성 날짜 (YYYY-MM-DD).
+        state (str): VM 상태 ('RUNNING' 또는 'STOP').
+        region (str, optional): 수집한 존/리전 (예: KTC 'd1'). 기본값은 None.
+    """
+
+    __slots__ = ('zone', 'name', 'vcpus', 'ram_gb', 'boot_hdd', 'boot_ssd', 'ext_hdd', 'ext_ssd',
+                 'public_ip', 'private_ip', 'created', 'state', 'region')
+
+    def __init__(self, zone, name, vcpus, ram_gb, boot_hdd=0, boot_ssd=0, ext_hdd=0, ext_ssd=0,
+                 public_ip=None, private_ip=None, created=None, state=None, region=None):
+        self.zone = zone
+        self.name = name
+        self.vcpus = _to_int(vcpus)
+        self.ram_gb = _to_int(ram_gb)
+        self.boot_hdd = boot_hdd
+        self.boot_ssd = boot_ssd
+        self.ext_hdd = ext_hdd
+        self.ext_ssd = ext_ssd
+        self.public_ip = public_ip
+        self.private_ip = private_ip
+        self.created = created
+        self.state = state
+        self.region = region
+
+    @classmethod
+    def from_volumes(cls, volumes, **fields):
+        """
+        볼륨 정보 리스트를 부트/추가 HDD/SSD 용량으로 합산하여 레코드를 만드는 메서드.
+        HDD 가 아닌 볼륨(Unknown 포함)은 SSD 로 계산합니다.
+
+        Args:
+            volumes (list): {'volume_type', 'size', 'bootable'} 볼륨 정보 리스트.
+            **fields: 볼륨 외 나머지 레코드 필드.
+
+        Returns:
+            InventoryRecord: 새 레코드.
+        """
+        boot_hdd = boot_ssd = ext_hdd = ext_ssd = 0
+        for volume in volumes:
+            size = _to_int(volume['size']) or 0
+            if volume['bootable']:
+                if volume['volume_type'] == 'HDD':
+                    boot_hdd = size
+                else:
+                    boot_ssd = size
+            elif volume['volume_type'] == 'HDD':
+                ext_hdd += size
+            else:
+                ext_ssd += size
+        return cls(boot_hdd=boot_hdd, boot_ssd=boot_ssd, ext_hdd=ext_hdd, ext_ssd=ext_ssd, **fields)
+
+    def as_dict(self):
+        """
+        레코드를 사전으로 변환하는 메서드.
+
+        Returns:
+            dict: 필드 이름을 키로 하는 사전.
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        if not isinstance(other, InventoryRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'InventoryRecord({fields})'
+
+
+def _to_int(value):
+    """
+    숫자 문자열을 정수로 변환하는 헬퍼 함수. 변환할 수 없으면 원래 값을 반환합니다.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
@@ -0,0 +1,240 @@
+import json
+import os
+import socket
+import sqlite3
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import metrics
+from client_pool import ClientPool
+from data_to_excel import data_to_excel, write_to_file
+
+JOB_DB = 'files/jobs.db'
+DEFAULT_MAX_WORKERS = 4
+STAGES = ('auth', 'fetch', 'normalize', 'write')
+ACTIVE_STATUS = ('queued', 'running')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    user TEXT NOT NULL,
+    customer TEXT NOT NULL,
+    csp_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    count INTEGER,
+    file TEXT,
+    error TEXT,
+    metrics TEXT,
+    owner TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_user_created ON jobs (user, created_at);
+"""
+
+
+class JobStore:
+    """
+    수집 작업 상태를 SQLite 에 보관하는 클래스. 작업 스레드마다 연결을 새로 열어 사용합니다.
+
+    Args:
+        path (str, optional): 데이터베이스 파일 경로. 기본값은 'files/jobs.db'.
+    """
+
+    COLUMNS = ('id', 'user', 'customer', 'csp_type', 'status', 'stage', 'count', 'file', 'error', 'metrics',
+               'owner', 'created_at', 'updated_at')
+
+    def __init__(self, path=JOB_DB):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'metrics' not in columns:  # metrics 열이 없던 이전 작업 테이블
+                conn.execute('ALTER TABLE jobs ADD COLUMN metrics TEXT')
+            if 'owner' not in columns:  # owner 열이 없던 이전 작업 테이블
+                conn.execute('ALTER TABLE jobs ADD COLUMN owner TEXT')
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def create(self, user, customer, csp_type):
+        """
+        대기(queued) 상태의 작업을 추가하는 메서드. 작업을 실행할 현재 프로세스(owner_id)를 함께 기록합니다.
+
+        Returns:
+            str: 작업 ID.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('INSERT INTO jobs (id, user, customer, csp_type, status, owner, created_at, updated_at) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                         (job_id, user, customer, csp_type, 'queued', owner_id(), now, now))
+        return job_id
+
+    def update(self, job_id, **fields):
+        """
+        작업의 상태, 단계, 결과 항목을 갱신하는 메서드.
+
+        Args:
+            job_id (str): 작업 ID.
+            **fields: status, stage, count, file, error, metrics 중 갱신할 값.
+        """
+        fields['updated_at'] = time.time()
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        with self._connect() as conn:
+            conn.execute(f'UPDATE jobs SET {assignments} WHERE id = ?', (*fields.values(), job_id))
+
+    def _to_job(self, row):
+        job = dict(zip(self.COLUMNS, row))
+        job['metrics'] = json.loads(job['metrics']) if job['metrics'] else []
+        return job
+
+    def get(self, job_id):
+        """
+        작업 하나를 반환하는 메서드.
+
+        Returns:
+            dict | None: 작업 사전 (metrics 는 metrics.summarize 결과 리스트). 없으면 None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(self, user, limit=20):
+        """
+        사용자의 최근 작업을 최신순으로 반환하는 메서드.
+
+        Returns:
+            list: 작업 사전 리스트.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE user = ? "
+                                f"ORDER BY created_at DESC LIMIT ?", (user, limit)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def fail_interrupted(self):
+        """
+        이미 종료된 프로세스가 끝내지 못한 대기/실행 중 작업을 실패로 표시하는 메서드.
+        같은 DB 를 쓰는 다른 Streamlit 워커처럼 살아 있는 프로세스의 작업과 다른 호스트의 작업은 건드리지 않으며,
+        owner 가 없는 이전 작업은 종료된 것으로 봅니다.
+        """
+        with self._connect() as conn:
+            rows = conn.execute('SELECT id, owner FROM jobs WHERE status IN (?, ?)', ACTIVE_STATUS).fetchall()
+            now = time.time()
+            stale = [(now, job_id) for job_id, owner in rows if not _owner_alive(owner)]
+            conn.executemany("UPDATE jobs SET status = 'failed', error = 'interrupted', updated_at = ? WHERE id = ?",
+                             stale)
+
+
+def owner_id():
+    """
+    작업을 실행하는 프로세스를 구분하는 값('호스트명:pid')을 반환하는 함수.
+    """
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _owner_alive(owner):
+    """
+    작업 owner 프로세스가 살아 있는지 확인하는 헬퍼 함수. 다른 호스트의 프로세스는 확인할 수 없으므로 살아 있다고 봅니다.
+    """
+    if not owner:
+        return False
+    host, _, pid = owner.rpartition(':')
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # 다른 사용자의 살아 있는 프로세스
+        return True
+    return True
+
+
+class JobRunner:
+    """
+    API 수집을 백그라운드 워커 풀에서 실행하는 클래스.
+
+    작업은 auth, fetch, normalize, write 단계 순서로 진행되며, 단계가 바뀔 때마다 JobStore 에 기록되므로
+    화면은 작업 상태를 조회(폴링)하기만 하면 됩니다. 여러 고객사의 작업이 동시에 실행될 수 있습니다.
+    작업이 끝나면 엔드포인트별 API 호출 요약을 작업에 저장하고, 누적 지표를 METRICS_DIR 로 내보냅니다.
+
+    Args:
+        store (JobStore, optional): 작업 저장소. 기본값은 JobStore().
+        pool (ClientPool, optional): CSP 클라이언트 풀. 기본값은 ClientPool().
+        max_workers (int, optional): 동시 작업 수. 기본값은 4.
+    """
+
+    def __init__(self, store=None, pool=None, max_workers=DEFAULT_MAX_WORKERS):
+        self.store = store or JobStore()
+        self.pool = pool or ClientPool()
+        self.store.fail_interrupted()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='inventory-job')
+
+    def submit(self, user, customer, csp_type, incremental=False, **kwargs):
+        """
+        수집 작업을 등록하고 바로 반환하는 메서드.
+
+        Args:
+            user (str): 세션 사용자 이름.
+            customer (str): 고객사명.
+            csp_type (str): CSP 유형.
+            incremental (bool, optional): 변경된 서버만 받아 계정별 스냅샷에 병합할지 여부 (KTC, NHN). 기본값은 False.
+            **kwargs: CSPFactory.get_csp 에 전달할 인증 정보와 존.
+
+        Returns:
+            str: 작업 ID.
+        """
+        job_id = self.store.create(user, customer, csp_type)
+        self._executor.submit(self._run, job_id, user, customer, csp_type, incremental, kwargs)
+        return job_id
+
+    def _run(self, job_id, user, customer, csp_type, incremental, kwargs):
+        """
+        작업 하나를 단계별로 실행하는 메서드. 실패는 작업 상태에 기록합니다.
+        """
+        with metrics.track_run() as events:
+            self._run_stages(job_id, user, customer, csp_type, incremental, kwargs)
+        self.store.update(job_id, metrics=json.dumps(metrics.summarize(events)))
+        metrics.registry.export()
+
+    def _run_stages(self, job_id, user, customer, csp_type, incremental, kwargs):
+        store = self.store
+        try:
+            store.update(job_id, status='running', stage='auth')
+            client = self.pool.get(user, csp_type, **kwargs)
+            if hasattr(client, 'get_token'):
+                client.get_token()
+
+            store.update(job_id, stage='fetch')
+            if incremental:
+                if not hasattr(client, 'get_raw_inventory_incremental'):
+                    raise ValueError(f"{csp_type} 은 증분 수집을 지원하지 않습니다")
+                raw = client.get_raw_inventory_incremental()
+            else:
+                raw = client.get_raw_inventory()
+
+            store.update(job_id, stage='normalize')
+            frame = client.normalize_inventory(raw)
+
+            store.update(job_id, stage='write', count=len(frame))
+            now = datetime.now()
+            cday, ctime = now.strftime("%Y%m%d"), now.strftime("%H%M")
+            data_to_excel(frame, csp_type=csp_type, path=user, cday=cday, customer=customer)
+            write_to_file(type='API', csp_type=csp_type, customer=customer, path=user, cday=cday, ctime=ctime,
+                          count=len(frame))
+            store.update(job_id, status='done', file=f'{customer}-{csp_type}-inventory-{cday}.xlsx')
+        except Exception as e:
+            self.pool.discard(user, csp_type, **kwargs)
+            store.update(job_id, status='failed', error=f'{type(e).__name__}: {e}')
+            traceback.print_exc()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
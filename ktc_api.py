@@ -1,8 +1,18 @@
+import contextvars
 import re
 import json
-import requests
+import http_session
+import incremental
+import metrics
+import normalize
+import token_cache
 from csp_interface import CSPInterface
 import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from inventory_record import InventoryRecord
+from correlation import index_public_ips, index_volumes, join_volumes
+from pagination import DEFAULT_PAGE_SIZE, iter_openstack_pages
 
 
 class KTCAPI(CSPInterface):
@@ -14,8 +24,11 @@ class KTCAPI(CSPInterface):
         password (str): API 인증에 사용할 비밀번호.
         zone (str): 서비스 존(zone) 정보 (예: 'd1', 'd2', 'd3').
         gov (bool): 공공 클라우드 여부 (기본값은 False).
+        response_cache (ResponseCache): 참조 데이터(공인 IP 목록) 응답 캐시. 기본값은 None(미사용).
     """
 
+    PROVIDER = 'KTC'
+    PUBLIC_IP_PARAMS = {'type': 'STATICNAT'}  # 인벤토리에는 Static NAT 공인 IP 만 필요
     BASE_URIS = {
         'gd1': 'https://api.ucloudbiz.olleh.com/gd1',
         'd1': 'https://api.ucloudbiz.olleh.com/d1',
@@ -23,7 +36,7 @@ class KTCAPI(CSPInterface):
         'd3': 'https://api.ucloudbiz.olleh.com/d3'
     }
 
-    def __init__(self, username, password, zone, gov=False):
+    def __init__(self, username, password, zone, gov=False, response_cache=None):
         self.zone = 'gd1' if gov else zone
         self.gov = gov
         self.username = username
@@ -31,11 +44,17 @@ class KTCAPI(CSPInterface):
         self.token = None
         self.token_expiry = 0
         self.project_id = None
+        self.response_cache = response_cache
         self.BASE_URI = self.BASE_URIS.get(self.zone)
+        self.token_key = token_cache.cache_key(self.BASE_URI, self.username, self.password)
+        self.snapshot_key = incremental.snapshot_key(self.BASE_URI, self.username)
 
-    def authenticate(self):
+    def auth_request(self):
         """
-        API 인증을 수행하고, 토큰을 획득하는 메서드.
+        인증 요청 URL 과 본문을 만드는 메서드.
+
+        Returns:
+            tuple: 인증 URL 과 요청 본문 사전.
         """
         URL = f'{self.BASE_URI}/identity/auth/tokens'
         data = {
@@ -58,102 +77,338 @@ class KTCAPI(CSPInterface):
                 }
             }
         }
-        response = requests.post(URL, data=json.dumps(data))
+        return URL, data
+
+    def set_token(self, headers, body):
+        """
+        인증 응답에서 토큰과 프로젝트 ID를 저장하는 메서드.
+
+        Args:
+            headers (dict): 인증 응답 헤더.
+            body (dict): 인증 응답 본문.
+        """
+        self.token = headers['X-Subject-Token']
+        self.project_id = body['token']['project']['id']
+        self.token_expiry = token_cache.parse_expiry(body['token'].get('expires_at'))
+        token_cache.save(self.token_key, {'token': self.token, 'project_id': self.project_id,
+                                          'expires_at': self.token_expiry})
+
+    def load_cached_token(self):
+        """
+        다른 프로세스나 이전 실행이 저장한 유효한 토큰을 불러오는 메서드.
+
+        Returns:
+            bool: 토큰을 불러왔으면 True.
+        """
+        entry = token_cache.load(self.token_key)
+        if entry is None:
+            return False
+        self.token = entry['token']
+        self.project_id = entry['project_id']
+        self.token_expiry = entry['expires_at']
+        return True
+
+    def authenticate(self):
+        """
+        API 인증을 수행하고, 토큰을 획득하는 메서드.
+        """
+        URL, data = self.auth_request()
+        response = http_session.post(URL, provider=self.PROVIDER, data=json.dumps(data))
 
         if response.status_code > 210:
             raise Exception(f"Authentication failed: {response.json()['error']['message']}")
 
-        self.token = response.headers['X-Subject-Token']
-        self.project_id = response.json()['token']['project']['id']
-        self.token_expiry = time.time() + 3600  # 1시간 후 만료
+        self.set_token(response.headers, response.json())
 
     def get_token(self):
         """
-        유효한 토큰을 반환하는 메서드. 만료된 경우 새로 인증을 시도합니다.
+        유효한 토큰을 반환하는 메서드. 만료된 경우 토큰 저장소를 먼저 확인하고, 없으면 새로 인증을 시도합니다.
 
         Returns:
             str: 유효한 인증 토큰.
         """
-        if self.token is None or time.time() >= self.token_expiry:
-            self.authenticate()
+        if self.token is None or time.time() >= self.token_expiry - token_cache.EXPIRY_MARGIN:
+            if not self.load_cached_token():
+                self.authenticate()
         return self.token
 
+    def _send(self, url, params=None, extra_headers=None):
+        """
+        인증 토큰을 붙여 GET 요청을 보내고 응답 객체를 반환하는 헬퍼 메서드.
+        저장된 토큰이 폐기되어 401 이 오면 한 번만 재인증합니다.
+
+        Args:
+            url (str): 요청 URL.
+            params (dict, optional): 쿼리 파라미터.
+            extra_headers (dict, optional): 추가 요청 헤더 (예: If-None-Match).
+
+        Returns:
+            requests.Response: 응답 객체.
+        """
+        headers = {'X-Auth-Token': self.get_token(), 'Content-Type': 'application/json', **(extra_headers or {})}
+        response = http_session.get(url, provider=self.PROVIDER, headers=headers, params=params)
+        if response.status_code == 401:
+            token_cache.invalidate(self.token_key)
+            self.authenticate()
+            headers['X-Auth-Token'] = self.token
+            response = http_session.get(url, provider=self.PROVIDER, headers=headers, params=params)
+        return response
+
+    def _get(self, url, params=None, endpoint=None):
+        """
+        인증 토큰을 붙여 GET 요청을 보내는 헬퍼 메서드.
+
+        Args:
+            url (str): 요청 URL.
+            params (dict, optional): 쿼리 파라미터.
+            endpoint (str, optional): 응답 캐시 엔드포인트 이름. response_cache 가 설정되어 있으면 캐시를 거칩니다.
+
+        Returns:
+            dict: 응답 JSON.
+
+        Raises:
+            Exception: 요청 실패 시 예외를 발생시킵니다.
+        """
+        if self.response_cache and endpoint:
+            return self.response_cache.fetch(self.token_key, endpoint, url, params,
+                                             lambda extra_headers: self._send(url, params, extra_headers))
+        response = self._send(url, params)
+        if response.status_code > 210:
+            raise Exception(f"Failed to get {url}: {response.status_code} - {response.text}")
+        body = response.json()
+        metrics.observe_response(response, body)
+        return body
+
+    def iter_instance_pages(self, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        인스턴스 세부 정보를 페이지 단위로 가져오는 제너레이터.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+            params (dict, optional): 필터 파라미터 (예: {'changes-since': ...}).
+
+        Yields:
+            list: 한 페이지의 서버 리스트.
+        """
+        URL = f'{self.BASE_URI}/server/servers/detail'
+        yield from iter_openstack_pages(lambda query: self._get(URL, query), 'servers', page_size, params)
+
     def get_instances(self):
         """
-        모든 인스턴스의 세부 정보를 가져오는 메서드.
+        모든 인스턴스의 세부 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
 
         Returns:
             dict: 서버 세부 정보가 포함된 사전.
         """
-        token = self.get_token()
-        URL = f'{self.BASE_URI}/server/servers/detail'
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        response = requests.get(URL, headers=headers).json()
-        return response
+        return {'servers': [server for page in self.iter_instance_pages() for server in page]}
 
     def get_inventory(self):
         """
         인벤토리 정보를 가져와서 반환하는 메서드.
 
         Returns:
-            list: 인벤토리 데이터가 포함된 리스트.
+            list: InventoryRecord 리스트.
         """
-        token = self.get_token()
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        instances = self.get_instances()['servers']
-        volumes = self.get_blockstorage()['volumes']
-        instance_volumes = self.block_filter(instances, volumes)
-        NT_URL = f'{self.BASE_URI}/nc/IpAddress'
-        networks = requests.get(NT_URL, headers=headers).json()['nc_listentpublicipsresponse']['publicips']
+        self.get_token()  # 동시 호출 전에 한 번만 인증
+        results = self.fetch_parallel(instances=self.get_instances,
+                                      volumes=self.get_blockstorage,
+                                      networks=self.get_publicips)
+        instances = results['instances']['servers']
+        volumes = results['volumes']['volumes']
+        public_ips = index_public_ips(self.static_nat_filter(results['networks']))
+        instance_volumes = index_volumes(self._volume_attachments(volumes))
+        return self.build_inventory(instances, instance_volumes, public_ips)
 
-        pubipes = []
+    def get_raw_inventory(self):
+        """
+        정규화 전의 서버, 볼륨, 공인 IP 원본 응답을 가져오는 메서드.
+
+        Returns:
+            dict: normalize.ktc_frame 의 servers, volumes, pubipes 인자 사전.
+        """
+        self.get_token()
+        results = self.fetch_parallel(instances=self.get_instances,
+                                      volumes=self.get_blockstorage,
+                                      networks=self.get_publicips)
+        return {'servers': results['instances']['servers'], 'volumes': results['volumes']['volumes'],
+                'pubipes': self.static_nat_filter(results['networks'])}
+
+    def normalize_inventory(self, raw):
+        """
+        get_raw_inventory 결과를 정규화된 DataFrame 으로 변환하는 메서드. 변환은 normalize 모듈의 벡터 연산으로 처리합니다.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return normalize.ktc_frame(**raw, region=self.zone)
+
+    def get_inventory_frame(self):
+        """
+        인벤토리를 정규화된 DataFrame 으로 반환하는 메서드.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return self.normalize_inventory(self.get_raw_inventory())
+
+    def get_raw_inventory_incremental(self, store=None):
+        """
+        get_raw_inventory 의 증분 버전. 마지막 수집 이후 변경된 서버만 가져와 저장된 스냅샷에 병합하고
+        볼륨은 전체 목록으로 교체합니다. 첫 수집이거나 스냅샷이 오래되었으면 전체를 수집합니다.
+
+        Args:
+            store (incremental.SnapshotStore, optional): 스냅샷 저장소. 기본값은 계정별 저장소.
+
+        Returns:
+            dict: normalize.ktc_frame 의 servers, volumes, pubipes 인자 사전.
+        """
+        self.get_token()
+        results = self.fetch_parallel(snapshot=lambda: incremental.sync_snapshot(self, store),
+                                      networks=self.get_publicips)
+        servers, volumes = results['snapshot']
+        return {'servers': servers, 'volumes': volumes, 'pubipes': self.static_nat_filter(results['networks'])}
+
+    def get_inventory_incremental(self, store=None):
+        """
+        get_raw_inventory_incremental 로 스냅샷을 갱신한 뒤 인벤토리를 반환하는 메서드.
+
+        Args:
+            store (incremental.SnapshotStore, optional): 스냅샷 저장소. 기본값은 계정별 저장소.
+
+        Returns:
+            list: InventoryRecord 리스트.
+        """
+        raw = self.get_raw_inventory_incremental(store)
+        instance_volumes = index_volumes(self._volume_attachments(raw['volumes']))
+        return self.build_inventory(raw['servers'], instance_volumes, index_public_ips(raw['pubipes']))
+
+    def iter_inventory(self, page_size=DEFAULT_PAGE_SIZE):
+        """
+        인벤토리 정보를 서버 페이지 단위로 생성하는 제너레이터.
+        볼륨은 서버-볼륨 연결 정보만 남긴 압축된 인덱스로 먼저 만들고, 서버 페이지는 도착하는 대로 변환합니다.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+
+        Yields:
+            InventoryRecord: 인벤토리 레코드.
+        """
+        self.get_token()
+        public_ips = index_public_ips(self.static_nat_filter(self.get_publicips()))
+        instance_volumes = {}
+        for volumes in self.iter_blockstorage_pages(page_size):
+            index_volumes(self._volume_attachments(volumes), instance_volumes)
+        for instances in self.iter_instance_pages(page_size):
+            yield from self.build_inventory(instances, instance_volumes, public_ips)
+
+    def build_inventory(self, instances, instance_volumes, public_ips):
+        """
+        서버 목록을 볼륨, 공인 IP 정보와 결합하여 인벤토리 레코드로 변환하는 메서드.
+
+        Args:
+            instances (list): 서버 리스트.
+            instance_volumes (dict): index_volumes 가 반환한 인스턴스 ID → 볼륨 리스트 인덱스.
+            public_ips (dict): index_public_ips 가 반환한 사설 IP → 공인 IP 인덱스.
+
+        Returns:
+            list: InventoryRecord 리스트.
+        """
         inventories = []
 
-        for ip in networks:
+        for server in instances:
+            vmguestip = next(iter(server['addresses'].values()))[0]['addr']
+            publicip = public_ips.get(vmguestip)
+
+            inventories.append(InventoryRecord.from_volumes(
+                instance_volumes.get(server['id'], []),
+                zone=server['OS-EXT-AZ:availability_zone'],
+                name=server['name'],
+                vcpus=server['flavor']['vcpus'],
+                ram_gb=server['flavor']['ram'] // 1024,
+                public_ip=publicip,
+                private_ip=vmguestip,
+                created=server['created'][:10],
+                state='RUNNING' if server['OS-EXT-STS:vm_state'] == 'active' else 'STOP',
+                region=self.zone
+            ))
+
+        return inventories
+
+    def get_publicips(self):
+        """
+        공인 IP 정보를 가져오는 메서드. Static NAT 유형만 서버에서 걸러서 받습니다.
+
+        Returns:
+            dict: 공인 IP 데이터가 포함된 사전.
+        """
+        return self._get(f'{self.BASE_URI}/nc/IpAddress', self.PUBLIC_IP_PARAMS, endpoint='publicips')
+
+    @staticmethod
+    def static_nat_filter(networks):
+        """
+        공인 IP 응답에서 STATICNAT 으로 연결된 공인/사설 IP 쌍만 추출하는 메서드.
+
+        Args:
+            networks (dict): get_publicips 응답.
+
+        Returns:
+            list: {'pubip', 'privateip'} 사전 리스트.
+        """
+        pubipes = []
+        for ip in networks['nc_listentpublicipsresponse']['publicips']:
             if ip['type'] == 'STATICNAT':
                 pubipes.append({
                     'pubip': ip['virtualips'][0]['ipaddress'],
                     'privateip': ip['virtualips'][0]['vmguestip']
                 })
+        return pubipes
 
-        for server in instances:
-            publicip = None
-            vmguestip = next(iter(server['addresses'].values()))[0]['addr']
-            for pubip in pubipes:
-                if vmguestip in pubip['privateip']:
-                    publicip = pubip['pubip']
-
-            data = {
-                vmguestip: {
-                    'availability_zone': server['OS-EXT-AZ:availability_zone'],
-                    'vm_state': 'RUNNING' if server['OS-EXT-STS:vm_state'] == 'active' else 'STOP',
-                    'vcpus': server['flavor']['vcpus'],
-                    'ram': server['flavor']['ram'] // 1024,
-                    'name': server['name'],
-                    'created': server['created'][:10],
-                    'publicip': publicip
-                }
-            }
-
-            if server['id'] in instance_volumes:
-                data[vmguestip].update({"volumes": instance_volumes[server['id']]['volumes']})
+    def iter_blockstorage_pages(self, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        블록 스토리지 정보를 페이지 단위로 가져오는 제너레이터.
 
-            inventories.append(data)
+        Args:
+            page_size (int, optional): 페이지 크기.
+            params (dict, optional): 필터 파라미터.
 
-        return inventories
+        Yields:
+            list: 한 페이지의 볼륨 리스트.
+        """
+        self.get_token()  # project_id 확보
+        URL = f'{self.BASE_URI}/volume/{self.project_id}/volumes/detail'
+        yield from iter_openstack_pages(lambda query: self._get(URL, query), 'volumes', page_size, params)
 
     def get_blockstorage(self):
         """
-        블록 스토리지 정보를 가져오는 메서드.
+        블록 스토리지 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
 
         Returns:
             dict: 블록 스토리지 데이터가 포함된 사전.
         """
-        token = self.get_token()
-        URL = f'{self.BASE_URI}/volume/{self.project_id}/volumes/detail'
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        response = requests.get(URL, headers=headers).json()
-        return response
+        return {'volumes': [volume for page in self.iter_blockstorage_pages() for volume in page]}
+
+    @staticmethod
+    def _volume_attachments(volumes):
+        """
+        볼륨 리스트에서 (인스턴스 ID, 볼륨 정보) 쌍을 생성하는 제너레이터.
+
+        Args:
+            volumes (list): 볼륨 리스트.
+
+        Yields:
+            tuple: 인스턴스 ID와 볼륨 정보 사전.
+        """
+        for volume in volumes:
+            volume_type_match = re.findall(r'\b\w*\s?(HDD|SSD)\b', volume["volume_type"])
+            volume_type = volume_type_match[0] if volume_type_match else "Unknown"
+
+            for attachment in volume.get("attachments", []):
+                yield attachment["server_id"], {
+                    "device": attachment["device"],
+                    "volume_type": volume_type,
+                    "size": volume["size"],
+                    "bootable": volume["bootable"] == 'true'
+                }
 
     def block_filter(self, instances, volumes):
         """
@@ -166,27 +421,135 @@ class KTCAPI(CSPInterface):
         Returns:
             dict: 인스턴스 ID를 키로 하고, 각 인스턴스에 속한 볼륨 리스트를 값으로 가지는 사전.
         """
-        instance_volumes = {instance["id"]: {"instance_name": instance["name"], "volumes": []} for instance in
-                            instances}
+        instance_ids = {instance["id"]: instance["name"] for instance in instances}
+        return join_volumes(instance_ids, index_volumes(self._volume_attachments(volumes)))
 
-        for volume in volumes:
-            volume_type_match = re.findall(r'\b\w*\s?(HDD|SSD)\b', volume["volume_type"])
-            volume_type = volume_type_match[0] if volume_type_match else "Unknown"
 
-            volume_info = {
-                "volume_type": volume_type,
-                "size": volume["size"],
-                "bootable": volume["bootable"] == 'true'
-            }
+class KTCMultiZoneAPI(CSPInterface):
+    """
+    여러 KTC 존(zone)을 동시에 수집하기 위한 클래스.
 
-            for attachment in volume.get("attachments", []):
-                instance_id = attachment["server_id"]
-                if instance_id in instance_volumes:
-                    instance_volumes[instance_id]["volumes"].append({
-                        "device": attachment["device"],
-                        "volume_type": volume_info["volume_type"],
-                        "size": volume_info["size"],
-                        "bootable": volume_info["bootable"]
-                    })
-
-        return instance_volumes
+    존마다 하나의 KTCAPI 인스턴스를 두고(존별 1회 인증), 제한된 크기의 워커 풀에서
+    존별 수집을 동시에 수행한 뒤 하나의 인벤토리로 병합합니다.
+
+    Args:
+        username (str): API 인증에 사용할 사용자 이름.
+        password (str): API 인증에 사용할 비밀번호.
+        zones (list): 수집할 존 목록 (예: ['d1', 'd2', 'd3']).
+        max_workers (int, optional): 동시에 수집할 최대 존 수. 기본값은 존 개수.
+        response_cache (ResponseCache, optional): 모든 존이 공유할 응답 캐시.
+    """
+
+    def __init__(self, username, password, zones, max_workers=None, response_cache=None):
+        unknown = [zone for zone in zones if zone not in KTCAPI.BASE_URIS]
+        if unknown:
+            raise ValueError(f"Unknown KTC zone: {', '.join(unknown)}")
+        self.zones = list(dict.fromkeys(zones))
+        self.max_workers = max_workers or len(self.zones)
+        self.clients = {zone: KTCAPI(username, password, zone, response_cache=response_cache) for zone in self.zones}
+
+    def _collect(self, method):
+        """
+        모든 존에 대해 주어진 메서드를 동시에 호출하는 헬퍼 메서드.
+
+        Args:
+            method (str): 각 존의 KTCAPI 에서 호출할 메서드 이름.
+
+        Returns:
+            dict: 존을 키로 하고, 호출 결과를 값으로 가지는 사전 (존 순서 유지).
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {zone: executor.submit(contextvars.copy_context().run, getattr(client, method))
+                       for zone, client in self.clients.items()}
+            return {zone: future.result() for zone, future in futures.items()}
+
+    def get_instances(self):
+        """
+        모든 존의 인스턴스 세부 정보를 가져오는 메서드.
+
+        Returns:
+            dict: 모든 존의 서버 정보가 병합된 사전.
+        """
+        results = self._collect('get_instances')
+        return {'servers': [server for result in results.values() for server in result['servers']]}
+
+    def get_blockstorage(self):
+        """
+        모든 존의 블록 스토리지 정보를 가져오는 메서드.
+
+        Returns:
+            dict: 모든 존의 볼륨 정보가 병합된 사전.
+        """
+        results = self._collect('get_blockstorage')
+        return {'volumes': [volume for result in results.values() for volume in result['volumes']]}
+
+    def get_inventory(self):
+        """
+        모든 존의 인벤토리를 동시에 수집하여 하나의 리스트로 병합하는 메서드.
+        각 레코드의 region 필드에 수집된 존이 유지됩니다.
+
+        Returns:
+            list: InventoryRecord 리스트 (존 순서대로 병합).
+        """
+        results = self._collect('get_inventory')
+        return [inventory for zone_inventories in results.values() for inventory in zone_inventories]
+
+    def get_inventory_incremental(self):
+        """
+        모든 존의 인벤토리를 존별 스냅샷으로 동시에 증분 수집하여 하나의 리스트로 병합하는 메서드.
+
+        Returns:
+            list: InventoryRecord 리스트 (존 순서대로 병합).
+        """
+        results = self._collect('get_inventory_incremental')
+        return [inventory for zone_inventories in results.values() for inventory in zone_inventories]
+
+    def get_raw_inventory(self):
+        """
+        모든 존의 정규화 전 원본 응답을 동시에 가져오는 메서드.
+
+        Returns:
+            dict: 존을 키로 하고, 존별 KTCAPI.get_raw_inventory 결과를 값으로 가지는 사전.
+        """
+        return self._collect('get_raw_inventory')
+
+    def get_raw_inventory_incremental(self):
+        """
+        get_raw_inventory 의 증분 버전. 존마다 KTCAPI.get_raw_inventory_incremental 을 동시에 호출합니다.
+
+        Returns:
+            dict: 존을 키로 하고, 존별 원본 응답 사전을 값으로 가지는 사전.
+        """
+        return self._collect('get_raw_inventory_incremental')
+
+    def normalize_inventory(self, raw):
+        """
+        존별 원본 응답을 존별로 정규화하여 하나의 DataFrame 으로 병합하는 메서드.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return pd.concat([self.clients[zone].normalize_inventory(zone_raw) for zone, zone_raw in raw.items()],
+                         ignore_index=True)
+
+    def get_inventory_frame(self):
+        """
+        모든 존의 인벤토리를 동시에 수집하여 하나의 정규화된 DataFrame 으로 반환하는 메서드.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return self.normalize_inventory(self.get_raw_inventory())
+
+    def iter_inventory(self, page_size=DEFAULT_PAGE_SIZE):
+        """
+        모든 존의 인벤토리를 존 순서대로 페이지 단위로 생성하는 제너레이터.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+
+        Yields:
+            InventoryRecord: 인벤토리 레코드.
+        """
+        for client in self.clients.values():
+            yield from client.iter_inventory(page_size)
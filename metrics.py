@@ -0,0 +1,221 @@
+import contextvars
+import json
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from atomic_file import atomic_write
+
+METRICS_DIR = 'files/metrics'
+FIELDS = ('calls', 'seconds', 'max_seconds', 'bytes', 'retries', 'records')
+
+_current_run = contextvars.ContextVar('metrics_run', default=None)
+
+
+def endpoint_of(url):
+    """
+    URL 에서 지표에 사용할 엔드포인트 이름(경로의 마지막 두 구간)을 만드는 함수.
+    프로젝트/테넌트 ID 가 들어가는 앞부분은 버리므로 계정이 달라도 같은 이름으로 집계됩니다.
+
+    Args:
+        url (str): 요청 URL (예: 'https://.../volume/abc/volumes/detail').
+
+    Returns:
+        str: 엔드포인트 이름 (예: 'volumes/detail').
+    """
+    return '/'.join(urlsplit(url).path.rstrip('/').split('/')[-2:])
+
+
+def count_records(body):
+    """
+    응답 JSON 에서 목록 항목 수를 세는 함수.
+    OpenStack({'servers': [...]}), NCP({'xResponse': {'xList': [...]}}) 형식처럼 두 단계 안에 있는 첫 목록을 셉니다.
+
+    Args:
+        body (dict): 응답 JSON.
+
+    Returns:
+        int | None: 항목 수. 목록이 없으면 None.
+    """
+    if not isinstance(body, dict):
+        return None
+    for value in body.values():
+        if isinstance(value, list):
+            return len(value)
+    for value in body.values():
+        if isinstance(value, dict):
+            for inner in value.values():
+                if isinstance(inner, list):
+                    return len(inner)
+    return None
+
+
+class MetricsRegistry:
+    """
+    CSP API 호출 지표를 프로세스 안에서 집계하는 클래스.
+
+    (CSP, 메서드, 엔드포인트, 상태) 별로 호출 수, 소요 시간 합계/최대, 응답 바이트, 재시도 수, 항목 수를 누적하고,
+    track_run 으로 연 수집 실행 안에서 발생한 호출은 실행별 목록에도 남깁니다.
+    """
+
+    def __init__(self):
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider, method, url, status, seconds, size=0, retries=0):
+        """
+        HTTP 호출 하나를 기록하는 메서드.
+
+        Args:
+            provider (str): CSP 이름.
+            method (str): HTTP 메서드.
+            url (str): 요청 URL.
+            status (int | str): 응답 상태 코드. 연결 오류는 'error'.
+            seconds (float): 재시도와 대기를 포함한 소요 시간(초).
+            size (int, optional): 응답 바이트 수.
+            retries (int, optional): 재시도 횟수.
+
+        Returns:
+            dict: 기록된 호출 사전. add_records 에 다시 전달합니다.
+        """
+        event = {'provider': provider or '', 'method': method, 'endpoint': endpoint_of(url), 'status': status,
+                 'seconds': seconds, 'bytes': size, 'retries': retries, 'records': 0}
+        with self._lock:
+            totals = self._totals.setdefault(self._key(event), dict.fromkeys(FIELDS, 0))
+            totals['calls'] += 1
+            totals['seconds'] += seconds
+            totals['max_seconds'] = max(totals['max_seconds'], seconds)
+            totals['bytes'] += size
+            totals['retries'] += retries
+        run = _current_run.get()
+        if run is not None:
+            run.append(event)
+        return event
+
+    def add_records(self, event, count):
+        """
+        기록된 호출에 응답 항목 수를 더하는 메서드.
+        """
+        if event is None or not count:
+            return
+        with self._lock:
+            event['records'] += count
+            self._totals[self._key(event)]['records'] += count
+
+    @staticmethod
+    def _key(event):
+        return event['provider'], event['method'], event['endpoint'], str(event['status'])
+
+    def snapshot(self):
+        """
+        누적 지표를 반환하는 메서드.
+
+        Returns:
+            list: {'provider', 'method', 'endpoint', 'status', *FIELDS} 사전 리스트.
+        """
+        with self._lock:
+            return [dict(zip(('provider', 'method', 'endpoint', 'status'), key), **totals)
+                    for key, totals in sorted(self._totals.items())]
+
+    def to_json(self):
+        """
+        누적 지표를 JSON 문자열로 반환하는 메서드.
+        """
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """
+        누적 지표를 Prometheus 텍스트 형식으로 반환하는 메서드.
+        """
+        metrics = [
+            ('cci_api_requests_total', 'counter', 'CSP API 호출 수', 'calls'),
+            ('cci_api_request_seconds_total', 'counter', 'CSP API 호출 소요 시간 합계(초)', 'seconds'),
+            ('cci_api_request_seconds_max', 'gauge', 'CSP API 호출 최대 소요 시간(초)', 'max_seconds'),
+            ('cci_api_response_bytes_total', 'counter', 'CSP API 응답 바이트 합계', 'bytes'),
+            ('cci_api_retries_total', 'counter', 'CSP API 재시도 수', 'retries'),
+            ('cci_api_records_total', 'counter', 'CSP API 응답 항목 수', 'records'),
+        ]
+        rows = self.snapshot()
+        lines = []
+        for name, kind, help_text, field in metrics:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for row in rows:
+                labels = ','.join(f'{label}="{row[label]}"' for label in ('provider', 'method', 'endpoint', 'status'))
+                lines.append(f'{name}{{{labels}}} {row[field]}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, metrics_dir=METRICS_DIR):
+        """
+        누적 지표를 metrics.prom(Prometheus textfile collector 용)과 metrics.json 파일로 저장하는 메서드.
+        호출마다 고유한 임시 파일에 쓴 뒤 교체하므로 여러 작업 스레드가 동시에 저장해도 수집기가 쓰다 만 파일을 읽지 않습니다.
+
+        Args:
+            metrics_dir (str, optional): 저장 디렉토리. 기본값은 'files/metrics'.
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        for name, text in (('metrics.prom', self.to_prometheus()), ('metrics.json', self.to_json())):
+            with atomic_write(os.path.join(metrics_dir, name)) as f:
+                f.write(text)
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def track_run():
+    """
+    수집 실행 하나의 호출을 모으는 컨텍스트 매니저.
+    CSPInterface.fetch_parallel 등 작업 스레드에는 컨텍스트가 복사되므로 동시 호출도 함께 모입니다.
+
+    Yields:
+        list: 실행 중 기록된 호출 사전 리스트.
+    """
+    run = []
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
+
+
+def summarize(events):
+    """
+    실행별 호출 목록을 (CSP, 메서드, 엔드포인트) 별로 요약하는 함수.
+
+    Args:
+        events (list): track_run 이 모은 호출 사전 리스트.
+
+    Returns:
+        list: {'provider', 'method', 'endpoint', 'errors', *FIELDS} 사전 리스트 (소요 시간 합계 내림차순).
+    """
+    summary = {}
+    for event in events:
+        row = summary.setdefault((event['provider'], event['method'], event['endpoint']),
+                                 dict(dict.fromkeys(FIELDS, 0), errors=0))
+        row['calls'] += 1
+        row['seconds'] += event['seconds']
+        row['max_seconds'] = max(row['max_seconds'], event['seconds'])
+        row['bytes'] += event['bytes']
+        row['retries'] += event['retries']
+        row['records'] += event['records']
+        if event['status'] == 'error' or int(event['status']) > 210:
+            row['errors'] += 1
+    rows = [dict(zip(('provider', 'method', 'endpoint'), key), **row) for key, row in summary.items()]
+    return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+
+
+def observe_response(response, body):
+    """
+    http_session.request 가 남긴 호출 기록에 응답 항목 수를 더하는 함수. 클라이언트가 JSON 을 해석한 뒤 호출합니다.
+
+    Args:
+        response (requests.Response): 응답 객체.
+        body (dict): 응답 JSON.
+    """
+    registry.add_records(getattr(response, 'metrics_event', None), count_records(body))
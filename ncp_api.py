@@ -3,9 +3,15 @@ import hmac
 import time
 import hashlib
 import re
-import requests
+from urllib.parse import urlencode
+import http_session
+import metrics
+import normalize
 
 from csp_interface import CSPInterface
+from inventory_record import InventoryRecord
+from correlation import index_nics, index_volumes, join_volumes
+from pagination import DEFAULT_PAGE_SIZE, iter_ncp_pages
 
 
 class NCPAPI(CSPInterface):
@@ -15,42 +21,154 @@ class NCPAPI(CSPInterface):
     Args:
         access_key (str): API 인증에 사용할 액세스 키.
         secret_key (str): API 인증에 사용할 시크릿 키.
-        zone (str): 서비스 존(zone) 정보.
+        zone (str): 리전 코드 (예: 'KR'). 모든 목록 API 에 regionCode 로 전달됩니다.
         gov (bool): 공공 클라우드 여부 (기본값은 False).
+        response_cache (ResponseCache): 참조 데이터(네트워크 인터페이스 목록) 응답 캐시. 기본값은 None(미사용).
+        zone_code (str): 수집할 존 코드 (예: 'KR-1'). 서버/볼륨 목록에 zoneCode 로 전달됩니다. 기본값은 None(전체 존).
+        server_nos (list): 수집할 서버 인스턴스 번호 리스트. 기본값은 None(전체 서버).
     """
 
-    def __init__(self, access_key, secret_key, zone, gov=False):
+    PROVIDER = 'NCP'
+    CACHE_ENDPOINTS = {'getNetworkInterfaceList': 'network_interfaces'}
+    VOLUME_FILTER_MAX = 20  # 이보다 많은 서버를 지정하면 볼륨은 서버별 요청 대신 리전/존 단위로 가져옴
+
+    def __init__(self, access_key, secret_key, zone, gov=False, response_cache=None, zone_code=None, server_nos=None):
         self.gov = gov
         self.zone = zone
         self.access_key = access_key
         self.secret_key = secret_key
+        self.response_cache = response_cache
+        self.zone_code = zone_code
+        self.server_nos = list(server_nos) if server_nos else None
         self.BASE_URI = 'https://ncloud.apigw.gov-ntruss.com' if self.gov else 'https://ncloud.apigw.ntruss.com'
 
-    def generate_hmac(self, uri) -> dict:
+    def generate_hmac(self, uri, query='responseFormatType=json') -> dict:
         """
         HMAC 기반의 인증 헤더를 생성하는 메서드.
 
         Args:
             uri (str): API 엔드포인트 URI.
+            query (str, optional): 서명에 포함할 쿼리 문자열. 기본값은 'responseFormatType=json'.
 
         Returns:
             dict: 인증 헤더가 포함된 사전.
         """
         timestamp = str(int(time.time() * 1000))
         secret_key = bytes(self.secret_key, 'UTF-8')
-        message = f"GET /vserver/v2/{uri}?responseFormatType=json\n{timestamp}\n{self.access_key}"
+        message = f"GET /vserver/v2/{uri}?{query}\n{timestamp}\n{self.access_key}"
         message = bytes(message, 'UTF-8')
         signingKey = base64.b64encode(hmac.new(secret_key, message, digestmod=hashlib.sha256).digest())
         headers = {
             "x-ncp-apigw-timestamp": timestamp,
             "x-ncp-iam-access-key": self.access_key,
-            "x-ncp-apigw-signature-v2": signingKey,
+            "x-ncp-apigw-signature-v2": signingKey.decode('utf-8'),
         }
         return headers
 
+    def _get(self, uri, params=None):
+        """
+        서명된 GET 요청을 보내는 헬퍼 메서드.
+
+        Args:
+            uri (str): API 엔드포인트 URI.
+            params (dict, optional): 추가 쿼리 파라미터.
+
+        Returns:
+            dict: 응답 JSON.
+
+        Raises:
+            Exception: 요청 실패 시 예외를 발생시킵니다.
+        """
+        query = urlencode({'responseFormatType': 'json', **(params or {})})
+        url = f'{self.BASE_URI}/vserver/v2/{uri}?{query}'
+
+        def send(extra_headers=None):
+            headers = {**self.generate_hmac(uri, query), **(extra_headers or {})}
+            return http_session.get(url, provider=self.PROVIDER, headers=headers)
+
+        if self.response_cache and uri in self.CACHE_ENDPOINTS:
+            account = f'{self.BASE_URI}/{self.access_key}'
+            return self.response_cache.fetch(account, self.CACHE_ENDPOINTS[uri], url, None, send)
+        response = send()
+        if response.status_code > 210:
+            raise Exception(f"Failed to get {uri}: {response.status_code} - {response.text}")
+        body = response.json()
+        metrics.observe_response(response, body)
+        return body
+
+    def list_params(self, uri):
+        """
+        목록 API 에 붙일 서버 측 필터 파라미터를 만드는 메서드.
+        리전은 모든 목록에, 존은 서버/볼륨 목록에, 서버 번호 리스트는 서버 목록에 적용합니다.
+
+        Args:
+            uri (str): API 엔드포인트 URI.
+
+        Returns:
+            dict: 필터 파라미터 사전.
+        """
+        params = {'regionCode': self.zone}
+        if self.zone_code and uri != 'getNetworkInterfaceList':  # 네트워크 인터페이스 목록은 zoneCode 를 받지 않음
+            params['zoneCode'] = self.zone_code
+        if self.server_nos and uri == 'getServerInstanceList':
+            params.update({f'serverInstanceNoList.{i}': no for i, no in enumerate(self.server_nos, 1)})
+        return params
+
+    def volume_filters(self):
+        """
+        볼륨 목록 요청별 필터 파라미터 리스트를 만드는 메서드.
+        볼륨 목록 API 는 서버 번호를 하나만 받으므로, 지정한 서버가 VOLUME_FILTER_MAX 이하이면 서버별로 요청합니다.
+
+        Returns:
+            list: 필터 파라미터 사전 리스트.
+        """
+        params = self.list_params('getBlockStorageInstanceList')
+        if self.server_nos and len(self.server_nos) <= self.VOLUME_FILTER_MAX:
+            return [{**params, 'serverInstanceNo': no} for no in self.server_nos]
+        return [params]
+
+    def _iter_pages(self, uri, list_key, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        목록 API 를 페이지 단위로 가져오는 제너레이터.
+
+        Args:
+            uri (str): API 엔드포인트 URI.
+            list_key (str): 응답에서 목록이 담긴 키.
+            page_size (int, optional): 페이지 크기.
+            params (dict, optional): 필터 파라미터. 기본값은 list_params(uri).
+
+        Yields:
+            list: 한 페이지의 항목 리스트.
+        """
+        params = self.list_params(uri) if params is None else params
+        yield from iter_ncp_pages(lambda query: self._get(uri, query), f'{uri}Response', list_key, page_size, params)
+
+    def _iter_volume_pages(self, uri='getBlockStorageInstanceList', page_size=DEFAULT_PAGE_SIZE):
+        """
+        volume_filters 의 필터마다 볼륨 목록을 페이지 단위로 가져오는 제너레이터.
+        """
+        for params in self.volume_filters():
+            yield from self._iter_pages(uri, 'blockStorageInstanceList', page_size, params)
+
+    def _get_all(self, uri, list_key, pages=None):
+        """
+        목록 API 의 모든 페이지를 이어서 원래 응답 형태로 반환하는 헬퍼 메서드.
+
+        Args:
+            uri (str): API 엔드포인트 URI.
+            list_key (str): 응답에서 목록이 담긴 키.
+            pages (iterable, optional): 이어 붙일 페이지들. 기본값은 _iter_pages(uri, list_key).
+
+        Returns:
+            dict: {f'{uri}Response': {list_key: [...], 'totalRows': n}} 형태의 사전.
+        """
+        pages = self._iter_pages(uri, list_key) if pages is None else pages
+        items = [item for page in pages for item in page]
+        return {f'{uri}Response': {list_key: items, 'totalRows': len(items)}}
+
     def get_instances(self, uri):
         """
-        NCP에서 모든 인스턴스 정보를 가져오는 메서드.
+        NCP에서 모든 인스턴스 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
 
         Args:
             uri (str): API 엔드포인트 URI.
@@ -61,69 +179,145 @@ class NCPAPI(CSPInterface):
         Raises:
             Exception: 요청 실패 시 예외를 발생시킵니다.
         """
-        headers = self.generate_hmac(uri)
-        response = requests.get(f'{self.BASE_URI}/vserver/v2/{uri}?responseFormatType=json', headers=headers)
-        if response.status_code > 210:
-            raise Exception(f"Failed to get instances: {response.status_code} - {response.text}")
-        return response.json()
+        return self._get_all(uri, 'serverInstanceList')
 
     def get_inventory(self):
         """
         인벤토리 정보를 수집하여 반환하는 메서드.
 
         Returns:
-            list: 인벤토리 데이터가 포함된 리스트.
+            list: InventoryRecord 리스트.
+        """
+        results = self.fetch_parallel(
+            instances=lambda: self.get_instances('getServerInstanceList'),
+            networks=lambda: self.get_network('getNetworkInterfaceList'),
+            volumes=lambda: self.get_blockstorage('getBlockStorageInstanceList'))
+        instances = results['instances']['getServerInstanceListResponse']['serverInstanceList']
+        instance_nics = index_nics(results['networks'])
+        volumes = results['volumes']['getBlockStorageInstanceListResponse']['blockStorageInstanceList']
+        instance_volumes = index_volumes(self._volume_attachments(volumes))
+        return self.build_inventory(instances, instance_volumes, instance_nics)
+
+    def get_raw_inventory(self):
+        """
+        정규화 전의 서버, 볼륨, 네트워크 인터페이스 원본 응답을 가져오는 메서드.
+
+        Returns:
+            dict: normalize.ncp_frame 의 servers, volumes, networks 인자 사전.
         """
-        instances = self.get_instances('getServerInstanceList')['getServerInstanceListResponse']['serverInstanceList']
-        networks = self.get_network('getNetworkInterfaceList')
-        volumes = self.get_blockstorage('getBlockStorageInstanceList')['getBlockStorageInstanceListResponse'][
-            'blockStorageInstanceList']
-        instance_volumes = self.block_filter(instances, volumes)
+        results = self.fetch_parallel(
+            instances=lambda: self.get_instances('getServerInstanceList'),
+            networks=lambda: self.get_network('getNetworkInterfaceList'),
+            volumes=lambda: self.get_blockstorage('getBlockStorageInstanceList'))
+        return {'servers': results['instances']['getServerInstanceListResponse']['serverInstanceList'],
+                'volumes': results['volumes']['getBlockStorageInstanceListResponse']['blockStorageInstanceList'],
+                'networks': results['networks']}
 
+    def normalize_inventory(self, raw):
+        """
+        get_raw_inventory 결과를 정규화된 DataFrame 으로 변환하는 메서드. 변환은 normalize 모듈의 벡터 연산으로 처리합니다.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return normalize.ncp_frame(**raw, region=self.zone)
+
+    def get_inventory_frame(self):
+        """
+        인벤토리를 정규화된 DataFrame 으로 반환하는 메서드.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return self.normalize_inventory(self.get_raw_inventory())
+
+    def iter_inventory(self, page_size=DEFAULT_PAGE_SIZE):
+        """
+        인벤토리 정보를 서버 페이지 단위로 생성하는 제너레이터.
+        볼륨과 네트워크 인터페이스는 서버 연결 정보만 남긴 압축된 인덱스로 먼저 만들고,
+        서버 페이지는 도착하는 대로 변환합니다.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+
+        Yields:
+            InventoryRecord: 인벤토리 레코드.
+        """
+        instance_nics = {}
+        for page in self._iter_pages('getNetworkInterfaceList', 'networkInterfaceList', page_size):
+            index_nics(self._network_filter(page), instance_nics)
+        instance_volumes = {}
+        for page in self._iter_volume_pages(page_size=page_size):
+            index_volumes(self._volume_attachments(page), instance_volumes)
+        for instances in self._iter_pages('getServerInstanceList', 'serverInstanceList', page_size):
+            yield from self.build_inventory(instances, instance_volumes, instance_nics)
+
+    def build_inventory(self, instances, instance_volumes, instance_nics):
+        """
+        서버 목록을 볼륨, 네트워크 인터페이스 정보와 결합하여 인벤토리 레코드로 변환하는 메서드.
+
+        Args:
+            instances (list): 서버 리스트.
+            instance_volumes (dict): index_volumes 가 반환한 인스턴스 번호 → 볼륨 리스트 인덱스.
+            instance_nics (dict): index_nics 가 반환한 인스턴스 번호 → 사설 IP 리스트 인덱스.
+
+        Returns:
+            list: InventoryRecord 리스트.
+        """
         inventories = []
         for server in instances:
             publicip = server['publicIp'] if server['publicIp'] else None
-            vmguestip = next((item['ip'] for item in networks if item['instanceNo'] == server['serverInstanceNo']),
-                             None)
-            data = {
-                vmguestip: {
-                    'availability_zone': server['zoneCode'],
-                    'vm_state': 'RUNNING' if server['serverInstanceStatus']['code'] == 'RUN' else 'STOP',
-                    'vcpus': server['cpuCount'],
-                    'ram': server['memorySize'] // 1024 // 1024 // 1024,
-                    'name': server['serverName'],
-                    'created': server['createDate'][:10],
-                    'publicip': publicip
-                }
-            }
-            if server['serverInstanceNo'] in instance_volumes:
-                data[vmguestip].update({"volumes": instance_volumes[server['serverInstanceNo']]['volumes']})
-            inventories.append(data)
+            vmguestip = instance_nics.get(server['serverInstanceNo'], [None])[0]
+            inventories.append(InventoryRecord.from_volumes(
+                instance_volumes.get(server['serverInstanceNo'], []),
+                zone=server['zoneCode'],
+                name=server['serverName'],
+                vcpus=server['cpuCount'],
+                ram_gb=server['memorySize'] // 1024 // 1024 // 1024,
+                public_ip=publicip,
+                private_ip=vmguestip,
+                created=server['createDate'][:10],
+                state='RUNNING' if server['serverInstanceStatus']['code'] == 'RUN' else 'STOP',
+                region=self.zone
+            ))
         return inventories
 
-    def get_network(self, uri):
+    @staticmethod
+    def _network_filter(interfaces):
         """
-        네트워크 인터페이스 정보를 가져오는 메서드.
+        네트워크 인터페이스 리스트에서 인스턴스 번호와 IP 만 추출하는 메서드.
 
         Args:
-            uri (str): API 엔드포인트 URI.
+            interfaces (list): 네트워크 인터페이스 리스트.
 
         Returns:
-            list: 네트워크 인터페이스 정보가 포함된 리스트.
+            list: {'instanceNo', 'ip'} 사전 리스트.
         """
-        headers = self.generate_hmac(uri)
-        response = requests.get(f'{self.BASE_URI}/vserver/v2/{uri}?responseFormatType=json', headers=headers).json()
         networks = []
-        for i in response['getNetworkInterfaceListResponse']['networkInterfaceList']:
+        for i in interfaces:
             try:
                 networks.append({'instanceNo': i['instanceNo'], 'ip': i['ip']})
             except KeyError as e:
                 print(f'KeyError: {e}')  # 로깅으로 대체 가능
         return networks
 
+    def get_network(self, uri):
+        """
+        네트워크 인터페이스 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
+
+        Args:
+            uri (str): API 엔드포인트 URI.
+
+        Returns:
+            list: 네트워크 인터페이스 정보가 포함된 리스트.
+        """
+        return [network for page in self._iter_pages(uri, 'networkInterfaceList')
+                for network in self._network_filter(page)]
+
     def get_blockstorage(self, uri):
         """
-        블록 스토리지 정보를 가져오는 메서드.
+        블록 스토리지 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
+        서버 번호가 지정되어 있으면 해당 서버의 볼륨만 요청합니다.
 
         Args:
             uri (str): API 엔드포인트 URI.
@@ -131,9 +325,28 @@ class NCPAPI(CSPInterface):
         Returns:
             dict: 블록 스토리지 데이터가 포함된 사전.
         """
-        headers = self.generate_hmac(uri)
-        response = requests.get(f'{self.BASE_URI}/vserver/v2/{uri}?responseFormatType=json', headers=headers).json()
-        return response
+        return self._get_all(uri, 'blockStorageInstanceList', self._iter_volume_pages(uri))
+
+    @staticmethod
+    def _volume_attachments(volumes):
+        """
+        볼륨 리스트에서 (인스턴스 번호, 볼륨 정보) 쌍을 생성하는 제너레이터.
+
+        Args:
+            volumes (list): 볼륨 리스트.
+
+        Yields:
+            tuple: 인스턴스 번호와 볼륨 정보 사전.
+        """
+        for volume in volumes:
+            volume_type_match = re.findall(r'\b\w*\s?(HDD|SSD)\b', volume["blockStorageDiskDetailType"]["code"])
+            volume_type = volume_type_match[0] if volume_type_match else "Unknown"
+            yield volume["serverInstanceNo"], {
+                "device": volume["deviceName"],
+                "volume_type": volume_type,
+                "size": volume["blockStorageSize"] // 1024 // 1024 // 1024,
+                "bootable": volume["blockStorageType"]["code"] == "BASIC"
+            }
 
     def block_filter(self, instances, volumes):
         """
@@ -146,18 +359,5 @@ class NCPAPI(CSPInterface):
         Returns:
             dict: 인스턴스 번호를 키로 하고, 각 인스턴스에 속한 볼륨 리스트를 값으로 가지는 사전.
         """
-        instance_volumes = {instance["serverInstanceNo"]: {"instance_name": instance["serverName"], "volumes": []}
-                            for instance in instances}
-
-        for volume in volumes:
-            volume_type_match = re.findall(r'\b\w*\s?(HDD|SSD)\b', volume["blockStorageDiskDetailType"]["code"])
-            volume_type = volume_type_match[0] if volume_type_match else "Unknown"
-            instance_id = volume["serverInstanceNo"]
-            if instance_id in instance_volumes:
-                instance_volumes[instance_id]["volumes"].append({
-                    "device": volume["deviceName"],
-                    "volume_type": volume_type,
-                    "size": volume["blockStorageSize"] // 1024 // 1024 // 1024,
-                    "bootable": volume["blockStorageType"]["code"] == "BASIC"
-                })
-        return instance_volumes
+        instance_ids = {instance["serverInstanceNo"]: instance["serverName"] for instance in instances}
+        return join_volumes(instance_ids, index_volumes(self._volume_attachments(volumes)))
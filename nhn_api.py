@@ -1,7 +1,15 @@
 import json
-import requests
+import http_session
+import incremental
+import metrics
+import normalize
+import token_cache
 import re
 from csp_interface import CSPInterface
+from inventory_record import InventoryRecord
+from correlation import index_volumes, join_volumes
+from flavor_cache import FlavorCatalog, parse_flavors
+from pagination import DEFAULT_PAGE_SIZE, iter_openstack_pages
 import time
 
 
@@ -15,9 +23,15 @@ class NHNAPI(CSPInterface):
         tenantid (str): 테넌트 ID.
         zone (str): 서비스 존(zone) 정보.
         gov (bool): 공공 클라우드 여부 (기본값은 False).
+        flavor_cache_ttl (int): 플레이버 카탈로그 디스크 캐시 유효 시간(초). None 이면 디스크 캐시를 사용하지 않음.
+        response_cache (ResponseCache): 참조 데이터(플레이버 목록) 응답 캐시. 기본값은 None(미사용).
     """
 
-    def __init__(self, username, password, tenantid, zone, gov=False):
+    PROVIDER = 'NHN'
+    ZONES = ('kr1', 'kr2', 'jp1')
+    GOV_ZONES = ('kr1', 'kr2')
+
+    def __init__(self, username, password, tenantid, zone, gov=False, flavor_cache_ttl=None, response_cache=None):
         self.gov = gov
         self.zone = zone
         self.username = username
@@ -25,8 +39,13 @@ class NHNAPI(CSPInterface):
         self.tenantid = tenantid
         self.token = None
         self.token_expiry = 0
+        self.flavor_cache_ttl = flavor_cache_ttl
+        self.flavors = None
+        self.response_cache = response_cache
 
         self.BASE_AUTH_URI, self.VM_BASE_URI, self.ST_BASE_URI = self._initialize_uris()
+        self.token_key = token_cache.cache_key(self.BASE_AUTH_URI, self.tenantid, self.username, self.password)
+        self.snapshot_key = incremental.snapshot_key(self.VM_BASE_URI, self.tenantid, self.username)
 
     def _initialize_uris(self):
         """
@@ -34,7 +53,12 @@ class NHNAPI(CSPInterface):
 
         Returns:
             tuple: 인증, VM, 스토리지 URI의 튜플.
+
+        Raises:
+            ValueError: 지원하지 않는 존일 때 발생.
         """
+        if self.zone not in (self.GOV_ZONES if self.gov else self.ZONES):
+            raise ValueError(f"Unknown NHN zone: {self.zone}")
         if self.gov:
             base_auth_uri = 'https://api-identity-infrastructure.gov-nhncloudservice.com'
             if self.zone == 'kr1':
@@ -57,9 +81,12 @@ class NHNAPI(CSPInterface):
 
         return base_auth_uri, vm_base_uri, st_base_uri
 
-    def authenticate(self):
+    def auth_request(self):
         """
-        API 인증을 수행하고, 토큰을 획득하는 메서드.
+        인증 요청 URL 과 본문을 만드는 메서드.
+
+        Returns:
+            tuple: 인증 URL 과 요청 본문 사전.
         """
         URL = f'{self.BASE_AUTH_URI}/v2.0/tokens'
         data = {
@@ -71,29 +98,122 @@ class NHNAPI(CSPInterface):
                 }
             }
         }
+        return URL, data
+
+    def set_token(self, headers, body):
+        """
+        인증 응답에서 토큰을 저장하는 메서드.
+
+        Args:
+            headers (dict): 인증 응답 헤더.
+            body (dict): 인증 응답 본문.
+        """
+        self.token = body['access']['token']['id']
+        self.token_expiry = token_cache.parse_expiry(body['access']['token'].get('expires'))
+        token_cache.save(self.token_key, {'token': self.token, 'expires_at': self.token_expiry})
+
+    def load_cached_token(self):
+        """
+        다른 프로세스나 이전 실행이 저장한 유효한 토큰을 불러오는 메서드.
+
+        Returns:
+            bool: 토큰을 불러왔으면 True.
+        """
+        entry = token_cache.load(self.token_key)
+        if entry is None:
+            return False
+        self.token = entry['token']
+        self.token_expiry = entry['expires_at']
+        return True
+
+    def authenticate(self):
+        """
+        API 인증을 수행하고, 토큰을 획득하는 메서드.
+        """
+        URL, data = self.auth_request()
         headers = {'Content-Type': 'application/json'}
-        response = requests.post(URL, data=json.dumps(data), headers=headers)
+        response = http_session.post(URL, provider=self.PROVIDER, data=json.dumps(data), headers=headers)
         if response.status_code > 210:
             raise Exception(f"Authentication failed: {response.status_code} - {response.json()['error']['message']}")
 
-        response = response.json()
-        self.token = response['access']['token']['id']
-        self.token_expiry = time.time() + 3600  # 1시간 후 만료
+        self.set_token(response.headers, response.json())
 
     def get_token(self):
         """
-        유효한 토큰을 반환하는 메서드. 만료된 경우 새로 인증을 시도합니다.
+        유효한 토큰을 반환하는 메서드. 만료된 경우 토큰 저장소를 먼저 확인하고, 없으면 새로 인증을 시도합니다.
 
         Returns:
             str: 유효한 인증 토큰.
         """
-        if self.token is None or time.time() >= self.token_expiry:
-            self.authenticate()
+        if self.token is None or time.time() >= self.token_expiry - token_cache.EXPIRY_MARGIN:
+            if not self.load_cached_token():
+                self.authenticate()
         return self.token
 
+    def _send(self, url, params=None, extra_headers=None):
+        """
+        인증 토큰을 붙여 GET 요청을 보내고 응답 객체를 반환하는 헬퍼 메서드.
+        저장된 토큰이 폐기되어 401 이 오면 한 번만 재인증합니다.
+
+        Args:
+            url (str): 요청 URL.
+            params (dict, optional): 쿼리 파라미터.
+            extra_headers (dict, optional): 추가 요청 헤더 (예: If-None-Match).
+
+        Returns:
+            requests.Response: 응답 객체.
+        """
+        headers = {'X-Auth-Token': self.get_token(), 'Content-Type': 'application/json', **(extra_headers or {})}
+        response = http_session.get(url, provider=self.PROVIDER, headers=headers, params=params)
+        if response.status_code == 401:
+            token_cache.invalidate(self.token_key)
+            self.authenticate()
+            headers['X-Auth-Token'] = self.token
+            response = http_session.get(url, provider=self.PROVIDER, headers=headers, params=params)
+        return response
+
+    def _get(self, url, params=None, endpoint=None):
+        """
+        인증 토큰을 붙여 GET 요청을 보내는 헬퍼 메서드.
+
+        Args:
+            url (str): 요청 URL.
+            params (dict, optional): 쿼리 파라미터.
+            endpoint (str, optional): 응답 캐시 엔드포인트 이름. response_cache 가 설정되어 있으면 캐시를 거칩니다.
+
+        Returns:
+            dict: 응답 JSON.
+
+        Raises:
+            Exception: 요청 실패 시 예외를 발생시킵니다.
+        """
+        if self.response_cache and endpoint:
+            return self.response_cache.fetch(self.token_key, endpoint, url, params,
+                                             lambda extra_headers: self._send(url, params, extra_headers))
+        response = self._send(url, params)
+        if response.status_code > 210:
+            raise Exception(f"Failed to get {url}: {response.status_code} - {response.text}")
+        body = response.json()
+        metrics.observe_response(response, body)
+        return body
+
+    def iter_instance_pages(self, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        인스턴스 정보를 페이지 단위로 가져오는 제너레이터.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+            params (dict, optional): 필터 파라미터 (예: {'changes-since': ...}).
+
+        Yields:
+            list: 한 페이지의 서버 리스트.
+        """
+        URL = f'{self.VM_BASE_URI}/v2/{self.tenantid}/servers/detail'
+        yield from iter_openstack_pages(lambda query: self._get(URL, query), 'servers', page_size, params)
+
     def get_instances(self):
         """
-        NHN에서 모든 인스턴스 정보를 가져오는 메서드.
+        NHN에서 모든 인스턴스 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
 
         Returns:
             dict: 인스턴스 정보가 포함된 사전.
@@ -101,14 +221,31 @@ class NHNAPI(CSPInterface):
         Raises:
             Exception: 요청 실패 시 예외를 발생시킵니다.
         """
-        token = self.get_token()
-        URL = f'{self.VM_BASE_URI}/v2/{self.tenantid}/servers/detail'
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        response = requests.get(URL, headers=headers)
-        if response.status_code > 210:
-            raise Exception(f"Failed to get instances: {response.status_code} - {response.text}")
+        return {'servers': [server for page in self.iter_instance_pages() for server in page]}
+
+    def get_flavors(self):
+        """
+        플레이버 카탈로그를 반환하는 메서드.
+        실행당 한 번만 /flavors/detail 을 호출하고, flavor_cache_ttl 이 설정되어 있으면 디스크 캐시를 사용합니다.
+
+        Returns:
+            dict: 플레이버 ID를 키로 하고, {'name', 'vcpus', 'ram'} 을 값으로 가지는 사전.
+        """
+        if self.flavors is not None:
+            return self.flavors
+
+        disk_cache = None
+        if self.flavor_cache_ttl:
+            disk_cache = FlavorCatalog(f'{self.VM_BASE_URI}/{self.tenantid}', self.flavor_cache_ttl)
+            self.flavors = disk_cache.load()
+            if self.flavors is not None:
+                return self.flavors
 
-        return response.json()
+        URL = f'{self.VM_BASE_URI}/v2/{self.tenantid}/flavors/detail'
+        self.flavors = parse_flavors(self._get(URL, endpoint='flavors')['flavors'])
+        if disk_cache:
+            disk_cache.save(self.flavors)
+        return self.flavors
 
     def filter_flavors(self, flavor_id):
         """
@@ -120,28 +257,123 @@ class NHNAPI(CSPInterface):
         Returns:
             str: 플레이버 이름에서 CPU와 메모리 정보를 추출한 문자열.
         """
-        token = self.get_token()
-        URL = f'{self.VM_BASE_URI}/v2/{self.tenantid}/flavors'
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        flavors = requests.get(URL, headers=headers).json()['flavors']
-        for flavor in flavors:
-            if flavor['id'] == flavor_id:
-                return flavor['name'].split('.')[1]
+        flavor = self.get_flavors().get(flavor_id)
+        if flavor:
+            return flavor['name']
 
     def get_inventory(self):
         """
         인벤토리 정보를 수집하여 반환하는 메서드.
 
         Returns:
-            list: 인벤토리 데이터가 포함된 리스트.
+            list: InventoryRecord 리스트.
+        """
+        self.get_token()  # 동시 호출 전에 한 번만 인증
+        results = self.fetch_parallel(instances=self.get_instances,
+                                      volumes=self.get_blockstorage,
+                                      flavors=self.get_flavors)
+        instances = results['instances']['servers']
+        volumes = results['volumes']['volumes']
+        instance_volumes = index_volumes(self._volume_attachments(volumes))
+        return self.build_inventory(instances, instance_volumes, results['flavors'])
+
+    def get_raw_inventory(self):
+        """
+        정규화 전의 서버, 볼륨 원본 응답과 플레이버 카탈로그를 가져오는 메서드.
+
+        Returns:
+            dict: normalize.nhn_frame 의 servers, volumes, flavors 인자 사전.
+        """
+        self.get_token()
+        results = self.fetch_parallel(instances=self.get_instances,
+                                      volumes=self.get_blockstorage,
+                                      flavors=self.get_flavors)
+        return {'servers': results['instances']['servers'], 'volumes': results['volumes']['volumes'],
+                'flavors': results['flavors']}
+
+    def normalize_inventory(self, raw):
+        """
+        get_raw_inventory 결과를 정규화된 DataFrame 으로 변환하는 메서드. 변환은 normalize 모듈의 벡터 연산으로 처리합니다.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return normalize.nhn_frame(**raw, region=self.zone)
+
+    def get_inventory_frame(self):
+        """
+        인벤토리를 정규화된 DataFrame 으로 반환하는 메서드.
+
+        Returns:
+            pd.DataFrame: normalize.COLUMNS 열을 가진 인벤토리 프레임.
+        """
+        return self.normalize_inventory(self.get_raw_inventory())
+
+    def get_raw_inventory_incremental(self, store=None):
+        """
+        get_raw_inventory 의 증분 버전. 마지막 수집 이후 변경된 서버만 가져와 저장된 스냅샷에 병합하고
+        볼륨은 전체 목록으로 교체합니다. 첫 수집이거나 스냅샷이 오래되었으면 전체를 수집합니다.
+
+        Args:
+            store (incremental.SnapshotStore, optional): 스냅샷 저장소. 기본값은 계정별 저장소.
+
+        Returns:
+            dict: normalize.nhn_frame 의 servers, volumes, flavors 인자 사전.
+        """
+        self.get_token()
+        results = self.fetch_parallel(snapshot=lambda: incremental.sync_snapshot(self, store),
+                                      flavors=self.get_flavors)
+        servers, volumes = results['snapshot']
+        return {'servers': servers, 'volumes': volumes, 'flavors': results['flavors']}
+
+    def get_inventory_incremental(self, store=None):
+        """
+        get_raw_inventory_incremental 로 스냅샷을 갱신한 뒤 인벤토리를 반환하는 메서드.
+
+        Args:
+            store (incremental.SnapshotStore, optional): 스냅샷 저장소. 기본값은 계정별 저장소.
+
+        Returns:
+            list: InventoryRecord 리스트.
+        """
+        raw = self.get_raw_inventory_incremental(store)
+        instance_volumes = index_volumes(self._volume_attachments(raw['volumes']))
+        return self.build_inventory(raw['servers'], instance_volumes, raw['flavors'])
+
+    def iter_inventory(self, page_size=DEFAULT_PAGE_SIZE):
+        """
+        인벤토리 정보를 서버 페이지 단위로 생성하는 제너레이터.
+        볼륨은 서버-볼륨 연결 정보만 남긴 압축된 인덱스로 먼저 만들고, 서버 페이지는 도착하는 대로 변환합니다.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+
+        Yields:
+            InventoryRecord: 인벤토리 레코드.
+        """
+        flavors = self.get_flavors()
+        instance_volumes = {}
+        for volumes in self.iter_blockstorage_pages(page_size):
+            index_volumes(self._volume_attachments(volumes), instance_volumes)
+        for instances in self.iter_instance_pages(page_size):
+            yield from self.build_inventory(instances, instance_volumes, flavors)
+
+    def build_inventory(self, instances, instance_volumes, flavors):
+        """
+        서버 목록을 볼륨, 플레이버 정보와 결합하여 인벤토리 레코드로 변환하는 메서드.
+
+        Args:
+            instances (list): 서버 리스트.
+            instance_volumes (dict): index_volumes 가 반환한 인스턴스 ID → 볼륨 리스트 인덱스.
+            flavors (dict): get_flavors 가 반환한 플레이버 카탈로그.
+
+        Returns:
+            list: InventoryRecord 리스트.
         """
-        instances = self.get_instances()['servers']
-        volumes = self.get_blockstorage()['volumes']
-        instance_volumes = self.block_filter(instances, volumes)
         inventories = []
 
         for server in instances:
-            type_info = self.filter_flavors(server['flavor']['id'])
+            flavor = flavors.get(server['flavor']['id'], {})
             publicip = None
             for address in server['addresses']:
                 for addr in server['addresses'][address]:
@@ -150,70 +382,77 @@ class NHNAPI(CSPInterface):
                     else:
                         vmguestip = addr['addr']
                 break
-            match = re.compile(r'c(\d+)m(\d+)').match(type_info)
-            if match:
-                cpu = match.group(1)
-                mem = match.group(2)
-            data = {
-                vmguestip: {
-                    'availability_zone': server['OS-EXT-AZ:availability_zone'],
-                    'vm_state': 'RUNNING' if server['OS-EXT-STS:vm_state'] == 'active' else 'STOP',
-                    'vcpus': cpu,
-                    'ram': mem,
-                    'name': server['name'],
-                    'created': server['created'][:10],
-                    'publicip': publicip
-                }
-            }
-            if server['id'] in instance_volumes:
-                data[vmguestip].update({"volumes": instance_volumes[server['id']]['volumes']})
-            inventories.append(data)
+            inventories.append(InventoryRecord.from_volumes(
+                instance_volumes.get(server['id'], []),
+                zone=server['OS-EXT-AZ:availability_zone'],
+                name=server['name'],
+                vcpus=flavor.get('vcpus'),
+                ram_gb=flavor.get('ram'),
+                public_ip=publicip,
+                private_ip=vmguestip,
+                created=server['created'][:10],
+                state='RUNNING' if server['OS-EXT-STS:vm_state'] == 'active' else 'STOP',
+                region=self.zone
+            ))
 
         return inventories
 
+    def iter_blockstorage_pages(self, page_size=DEFAULT_PAGE_SIZE, params=None):
+        """
+        블록 스토리지 정보를 페이지 단위로 가져오는 제너레이터.
+
+        Args:
+            page_size (int, optional): 페이지 크기.
+            params (dict, optional): 필터 파라미터.
+
+        Yields:
+            list: 한 페이지의 볼륨 리스트.
+        """
+        URL = f'{self.ST_BASE_URI}/v2/{self.tenantid}/volumes/detail'
+        yield from iter_openstack_pages(lambda query: self._get(URL, query), 'volumes', page_size, params)
+
     def get_blockstorage(self):
         """
-        블록 스토리지 정보를 가져오는 메서드.
+        블록 스토리지 정보를 가져오는 메서드. 모든 페이지를 이어서 가져옵니다.
 
         Returns:
             dict: 블록 스토리지 데이터가 포함된 사전.
         """
-        token = self.get_token()
-        URL = f'{self.ST_BASE_URI}/v2/{self.tenantid}/volumes/detail'
-        headers = {'X-Auth-Token': token, 'Content-Type': 'application/json'}
-        response = requests.get(URL, headers=headers).json()
-        return response
+        return {'volumes': [volume for page in self.iter_blockstorage_pages() for volume in page]}
 
-    def block_filter(self, instances, volumes):
+    @staticmethod
+    def _volume_attachments(volumes):
         """
-        인스턴스와 연관된 블록 스토리지를 필터링하는 메서드.
+        볼륨 리스트에서 (인스턴스 ID, 볼륨 정보) 쌍을 생성하는 제너레이터.
 
         Args:
-            instances (list): 인스턴스 리스트.
             volumes (list): 볼륨 리스트.
 
-        Returns:
-            dict: 인스턴스 ID를 키로 하고, 각 인스턴스에 속한 볼륨 리스트를 값으로 가지는 사전.
+        Yields:
+            tuple: 인스턴스 ID와 볼륨 정보 사전.
         """
-        instance_volumes = {instance["id"]: {"instance_name": instance["name"], "volumes": []}
-                            for instance in instances}
-
         for volume in volumes:
             volume_type_match = re.findall(r'\b\w*\s?(HDD|SSD)\b', volume["volume_type"])
             volume_type = volume_type_match[0] if volume_type_match else "Unknown"
-            volume_info = {
-                "volume_type": volume_type,
-                "size": volume["size"]
-            }
 
             for attachment in volume.get("attachments", []):
-                instance_id = attachment["server_id"]
-                if instance_id in instance_volumes:
-                    instance_volumes[instance_id]["volumes"].append({
-                        "device": attachment["device"],
-                        "volume_type": volume_info["volume_type"],
-                        "size": volume_info["size"],
-                        "bootable": volume["bootable"] == 'true'
-                    })
-
-        return instance_volumes
+                yield attachment["server_id"], {
+                    "device": attachment["device"],
+                    "volume_type": volume_type,
+                    "size": volume["size"],
+                    "bootable": volume["bootable"] == 'true'
+                }
+
+    def block_filter(self, instances, volumes):
+        """
+        인스턴스와 연관된 블록 스토리지를 필터링하는 메서드.
+
+        Args:
+            instances (list): 인스턴스 리스트.
+            volumes (list): 볼륨 리스트.
+
+        Returns:
+            dict: 인스턴스 ID를 키로 하고, 각 인스턴스에 속한 볼륨 리스트를 값으로 가지는 사전.
+        """
+        instance_ids = {instance["id"]: instance["name"] for instance in instances}
+        return join_volumes(instance_ids, index_volumes(self._volume_attachments(volumes)))
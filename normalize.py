@@ -0,0 +1,208 @@
+import pandas as pd
+
+from inventory_record import InventoryRecord
+
+VOLUME_TYPE_PATTERN = r'\b\w*\s?(HDD|SSD)\b'
+DISK_COLUMNS = ['boot_hdd', 'boot_ssd', 'ext_hdd', 'ext_ssd']
+COLUMNS = list(InventoryRecord.__slots__)
+TEMPLATE_COLUMNS = ['Zone', 'HostName', 'OS', 'CPU', 'MEM', 'OSDISK[HDD]', 'OSDISK[SSD]', 'SWAP',
+                    'EXTDISK[HDD]', 'EXTDISK[SSD]', 'NAS', 'Mount Point', '공인IP', '사설IP', 'VM생성날짜', 'VM상태']
+
+
+def disk_totals(volumes):
+    """
+    볼륨 프레임을 인스턴스별 부트/추가 HDD/SSD 용량 합계로 집계하는 함수.
+    볼륨 유형 판별과 집계를 모두 벡터 연산과 groupby 로 처리합니다.
+    부트 볼륨은 마지막 값을, 추가 볼륨은 합계를 사용하며 HDD 가 아닌 볼륨은 SSD 로 계산합니다.
+
+    Args:
+        volumes (pd.DataFrame): 'instance_id', 'type_code', 'size', 'bootable' 열을 가진 프레임.
+
+    Returns:
+        pd.DataFrame: instance_id 를 인덱스로 하고 DISK_COLUMNS 열을 가진 프레임.
+    """
+    if volumes.empty:
+        return pd.DataFrame(columns=DISK_COLUMNS, dtype='int64').rename_axis('instance_id')
+
+    is_hdd = volumes['type_code'].astype(str).str.extract(VOLUME_TYPE_PATTERN, expand=False).eq('HDD')
+    bootable = volumes['bootable'].astype(bool)
+    kind = (bootable.map({True: 'boot_', False: 'ext_'}) + is_hdd.map({True: 'hdd', False: 'ssd'}))
+    frame = pd.DataFrame({'instance_id': volumes['instance_id'], 'kind': kind,
+                          'size': pd.to_numeric(volumes['size'], errors='coerce').fillna(0).astype('int64')})
+
+    boot = frame[bootable.values].groupby(['instance_id', 'kind'])['size'].last()
+    ext = frame[~bootable.values].groupby(['instance_id', 'kind'])['size'].sum()
+    totals = pd.concat([boot, ext]).unstack('kind', fill_value=0)
+    return totals.reindex(columns=DISK_COLUMNS, fill_value=0)
+
+
+def _finish(servers, volumes, region=None):
+    """
+    서버 프레임에 디스크 합계를 붙이고 표준 열 순서로 정리하는 헬퍼 함수.
+    """
+    frame = servers.join(disk_totals(volumes), on='instance_id')
+    frame[DISK_COLUMNS] = frame[DISK_COLUMNS].fillna(0).astype('int64')
+    frame['region'] = region
+    return frame[COLUMNS].reset_index(drop=True)
+
+
+def _openstack_volumes(volumes):
+    """
+    OpenStack 볼륨 JSON 을 첨부(attachment) 단위 프레임으로 펼치는 헬퍼 함수.
+    """
+    rows = pd.json_normalize(volumes, record_path='attachments', meta=['volume_type', 'size', 'bootable'],
+                             errors='ignore') if volumes else pd.DataFrame()
+    if rows.empty:
+        return pd.DataFrame(columns=['instance_id', 'type_code', 'size', 'bootable'])
+    return pd.DataFrame({'instance_id': rows['server_id'], 'type_code': rows['volume_type'],
+                         'size': rows['size'], 'bootable': rows['bootable'].eq('true')})
+
+
+def _openstack_servers(servers):
+    """
+    OpenStack 서버 JSON 의 공통 열을 프레임으로 만드는 헬퍼 함수.
+    """
+    frame = pd.json_normalize(servers)
+    return pd.DataFrame({
+        'instance_id': frame['id'],
+        'zone': frame['OS-EXT-AZ:availability_zone'],
+        'name': frame['name'],
+        'created': frame['created'].str[:10],
+        'state': frame['OS-EXT-STS:vm_state'].eq('active').map({True: 'RUNNING', False: 'STOP'}),
+    })
+
+
+def ktc_frame(servers, volumes, pubipes, region=None):
+    """
+    KTC 원본 응답을 정규화된 인벤토리 프레임으로 변환하는 함수.
+
+    Args:
+        servers (list): servers/detail 의 서버 리스트.
+        volumes (list): volumes/detail 의 볼륨 리스트.
+        pubipes (list): KTCAPI.static_nat_filter 가 반환한 {'pubip', 'privateip'} 리스트.
+        region (str, optional): 수집한 존.
+
+    Returns:
+        pd.DataFrame: COLUMNS 열을 가진 인벤토리 프레임.
+    """
+    if not servers:
+        return pd.DataFrame(columns=COLUMNS)
+    frame = _openstack_servers(servers)
+    flavors = pd.json_normalize(servers)
+    frame['vcpus'] = flavors['flavor.vcpus']
+    frame['ram_gb'] = flavors['flavor.ram'] // 1024
+    frame['private_ip'] = [next(iter(server['addresses'].values()))[0]['addr'] for server in servers]
+
+    public_ips = pd.DataFrame(pubipes, columns=['pubip', 'privateip']).drop_duplicates('privateip', keep='last')
+    frame['public_ip'] = frame['private_ip'].map(public_ips.set_index('privateip')['pubip'])
+    frame['public_ip'] = frame['public_ip'].astype(object).where(frame['public_ip'].notna(), None)
+    return _finish(frame, _openstack_volumes(volumes), region)
+
+
+def _nhn_addresses(server):
+    """
+    NHN 서버의 첫 번째 네트워크에서 (사설 IP, floating IP) 를 추출하는 헬퍼 함수.
+    """
+    private_ip = public_ip = None
+    for addr in next(iter(server['addresses'].values()), []):
+        if addr['OS-EXT-IPS:type'] == 'floating':
+            public_ip = addr['addr']
+        else:
+            private_ip = addr['addr']
+    return private_ip, public_ip
+
+
+def nhn_frame(servers, volumes, flavors, region=None):
+    """
+    NHN 원본 응답을 정규화된 인벤토리 프레임으로 변환하는 함수.
+
+    Args:
+        servers (list): servers/detail 의 서버 리스트.
+        volumes (list): volumes/detail 의 볼륨 리스트.
+        flavors (dict): NHNAPI.get_flavors 가 반환한 플레이버 카탈로그.
+        region (str, optional): 수집한 리전.
+
+    Returns:
+        pd.DataFrame: COLUMNS 열을 가진 인벤토리 프레임.
+    """
+    if not servers:
+        return pd.DataFrame(columns=COLUMNS)
+    frame = _openstack_servers(servers)
+    catalog = pd.DataFrame.from_dict(flavors, orient='index', columns=['name', 'vcpus', 'ram'])
+    flavor_ids = pd.json_normalize(servers)['flavor.id']
+    frame['vcpus'] = pd.to_numeric(flavor_ids.map(catalog['vcpus']), errors='coerce').astype('Int64')
+    frame['ram_gb'] = pd.to_numeric(flavor_ids.map(catalog['ram']), errors='coerce').astype('Int64')
+    addresses = pd.DataFrame([_nhn_addresses(server) for server in servers], columns=['private_ip', 'public_ip'])
+    frame['private_ip'] = addresses['private_ip']
+    frame['public_ip'] = addresses['public_ip']
+    return _finish(frame, _openstack_volumes(volumes), region)
+
+
+def ncp_frame(servers, volumes, networks, region=None):
+    """
+    NCP 원본 응답을 정규화된 인벤토리 프레임으로 변환하는 함수.
+
+    Args:
+        servers (list): getServerInstanceList 의 서버 리스트.
+        volumes (list): getBlockStorageInstanceList 의 볼륨 리스트.
+        networks (list): NCPAPI.get_network 가 반환한 {'instanceNo', 'ip'} 리스트.
+        region (str, optional): 수집한 리전.
+
+    Returns:
+        pd.DataFrame: COLUMNS 열을 가진 인벤토리 프레임.
+    """
+    if not servers:
+        return pd.DataFrame(columns=COLUMNS)
+    raw = pd.json_normalize(servers)
+    nics = pd.DataFrame(networks, columns=['instanceNo', 'ip']).drop_duplicates('instanceNo', keep='first')
+    frame = pd.DataFrame({
+        'instance_id': raw['serverInstanceNo'],
+        'zone': raw['zoneCode'],
+        'name': raw['serverName'],
+        'vcpus': raw['cpuCount'],
+        'ram_gb': raw['memorySize'] // 1024 ** 3,
+        'public_ip': raw['publicIp'].where(raw['publicIp'].astype(bool), None),
+        'private_ip': raw['serverInstanceNo'].map(nics.set_index('instanceNo')['ip']),
+        'created': raw['createDate'].str[:10],
+        'state': raw['serverInstanceStatus.code'].eq('RUN').map({True: 'RUNNING', False: 'STOP'}),
+    })
+
+    if volumes:
+        raw_volumes = pd.json_normalize(volumes)
+        volume_frame = pd.DataFrame({
+            'instance_id': raw_volumes['serverInstanceNo'],
+            'type_code': raw_volumes['blockStorageDiskDetailType.code'],
+            'size': raw_volumes['blockStorageSize'] // 1024 ** 3,
+            'bootable': raw_volumes['blockStorageType.code'].eq('BASIC'),
+        })
+    else:
+        volume_frame = pd.DataFrame(columns=['instance_id', 'type_code', 'size', 'bootable'])
+    return _finish(frame, volume_frame, region)
+
+
+def records_to_frame(records):
+    """
+    InventoryRecord 리스트를 정규화된 인벤토리 프레임으로 변환하는 함수.
+
+    Args:
+        records (iterable): InventoryRecord 들.
+
+    Returns:
+        pd.DataFrame: COLUMNS 열을 가진 인벤토리 프레임.
+    """
+    return pd.DataFrame([[getattr(record, field) for field in COLUMNS] for record in records], columns=COLUMNS)
+
+
+def frame_to_records(frame):
+    """
+    정규화된 인벤토리 프레임을 InventoryRecord 로 하나씩 변환하는 제너레이터.
+
+    Args:
+        frame (pd.DataFrame): COLUMNS 열을 가진 인벤토리 프레임.
+
+    Yields:
+        InventoryRecord: 인벤토리 레코드.
+    """
+    for row in frame[COLUMNS].astype(object).where(frame[COLUMNS].notna(), None).itertuples(index=False):
+        yield InventoryRecord(*row)
+
@@ -0,0 +1,87 @@
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def next_page_marker(body, key, links_seen=False):
+    """
+    OpenStack 목록 응답에서 다음 페이지를 요청할 marker 를 찾는 함수.
+
+    서버는 limit 을 osapi_max_limit 으로 줄여 응답할 수 있으므로, 페이지가 limit 보다 짧다고 마지막 페이지로 보지 않습니다.
+    '{key}_links' 에 rel=next 링크가 있으면 그 marker 를 따르고, 링크를 주는 API 에서 next 링크가 없으면 끝으로 봅니다.
+    링크를 주지 않는 API 는 빈 페이지가 올 때까지 마지막 항목 ID 를 marker 로 이어서 요청합니다.
+
+    Args:
+        body (dict): 목록 응답 JSON.
+        key (str): 목록이 담긴 키 (예: 'servers', 'volumes').
+        links_seen (bool, optional): 이전 페이지에서 '{key}_links' 를 받은 적이 있는지 여부.
+
+    Returns:
+        tuple: (다음 marker, 없으면 None) 와 이번 페이지까지 링크를 받은 적이 있는지 여부.
+    """
+    items = body[key]
+    links = body.get(f'{key}_links')
+    for link in links or []:
+        if link.get('rel') == 'next':
+            marker = parse_qs(urlparse(link.get('href', '')).query).get('marker')
+            return (marker[0] if marker else items[-1]['id']), True
+    links_seen = links_seen or links is not None
+    if links_seen or not items:
+        return None, links_seen
+    return items[-1]['id'], links_seen
+
+
+def iter_openstack_pages(fetch, key, page_size=DEFAULT_PAGE_SIZE, params=None):
+    """
+    OpenStack 스타일(limit/marker) 목록 API 를 페이지 단위로 순회하는 제너레이터.
+    다음 페이지 여부는 next_page_marker 로 판단합니다.
+
+    Args:
+        fetch (callable): 쿼리 파라미터 사전을 받아 응답 JSON 을 반환하는 함수.
+        key (str): 응답에서 목록이 담긴 키 (예: 'servers', 'volumes').
+        page_size (int, optional): 페이지 크기. 기본값은 100.
+        params (dict, optional): 모든 페이지 요청에 붙일 필터 파라미터 (예: {'changes-since': ...}).
+
+    Yields:
+        list: 한 페이지의 항목 리스트.
+    """
+    marker = None
+    links_seen = False
+    while True:
+        page_params = {**(params or {}), 'limit': page_size}
+        if marker:
+            page_params['marker'] = marker
+        body = fetch(page_params)
+        if body[key]:
+            yield body[key]
+        marker, links_seen = next_page_marker(body, key, links_seen)
+        if marker is None:
+            return
+
+
+def iter_ncp_pages(fetch, response_key, list_key, page_size=DEFAULT_PAGE_SIZE, params=None):
+    """
+    NCP(pageNo/pageSize) 목록 API 를 페이지 단위로 순회하는 제너레이터.
+
+    Args:
+        fetch (callable): 쿼리 파라미터 사전을 받아 응답 JSON 을 반환하는 함수.
+        response_key (str): 응답 최상위 키 (예: 'getServerInstanceListResponse').
+        list_key (str): 목록이 담긴 키 (예: 'serverInstanceList').
+        page_size (int, optional): 페이지 크기. 기본값은 100.
+        params (dict, optional): 모든 페이지 요청에 붙일 필터 파라미터 (예: {'regionCode': 'KR'}).
+
+    Yields:
+        list: 한 페이지의 항목 리스트.
+    """
+    page_no = 1
+    fetched = 0
+    while True:
+        response = fetch({**(params or {}), 'pageNo': page_no, 'pageSize': page_size})[response_key]
+        items = response.get(list_key, [])
+        if items:
+            yield items
+        fetched += len(items)
+        total = response.get('totalRows')  # totalRows 가 없는 응답은 짧은 페이지로만 끝을 판단
+        if len(items) < page_size or (total is not None and fetched >= int(total)):
+            return
+        page_no += 1
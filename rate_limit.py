@@ -0,0 +1,86 @@
+import threading
+import time
+
+# CSP 별 기본 호출 한도 (초당 요청 수, 버스트 크기)
+DEFAULT_LIMITS = {
+    'KTC': (10, 20),
+    'NHN': (10, 20),
+    'NCP': (10, 20),
+}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 호출 한도 클래스. 스레드 간에 안전하게 공유됩니다.
+
+    Args:
+        rate (float): 초당 보충되는 토큰 수.
+        burst (int): 버킷 최대 토큰 수.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 할 시간을 반환하는 메서드.
+        스레드에서는 time.sleep, 이벤트 루프에서는 asyncio.sleep 으로 기다리면 됩니다.
+
+        Returns:
+            float: 대기 시간(초). 즉시 사용 가능하면 0.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """
+        토큰을 사용할 수 있을 때까지 현재 스레드를 대기시키는 메서드.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+_buckets = {}
+_lock = threading.Lock()
+
+
+def configure(provider, rate, burst=None):
+    """
+    CSP 의 호출 한도를 변경하는 함수. 이후 모든 수집기가 새 한도를 공유합니다.
+
+    Args:
+        provider (str): CSP 이름 (예: 'KTC', 'NHN', 'NCP').
+        rate (float): 초당 요청 수. None 이면 한도를 두지 않음.
+        burst (int, optional): 버스트 크기. 기본값은 rate 와 같음.
+    """
+    with _lock:
+        DEFAULT_LIMITS[provider] = (rate, burst or rate)
+        _buckets.pop(provider, None)
+
+
+def get_bucket(provider):
+    """
+    CSP 의 공유 토큰 버킷을 반환하는 함수.
+
+    Args:
+        provider (str): CSP 이름.
+
+    Returns:
+        TokenBucket | None: 토큰 버킷. 한도가 없으면 None.
+    """
+    with _lock:
+        if provider not in _buckets:
+            rate, burst = DEFAULT_LIMITS.get(provider, (None, None))
+            _buckets[provider] = TokenBucket(rate, burst) if rate else None
+        return _buckets[provider]
@@ -1,10 +1,28 @@
 import pandas as pd
 import os
 
+from normalize import TEMPLATE_COLUMNS
+from sidecar import read_sidecar, write_sidecar
+
+
+def read_excel_frame(file_path):
+    """
+    인벤토리 엑셀 파일의 데이터 행(5행부터)을 템플릿 열 이름으로 읽어오는 함수.
+
+    Args:
+        file_path (str): 엑셀 파일 경로.
+
+    Returns:
+        pd.DataFrame: TEMPLATE_COLUMNS 열을 가진 DataFrame (모든 열 object).
+    """
+    return pd.read_excel(file_path, index_col=None, header=None, skiprows=4, names=TEMPLATE_COLUMNS, dtype=object)
+
 
 def read_template(filename, customer, userid):
     """
     엑셀 파일에서 고객사별 VM 정보를 읽어오는 함수.
+    엑셀보다 새로운 컬럼형 사이드카가 있으면 엑셀 대신 사이드카를 읽고,
+    없거나 오래되었으면 엑셀을 읽은 뒤 다음 조회를 위해 사이드카를 만들어 둡니다.
 
     Args:
         filename (str): 읽어올 엑셀 파일의 이름.
@@ -19,12 +37,10 @@ def read_template(filename, customer, userid):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
-    df = pd.read_excel(file_path, index_col=None, header=None, skiprows=4,
-                       names=['Zone', 'HostName', 'OS', 'CPU', 'MEM',
-                              'OSDISK[HDD]', 'OSDISK[SSD]', 'SWAP',
-                              'EXTDISK[HDD]', 'EXTDISK[SSD]', 'NAS',
-                              'Mount Point', '공인IP', '사설IP', 'VM생성날짜',
-                              'VM상태'], dtype=object)
+    df = read_sidecar(file_path)
+    if df is None:
+        df = read_excel_frame(file_path)
+        write_sidecar(file_path, df)
     df.insert(0, '고객사', customer)
     return df
 
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import time
+
+import metrics
+from atomic_file import atomic_write
+
+CACHE_DIR = 'files/cache/responses'
+
+# 자주 바뀌지 않는 참조 데이터 엔드포인트별 기본 유효 시간(초)
+DEFAULT_TTLS = {
+    'flavors': 24 * 3600,  # NHN /flavors/detail
+    'publicips': 600,  # KTC nc/IpAddress
+    'network_interfaces': 600,  # NCP getNetworkInterfaceList
+}
+
+
+class ResponseCache:
+    """
+    읽기 위주 엔드포인트의 응답을 계정별로 디스크에 보관하는 선택형 캐시 클래스.
+
+    유효 시간(TTL) 안에서는 API 를 호출하지 않고, 만료 후에는 저장된 ETag 로 If-None-Match 조건부 요청을 보내
+    304 응답이면 저장된 본문을 그대로 재사용합니다.
+
+    Args:
+        ttls (dict, optional): 엔드포인트 이름별 유효 시간(초). DEFAULT_TTLS 를 덮어씁니다.
+        cache_dir (str, optional): 캐시 디렉토리. 기본값은 'files/cache/responses'.
+    """
+
+    def __init__(self, ttls=None, cache_dir=CACHE_DIR):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache_dir = cache_dir
+
+    def _path(self, account, url, params):
+        key = json.dumps([account, url, sorted((params or {}).items())], default=str)
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, path, entry):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with atomic_write(path) as f:
+            json.dump(entry, f)
+
+    def fetch(self, account, endpoint, url, params, send):
+        """
+        캐시를 거쳐 응답 JSON 을 반환하는 메서드.
+
+        Args:
+            account (str): 계정을 구분하는 키 (예: 클라이언트의 token_key).
+            endpoint (str): DEFAULT_TTLS 의 엔드포인트 이름. TTL 이 없으면 캐시하지 않습니다.
+            url (str): 요청 URL.
+            params (dict): 쿼리 파라미터.
+            send (callable): 추가 헤더 사전을 받아 요청을 보내고 requests.Response 를 반환하는 함수.
+
+        Returns:
+            dict: 응답 JSON.
+
+        Raises:
+            Exception: 요청 실패 시 예외를 발생시킵니다.
+        """
+        ttl = self.ttls.get(endpoint)
+        path = self._path(account, url, params)
+        entry = self._load(path) if ttl else None
+        now = time.time()
+        if entry and now - entry['saved_at'] < ttl:
+            return entry['body']
+
+        extra_headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+        response = send(extra_headers)
+        if response.status_code == 304 and entry:
+            entry['saved_at'] = now
+            self._save(path, entry)
+            return entry['body']
+        if response.status_code > 210:
+            raise Exception(f"Failed to get {url}: {response.status_code} - {response.text}")
+
+        body = response.json()
+        metrics.observe_response(response, body)
+        if ttl:
+            self._save(path, {'saved_at': now, 'etag': response.headers.get('ETag'), 'body': body})
+        return body
+
+    def clear(self):
+        """
+        모든 캐시 항목을 삭제하는 메서드.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,163 @@
+import os
+from contextlib import ExitStack
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 가 없으면 사이드카 없이 엑셀만 사용
+    pa = pq = None
+
+from atomic_file import atomic_path
+from normalize import TEMPLATE_COLUMNS
+
+SIDECAR_SUFFIX = '.parquet'
+BATCH_ROWS = 1000  # SidecarWriter 가 한 번에 기록하는 행 수
+INTEGER_COLUMNS = ('CPU', 'MEM')  # excel_writer.record_values 가 정수로 기록하는 열. 나머지는 문자열
+
+
+def sidecar_path(file_path):
+    """
+    인벤토리 엑셀 파일 옆에 두는 컬럼형(Parquet) 사이드카 경로를 반환하는 함수.
+
+    Args:
+        file_path (str): 엑셀 파일 경로 (예: 'files/admin_files/고객사-KTC-inventory-20240101.xlsx').
+
+    Returns:
+        str: 사이드카 경로 (예: 'files/admin_files/고객사-KTC-inventory-20240101.parquet').
+    """
+    return os.path.splitext(file_path)[0] + SIDECAR_SUFFIX
+
+
+def _is_uniform(frame):
+    """
+    모든 열의 값이 한 가지 타입인지 확인하는 헬퍼 함수.
+    섞인 열(예: 정수와 실수)은 Parquet 에서 한 타입으로 바뀌므로 엑셀과 같은 값을 돌려줄 수 없습니다.
+    """
+    return all(len({type(value) for value in frame[column].dropna()}) <= 1 for column in frame.columns)
+
+
+def write_sidecar(file_path, frame):
+    """
+    엑셀 파일과 같은 내용의 사이드카를 저장하는 함수. 임시 파일에 쓴 뒤 교체합니다.
+    pyarrow 가 없거나 값 타입이 섞여 그대로 저장할 수 없으면 저장하지 않고, 대시보드는 엑셀을 읽습니다.
+
+    Args:
+        file_path (str): 엑셀 파일 경로.
+        frame (pd.DataFrame): read_inventory.read_excel_frame 과 같은 열 구성의 프레임 (고객사 열 제외).
+
+    Returns:
+        str | None: 저장한 사이드카 경로. 저장하지 않았으면 None.
+    """
+    if not _is_uniform(frame):
+        return None
+    path = sidecar_path(file_path)
+    try:
+        with atomic_path(path) as tmp_path:
+            frame.to_parquet(tmp_path, engine='pyarrow', index=False)
+    except (ImportError, TypeError, ValueError):
+        return None
+    return path
+
+
+class SidecarWriter:
+    """
+    엑셀에 기록하는 행 값(excel_writer.record_values)을 BATCH_ROWS 행씩 Parquet 사이드카에 이어 쓰는 클래스.
+    한 번에 한 배치만 메모리에 두므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    값이 열 타입(CPU/MEM 정수, 나머지 문자열)과 맞지 않거나 pyarrow 가 없으면 사이드카를 포기하며,
+    이때 read_inventory.read_template 이 처음 읽을 때 엑셀에서 사이드카를 만듭니다.
+
+    Args:
+        file_path (str): 엑셀 파일 경로.
+        batch_rows (int, optional): 한 번에 기록하는 행 수. 기본값은 1000.
+    """
+
+    def __init__(self, file_path, batch_rows=BATCH_ROWS):
+        self.path = sidecar_path(file_path)
+        self.batch_rows = batch_rows
+        self.rows = []
+        self.failed = pq is None
+        self._writer = None
+        self._stack = ExitStack()
+        if pq is not None:
+            self.schema = pa.schema([(column, pa.int64() if column in INTEGER_COLUMNS else pa.string())
+                                     for column in TEMPLATE_COLUMNS])
+
+    def append(self, values):
+        """
+        행 하나를 추가하는 메서드. BATCH_ROWS 행이 모이면 파일에 기록합니다.
+
+        Args:
+            values (list): TEMPLATE_COLUMNS 순서의 값 리스트.
+        """
+        if self.failed:
+            return
+        self.rows.append(values)
+        if len(self.rows) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        """
+        모아 둔 행을 한 배치로 기록하는 헬퍼 메서드.
+        """
+        try:
+            if self._writer is None:
+                tmp_path = self._stack.enter_context(atomic_path(self.path))
+                self._writer = pq.ParquetWriter(tmp_path, self.schema)
+            columns = list(zip(*self.rows)) or [()] * len(TEMPLATE_COLUMNS)
+            self._writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)], schema=self.schema))
+        except (TypeError, ValueError, pa.ArrowException):
+            self.abort()
+        self.rows = []
+
+    def close(self):
+        """
+        남은 행을 기록하고 사이드카를 완성하는 메서드. 엑셀 저장이 끝난 뒤 호출해야 사이드카가 더 새로운 파일이 됩니다.
+
+        Returns:
+            str | None: 저장한 사이드카 경로. 포기했으면 None.
+        """
+        if not self.failed:
+            self._flush()
+        if self.failed:
+            return None
+        self._writer.close()
+        self._stack.close()
+        return self.path
+
+    def abort(self):
+        """
+        기록 중인 임시 파일을 지우고 사이드카를 포기하는 메서드.
+        """
+        self.failed = True
+        self.rows = []
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        aborted = RuntimeError('사이드카 기록 취소')
+        self._stack.__exit__(type(aborted), aborted, None)
+
+
+def read_sidecar(file_path):
+    """
+    엑셀 파일보다 새로운 사이드카가 있으면 읽어 오는 함수.
+
+    Args:
+        file_path (str): 엑셀 파일 경로.
+
+    Returns:
+        pd.DataFrame | None: 엑셀을 읽은 것과 같은 프레임 (모든 열 object, 빈 값 NaN). 없거나 오래되었으면 None.
+    """
+    if pq is None:
+        return None
+    path = sidecar_path(file_path)
+    try:
+        if os.stat(path).st_mtime_ns < os.stat(file_path).st_mtime_ns:
+            return None
+        # 빈 값이 있는 정수 열도 실수가 아닌 정수로 돌려받아 엑셀을 읽은 값과 같게 함
+        frame = pq.read_table(path).to_pandas(integer_object_nulls=True).astype(object)
+    except (OSError, ValueError):
+        return None
+    return frame.where(frame.notna(), np.nan)
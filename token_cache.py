@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+from atomic_file import atomic_write
+
+TOKEN_DIR = 'files/cache/tokens'
+EXPIRY_MARGIN = 60  # 만료 직전 토큰 사용을 피하기 위한 여유 시간(초)
+DEFAULT_LIFETIME = 3600  # 응답에 만료 시각이 없을 때 사용할 토큰 수명(초)
+
+
+def cache_key(*parts):
+    """
+    인증 정보와 엔드포인트로 토큰 저장소 키를 만드는 함수. 평문 자격 증명은 파일 이름에 남지 않습니다.
+
+    Args:
+        *parts (str): 엔드포인트, 사용자 이름, 비밀번호 등 토큰을 구분하는 값.
+
+    Returns:
+        str: SHA-256 해시 문자열.
+    """
+    return hashlib.sha256('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def parse_expiry(value):
+    """
+    인증 서비스가 반환한 만료 시각을 epoch 초로 변환하는 함수.
+
+    Args:
+        value (str): ISO 8601 만료 시각 (예: '2024-01-01T00:00:00.000000Z', '2024-01-01T00:00:00Z').
+
+    Returns:
+        float: 만료 시각(epoch 초). 값이 없거나 해석할 수 없으면 현재 시각 + DEFAULT_LIFETIME.
+    """
+    if value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    return time.time() + DEFAULT_LIFETIME
+
+
+def _path(key):
+    return os.path.join(TOKEN_DIR, f'{key}.json')
+
+
+def load(key):
+    """
+    저장된 유효한 토큰을 반환하는 함수.
+
+    Args:
+        key (str): cache_key 로 만든 키.
+
+    Returns:
+        dict | None: {'token', 'expires_at', ...} 사전. 없거나 곧 만료되면 None.
+    """
+    try:
+        with open(_path(key), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('expires_at', 0) - EXPIRY_MARGIN <= time.time():
+        return None
+    return entry
+
+
+def save(key, entry):
+    """
+    토큰을 저장하는 함수. 소유자만 읽을 수 있는 임시 파일에 쓴 뒤 교체하므로
+    여러 프로세스나 스레드가 동시에 저장해도 깨진 파일을 읽지 않습니다.
+
+    Args:
+        key (str): cache_key 로 만든 키.
+        entry (dict): {'token', 'expires_at', ...} 사전.
+    """
+    os.makedirs(TOKEN_DIR, exist_ok=True)
+    with atomic_write(_path(key), private=True) as f:
+        json.dump(entry, f)
+
+
+def invalidate(key):
+    """
+    저장된 토큰을 삭제하는 함수. 토큰이 거부(401)되었을 때 사용합니다.
+
+    Args:
+        key (str): cache_key 로 만든 키.
+    """
+    try:
+        os.remove(_path(key))
+    except FileNotFoundError:
+        pass